@@ -0,0 +1,89 @@
+# backend/benchmarks/bench_agent_prompt.py
+"""
+Model the agent's input tokens over a game: the old layout (box board fetched with a tool call,
+so every turn is two requests) against the compact board sent at the end of the turn message.
+Also reports how much of each request is the stable instructions + tools prefix.
+
+This is a token-count model, not a measurement: it tokenizes the prompts each layout would send
+(a scripted game with stand-in replies) and calls no LLM, so it says nothing about latency or
+whether a provider's prompt cache actually hits.
+
+  uv run python -m benchmarks.bench_agent_prompt --moves 4
+"""
+
+import argparse
+import json
+
+from src.tic_tac_toe.agent import PROMPT, create_board_tool
+from src.tic_tac_toe.agent_pool import AgentBinding
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import Player
+
+try:
+  import tiktoken
+
+  _encoding = tiktoken.get_encoding("o200k_base")
+
+  def count_tokens(text: str) -> int:
+    return len(_encoding.encode(text))
+except ImportError:  # Rough estimate: ~4 bytes per token (box-drawing characters are 3 bytes)
+
+  def count_tokens(text: str) -> int:
+    return -(-len(text.encode()) // 4)
+
+
+HUMAN_MOVES = (4, 0, 2, 3, 7)
+AGENT_MOVES = (8, 6, 5, 1)
+REPLY = "Oh, adorable, meat bag. Watch a superior intellect work."  # Stand-in commentary
+CALL_OVERHEAD = 20  # Tokens for a tool call and its result framing
+
+
+def prefix_tokens(board_format: str) -> int:
+  tools = [create_board_tool(AgentBinding("sid", TicTacToe()), board_format).__doc__]
+  return count_tokens(PROMPT) + count_tokens(json.dumps(tools))
+
+
+def game_input_tokens(board_format: str, moves: int) -> tuple[int, int, int]:
+  """Input tokens, requests and prefix tokens per request over `moves` human moves."""
+  game = TicTacToe()
+  prefix = prefix_tokens(board_format)
+  history = 0
+  total = requests = 0
+  for human, agent in zip(HUMAN_MOVES[:moves], AGENT_MOVES):
+    game.make_move(Player.O, human)
+    message = f"The user has placed their marker at position {human}."
+    if board_format == "compact":
+      history += count_tokens(f"{message}\nBoard:\n{game.get_board_compact()}\nYour turn!")
+    else:
+      # First request ends in a get_board_string call; the second re-sends it with the result
+      history += count_tokens(f"{message} Your turn!")
+      total += prefix + history
+      requests += 1
+      history += CALL_OVERHEAD + count_tokens(game.get_board_string())
+    total += prefix + history
+    requests += 1
+    history += count_tokens(REPLY) + CALL_OVERHEAD
+    game.make_move(Player.X, agent)
+  return total, requests, prefix
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--moves", type=int, default=4, help="Human moves to simulate (1-5)")
+  args = parser.parse_args()
+
+  counter = "tiktoken o200k_base" if "tiktoken" in globals() else "bytes/4 estimate"
+  print(f"Token model of {args.moves} human moves (no LLM calls), counted by {counter}")
+  baseline = None
+  for board_format in ("box", "compact"):
+    total, requests, prefix = game_input_tokens(board_format, args.moves)
+    baseline = baseline or total
+    print(
+      f"{board_format:>8}: {total:,} input tokens over {requests} requests "
+      f"({total / baseline:.0%}), "
+      f"cacheable prefix {prefix} tokens/request ({prefix * requests / total:.0%} of input)"
+    )
+
+
+if __name__ == "__main__":
+  main()
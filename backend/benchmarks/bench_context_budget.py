@@ -0,0 +1,83 @@
+# backend/benchmarks/bench_context_budget.py
+"""
+Grow one session's agent thread over many games (three moves and a post-game question each) and
+compare the prompt the agent's last turn of each game re-sends, with an unbounded thread and with
+the context budget. TTFT is modelled as a fixed latency plus prefill of the uncached input.
+
+  uv run python -m benchmarks.bench_context_budget --games 50 --prefill-rate 2000
+"""
+
+import argparse
+import asyncio
+
+from agent_framework import AgentThread, ChatMessage
+
+from benchmarks.bench_agent_prompt import REPLY, count_tokens, prefix_tokens
+from src.tic_tac_toe.context_budget import ContextBudget
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import Player
+
+HUMAN_MOVES = (4, 8, 6)
+AGENT_MOVES = (0, 1, 2)  # X wins on its third move
+QUESTION = "How did you beat me that time?"
+
+
+def thread_tokens(thread: AgentThread) -> int:
+  return sum(count_tokens(message.text) for message in thread.message_store.messages)
+
+
+async def play_games(games: int, budget: ContextBudget | None) -> list[int]:
+  """Prompt tokens of the last agent turn of each game."""
+  thread = AgentThread()
+  prompts = []
+  for _ in range(games):
+    game = TicTacToe()
+    for human, agent in zip(HUMAN_MOVES, AGENT_MOVES):
+      game.make_move(Player.O, human)
+      message = (
+        f"The user has placed their marker at position {human}.\n"
+        f"Board:\n{game.get_board_compact()}\nYour turn!"
+      )
+      if budget:
+        await budget.trim(thread)
+      await thread.on_new_messages(ChatMessage(role="user", text=message))
+      last_prompt = thread_tokens(thread)
+      game.make_move(Player.X, agent)
+      reply = f"{REPLY} agent_make_move(position={agent}) -> {game.get_board_compact()}"
+      await thread.on_new_messages(ChatMessage(role="assistant", text=reply))
+    prompts.append(last_prompt)
+    await thread.on_new_messages(
+      [ChatMessage(role="user", text=QUESTION), ChatMessage(role="assistant", text=REPLY)]
+    )
+    if budget:
+      await budget.close_game(thread, game)
+  return prompts
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--games", type=int, default=50, help="Games played in the session")
+  parser.add_argument("--exchanges", type=int, default=8, help="Exchanges kept verbatim")
+  parser.add_argument("--summaries", type=int, default=5, help="Game summaries kept")
+  parser.add_argument("--prefill-rate", type=float, default=2_000, help="Input tokens/second")
+  parser.add_argument("--base-ttft-ms", type=float, default=200, help="TTFT of an empty prompt")
+  args = parser.parse_args()
+
+  prefix = prefix_tokens("compact")  # Instructions and tools, served from the prompt cache
+
+  def ttft_ms(tokens: int) -> float:
+    return args.base_ttft_ms + tokens * 1000 / args.prefill_rate
+
+  unbounded = asyncio.run(play_games(args.games, None))
+  bounded = asyncio.run(play_games(args.games, ContextBudget(args.exchanges, args.summaries)))
+  print(f"prompt tokens of each game's last agent turn (+{prefix} cached prefix tokens)")
+  print(f"{'game':>6} {'unbounded':>10} {'TTFT':>9} {'budget':>8} {'TTFT':>9}")
+  for game in sorted({1, 2, 5, 10, 25, 50, 100, args.games}):
+    if game > args.games:
+      continue
+    full, kept = unbounded[game - 1], bounded[game - 1]
+    print(f"{game:>6} {full:>10,} {ttft_ms(full):>7,.0f}ms {kept:>8,} {ttft_ms(kept):>7,.0f}ms")
+
+
+if __name__ == "__main__":
+  main()
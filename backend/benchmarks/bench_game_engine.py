@@ -0,0 +1,72 @@
+# backend/benchmarks/bench_game_engine.py
+"""
+Compare the list and bitboard game engines on random games, timing each move as the manager does.
+
+  uv run python -m benchmarks.bench_game_engine --games 20000
+"""
+
+import argparse
+import random
+import time
+
+from src.tic_tac_toe.bitboard import GAME_ENGINES
+from src.tic_tac_toe.models import GameStatus
+
+
+def _random_games(games: int, seed: int) -> list[list[int]]:
+  """Move orders for random games; each game is played until it ends."""
+  rng = random.Random(seed)
+  orders = []
+  for _ in range(games):
+    order = list(range(9))
+    rng.shuffle(order)
+    orders.append(order)
+  return orders
+
+
+def play(engine: type, orders: list[list[int]]) -> tuple[int, float]:
+  moves = 0
+  started = time.perf_counter()
+  for order in orders:
+    game = engine()
+    for position in order:
+      game.make_move(game.current_player, position)
+      moves += 1
+      # The manager checks the status again after every move
+      if game.get_game_status()[0] != GameStatus.ONGOING:
+        break
+  return moves, time.perf_counter() - started
+
+
+def status_checks(engine: type, order: list[int], calls: int) -> float:
+  """Time `get_game_status` alone on a board with four moves played."""
+  game = engine()
+  for position in order[:4]:
+    game.make_move(game.current_player, position)
+  started = time.perf_counter()
+  for _ in range(calls):
+    game.get_game_status()
+  return time.perf_counter() - started
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--games", type=int, default=20_000, help="Random games per engine")
+  parser.add_argument("--seed", type=int, default=7, help="Seed for the move orders")
+  args = parser.parse_args()
+
+  orders = _random_games(args.games, args.seed)
+  baseline = None
+  for name, engine in GAME_ENGINES.items():
+    moves, elapsed = play(engine, orders)
+    per_move = elapsed * 1e6 / moves
+    baseline = baseline or per_move
+    status_ns = status_checks(engine, orders[0], 100_000) * 1e9 / 100_000
+    print(
+      f"{name:>9}: {moves} moves, {per_move:.2f} µs/move ({baseline / per_move:.2f}x), "
+      f"get_game_status {status_ns:,.0f} ns"
+    )
+
+
+if __name__ == "__main__":
+  main()
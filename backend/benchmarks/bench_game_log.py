@@ -0,0 +1,82 @@
+# backend/benchmarks/bench_game_log.py
+"""
+Compare per-game memory of the game log: pydantic records, slotted records and the packed GameLog.
+
+  uv run python -m benchmarks.bench_game_log --failures 100
+"""
+
+import argparse
+import sys
+import time
+
+from src.tic_tac_toe.game_log import GameLog
+from src.tic_tac_toe.models import GameLogRecord, MoveRecord, Player
+
+# A drawn game: nine successful moves
+DRAW = (0, 4, 8, 1, 7, 6, 2, 5, 3)
+
+
+def _attempts(failures: int) -> list[tuple[int, Player, int, bool]]:
+  """Every move of a drawn game, with `failures` rejected moves spread through it."""
+  attempts = []
+  for turn, position in enumerate(DRAW, start=1):
+    player = Player.O if turn % 2 else Player.X
+    attempts.extend((turn, player, -1, False) for _ in range(failures // len(DRAW)))
+    attempts.append((turn, player, position, True))
+  return attempts
+
+
+def deep_size(log) -> int:
+  """List plus records (and their per-instance dicts) as held by a game; enums are shared."""
+  if isinstance(log, GameLog):
+    return sys.getsizeof(log) + sum(
+      sys.getsizeof(buffer) for buffer in (log._events, log._moves, log._snapshots)
+    )
+  size = sys.getsizeof(log)
+  for record in log:
+    size += sys.getsizeof(record)
+    if hasattr(record, "__dict__"):
+      size += sys.getsizeof(record.__dict__)
+    if hasattr(record, "__pydantic_fields_set__"):
+      size += sys.getsizeof(record.__pydantic_fields_set__)
+  return size
+
+
+def build(variant: str, attempts: list) -> object:
+  if variant == "pydantic":
+    return [
+      GameLogRecord(turn=turn, player=player, position=position, success=success)
+      for turn, player, position, success in attempts
+    ]
+  if variant == "slotted":
+    return [MoveRecord(*attempt) for attempt in attempts]
+  log = GameLog(max_failures=len(attempts))
+  for attempt in attempts:
+    log.record(*attempt)
+  return log
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--failures", type=int, default=0, help="Rejected moves per game")
+  parser.add_argument("--replays", type=int, default=100_000, help="Replays to time")
+  args = parser.parse_args()
+
+  attempts = _attempts(args.failures)
+  print(f"{len(attempts)} logged moves per game")
+  baseline = None
+  for variant in ("pydantic", "slotted", "packed"):
+    size = deep_size(build(variant, attempts))
+    baseline = baseline or size
+    print(f"{variant:>9}: {size:>7,} bytes/game ({baseline / size:.1f}x smaller)")
+
+  log = build("packed", attempts)
+  started = time.perf_counter()
+  for i in range(args.replays):
+    log.replay(i % 10)
+  elapsed = time.perf_counter() - started
+  print(f"   replay: {elapsed * 1e9 / args.replays:,.0f} ns per replay(upto_turn)")
+
+
+if __name__ == "__main__":
+  main()
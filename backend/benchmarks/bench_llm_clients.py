@@ -0,0 +1,75 @@
+# backend/benchmarks/bench_llm_clients.py
+"""
+Simulate game sessions that each make one LLM request against a local stand-in HTTP server,
+comparing a new OpenAIResponsesClient per session (the old behaviour) with the shared registry.
+
+  uv run python -m benchmarks.bench_llm_clients --sessions 1000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from agent_framework.openai import OpenAIResponsesClient
+
+from src.utils.llm_clients import LLMClientRegistry
+from tests.fixtures.http_stub import StubHTTPServer
+
+
+async def _run_sessions(sessions: int, concurrency: int, get_client) -> float:
+  semaphore = asyncio.Semaphore(concurrency)
+
+  async def session() -> None:
+    async with semaphore:
+      client = get_client()
+      await client.client.models.list()
+
+  started = time.perf_counter()
+  await asyncio.gather(*(session() for _ in range(sessions)))
+  return time.perf_counter() - started
+
+
+async def per_session_clients(sessions: int, concurrency: int) -> tuple[int, float]:
+  async with StubHTTPServer() as server:
+    clients = []
+
+    def new_client() -> OpenAIResponsesClient:
+      client = OpenAIResponsesClient(base_url=server.base_url, model_id="bench", api_key="key")
+      clients.append(client)  # Sessions keep their client alive for the whole game
+      return client
+
+    elapsed = await _run_sessions(sessions, concurrency, new_client)
+    connections = server.connections
+    for client in clients:
+      await client.client.close()
+  return connections, elapsed
+
+
+async def shared_registry(sessions: int, concurrency: int) -> tuple[int, float]:
+  async with StubHTTPServer() as server:
+    registry = LLMClientRegistry(max_connections=concurrency, max_keepalive_connections=concurrency)
+    await registry.warm_up(registry.get(server.base_url, "bench", "key"), connections=concurrency)
+    elapsed = await _run_sessions(
+      sessions, concurrency, lambda: registry.get(server.base_url, "bench", "key")
+    )
+    connections = server.connections
+    await registry.aclose()
+  return connections, elapsed
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--sessions", type=int, default=1000, help="Simulated game sessions")
+  parser.add_argument("--concurrency", type=int, default=50, help="Sessions in flight at once")
+  args = parser.parse_args()
+
+  for name, scenario in (("per-session", per_session_clients), ("registry", shared_registry)):
+    connections, elapsed = asyncio.run(scenario(args.sessions, args.concurrency))
+    print(
+      f"{name:>12}: {connections:>5} TCP connections for {args.sessions} sessions, "
+      f"{elapsed * 1000 / args.sessions:.3f} ms/session"
+    )
+
+
+if __name__ == "__main__":
+  main()
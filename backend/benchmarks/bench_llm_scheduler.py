@@ -0,0 +1,121 @@
+# backend/benchmarks/bench_llm_scheduler.py
+"""
+Overload a local stand-in LLM provider with agent turns and post-game questions from many
+sessions, comparing unbounded concurrency with the LLM scheduler's admission control.
+
+  uv run python -m benchmarks.bench_llm_scheduler --capacity 20 --overload 1.5 --duration 5
+
+Runs stream from the stand-in LLM server (tests/fixtures/llm_stub.py) through the OpenAI SDK. It
+serves `capacity` streams at full speed; past that, streams share it and slow down, and past
+twice that it answers 429, which the SDK retries with exponential backoff. Each request costs this
+process ~10 ms of SDK parsing, so keep the offered rate (overload * capacity / latency) under ~50/s.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from contextlib import nullcontext
+
+from openai import APIStatusError, AsyncOpenAI
+
+from src.utils.llm_scheduler import QUERY, TURN, LLMScheduler
+from tests.fixtures.llm_stub import StubLLMServer
+
+MAX_RETRIES = 2  # The OpenAI SDK's default
+TURNS = [[("text", "Nice try, meat bag.")]]
+
+
+async def _request(client: AsyncOpenAI) -> bool:
+  try:
+    stream = await client.responses.create(model="stand-in", input="Your turn!", stream=True)
+    async for _ in stream:
+      pass
+  except APIStatusError:
+    return False
+  return True
+
+
+def _percentile(values: list[float], q: float) -> float:
+  values = sorted(values)
+  return values[min(len(values) - 1, int(q * len(values)))] if values else float("nan")
+
+
+async def run_load(
+  scheduler: LLMScheduler | None,
+  capacity: int,
+  latency: float,
+  overload: float,
+  turn_share: float,
+  sessions: int,
+  duration: float,
+) -> dict[str, tuple[list[float], int]]:
+  """Offer `overload` x the provider's capacity for `duration`s; latencies and failures by kind."""
+  random.seed(0)
+  results = {"turn": ([], 0), "query": ([], 0)}
+  rate = overload * capacity / latency
+
+  async def one(client: AsyncOpenAI, kind: str, sid: str) -> None:
+    started = time.perf_counter()
+    priority = TURN if kind == "turn" else QUERY
+    admission = scheduler.slot(sid, priority) if scheduler is not None else nullcontext()
+    async with admission:
+      ok = await _request(client)
+    latencies, failures = results[kind]
+    if ok:
+      latencies.append(time.perf_counter() - started)
+    else:
+      results[kind] = (latencies, failures + 1)
+
+  # One short reply after `latency` (stretched past capacity), so parsing long streams in this
+  # process doesn't crowd out the load being measured
+  async with StubLLMServer(TURNS, ttft=latency, capacity=capacity) as server:
+    client = AsyncOpenAI(base_url=server.base_url, api_key="unused", max_retries=MAX_RETRIES)
+    tasks = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+      kind = "turn" if random.random() < turn_share else "query"
+      tasks.append(asyncio.create_task(one(client, kind, f"sid-{random.randrange(sessions)}")))
+      await asyncio.sleep(random.expovariate(rate))
+    await asyncio.gather(*tasks)
+    await client.close()
+  return results
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--capacity", type=int, default=20, help="Runs the provider serves at once")
+  parser.add_argument("--latency", type=float, default=1.0, help="Seconds per run at capacity")
+  parser.add_argument("--overload", type=float, default=1.5, help="Offered load / capacity")
+  parser.add_argument(
+    "--turn-share", type=float, default=0.5, help="Fraction of runs that are turns"
+  )
+  parser.add_argument("--sessions", type=int, default=200, help="Sessions the runs come from")
+  parser.add_argument("--duration", type=float, default=5.0, help="Seconds of offered load")
+  args = parser.parse_args()
+
+  for name, scheduler in (
+    ("unbounded", None),
+    ("scheduler", LLMScheduler(max_concurrency=args.capacity)),
+  ):
+    results = asyncio.run(
+      run_load(
+        scheduler,
+        args.capacity,
+        args.latency,
+        args.overload,
+        args.turn_share,
+        args.sessions,
+        args.duration,
+      )
+    )
+    for kind, (latencies, failures) in results.items():
+      print(
+        f"{name:>10} {kind:>5}: {len(latencies):>5} done, {failures:>4} failed, "
+        f"p50 {_percentile(latencies, 0.5) * 1000:>7.0f} ms, "
+        f"p99 {_percentile(latencies, 0.99) * 1000:>7.0f} ms"
+      )
+
+
+if __name__ == "__main__":
+  main()
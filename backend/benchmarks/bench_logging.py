@@ -0,0 +1,77 @@
+# backend/benchmarks/bench_logging.py
+"""
+Measure the event-loop time one game spends on logging: the old per-token print() calls against
+queued, level-gated logging with the stream-token log off, sampled out, and fully on.
+
+  uv run python -m benchmarks.bench_logging --games 50 --turns 4
+
+Output goes to a line-buffered temporary file, like stdout on a terminal.
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+
+from src.utils.log import configure_logging, shutdown_logging, stream_log, stream_log_enabled
+from tests.fixtures.message_stream_01 import streaming_response
+
+log = logging.getLogger("src.tic_tac_toe.manager")
+
+
+def game_with_print(turns: int, output) -> None:
+  for turn in range(turns):
+    print(f"Taking O move at position: {turn}", file=output)
+    print(f"🔧 Move result: {{'success': True, 'position': {turn}}}", file=output)
+    print("Executing agent turn...", file=output)
+    for update_dict in streaming_response:
+      print(f"Agent stream token: {update_dict}", file=output)
+    print(f"Taking X move at position: {turn + 1}", file=output)
+
+
+def game_with_logging(turns: int, sid: str) -> None:
+  for turn in range(turns):
+    log.debug("Taking O move at position %d", turn)
+    log.debug("Human move: %s", {"success": True, "position": turn}, extra={"sid": sid})
+    log.debug("Executing agent turn", extra={"sid": sid})
+    for update_dict in streaming_response:
+      if stream_log_enabled(sid):
+        stream_log.debug("Agent stream token: %s", update_dict, extra={"sid": sid})
+    log.debug("Taking X move at position %d", turn + 1)
+
+
+def _time_games(games: int, play) -> float:
+  started = time.perf_counter()
+  for game in range(games):
+    play(f"sid-{game}")
+  return (time.perf_counter() - started) / games
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--games", type=int, default=50, help="Games per scenario")
+  parser.add_argument("--turns", type=int, default=4, help="Agent turns per game")
+  args = parser.parse_args()
+  root = logging.getLogger()
+  saved = root.handlers[:], root.level
+
+  with tempfile.TemporaryFile("w", buffering=1) as output:
+    baseline = _time_games(args.games, lambda sid: game_with_print(args.turns, output))
+    print(f"{'print()':>24}: {baseline * 1000:8.3f} ms/game")
+    for name, levels, rate in (
+      ("logging, debug off", "", 1.0),
+      ("logging, sampled out", "src.stream=DEBUG", 0.0),
+      ("logging, all tokens", "src.stream=DEBUG", 1.0),
+    ):
+      configure_logging("INFO", levels, stream_sample_rate=rate, stream=output)
+      per_game = _time_games(args.games, lambda sid: game_with_logging(args.turns, sid))
+      shutdown_logging()
+      logging.getLogger("src.stream").setLevel(logging.NOTSET)
+      print(
+        f"{name:>24}: {per_game * 1000:8.3f} ms/game ({(baseline - per_game) * 1000:+.3f} ms saved)"
+      )
+  root.handlers, root.level = saved
+
+
+if __name__ == "__main__":
+  main()
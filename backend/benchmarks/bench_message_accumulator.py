@@ -0,0 +1,62 @@
+# backend/benchmarks/bench_message_accumulator.py
+"""
+Measure MessageAccumulator throughput (updates per second) on the recorded fixture stream and on
+synthetic streams of growing length, to show per-update cost stays flat as messages get longer.
+
+  uv run python -m benchmarks.bench_message_accumulator --rounds 500
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.utils.message_accumulator import handle_update_message
+from tests.fixtures.message_stream_01 import streaming_response
+
+
+async def _stream(updates):
+  for update in updates:
+    yield update
+
+
+async def _drain(updates) -> int:
+  count = 0
+  async for _ in handle_update_message(_stream(updates)):
+    count += 1
+  return count
+
+
+def _synthetic_stream(deltas: int) -> list[dict]:
+  """One long text message followed by a function call whose arguments arrive in deltas."""
+  text = [{"contents": [{"type": "text", "text": " word"}]} for _ in range(deltas)]
+  call = [{"contents": [{"type": "function_call", "call_id": "c1", "arguments": '{"position": '}]}]
+  call += [{"contents": [{"type": "function_call", "call_id": "c1", "arguments": "4}"}]}]
+  return text + call
+
+
+def _updates_per_second(updates: list[dict], rounds: int) -> float:
+  async def run() -> None:
+    for _ in range(rounds):
+      await _drain(updates)
+
+  started = time.perf_counter()
+  asyncio.run(run())
+  return rounds * len(updates) / (time.perf_counter() - started)
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--rounds", type=int, default=500, help="Replays of the fixture stream")
+  args = parser.parse_args()
+
+  print(f"fixture ({len(streaming_response)} updates): ", end="")
+  print(f"{_updates_per_second(streaming_response, args.rounds):,.0f} updates/s")
+
+  for deltas in (1_000, 10_000, 100_000):
+    updates = _synthetic_stream(deltas)
+    rounds = max(1, 200_000 // deltas)
+    print(f"synthetic ({deltas:,} deltas): {_updates_per_second(updates, rounds):,.0f} updates/s")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,125 @@
+# backend/benchmarks/bench_metrics.py
+"""
+Measure what the realtime metrics cost a turn: full games played through the manager with a
+scripted agent replaying a recorded stream, with metric updates on and patched to no-ops.
+
+  uv run python -m benchmarks.bench_metrics --games 200 --rounds 5
+
+The end-to-end difference is within run-to-run noise, so the overhead is also estimated from the
+metric updates per move times the cost of one. The scripted agent answers instantly, so the turn
+time here is the server's own work only; the estimate is also shown against a turn that waits
+`--llm-seconds` on a real model.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import timeit
+from contextlib import contextmanager
+from functools import partial
+
+from src.tic_tac_toe.models import GameStatus
+from src.utils.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from tests.fixtures.agent_stub import ScriptedAgent
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.message_stream_01 import streaming_response
+
+METHODS = [(Counter, "inc"), (Gauge, "inc"), (Gauge, "dec"), (Gauge, "set"), (Histogram, "observe")]
+
+
+@contextmanager
+def patched_metrics(replace):
+  """Replace every metric update method with `replace(method)` for the duration."""
+  saved = [(cls, name, getattr(cls, name)) for cls, name in METHODS]
+  for cls, name, method in saved:
+    setattr(cls, name, replace(method))
+  try:
+    yield
+  finally:
+    for cls, name, method in saved:
+      setattr(cls, name, method)
+
+
+def _noop(method):
+  return lambda self, value=1.0: None
+
+
+async def play_games(games: int) -> tuple[float, int]:
+  """Seconds spent handling human moves (and the agent's replies), and the number of moves."""
+  manager, _ = make_manager(partial(ScriptedAgent, stream=streaming_response), speculation_top_k=0)
+  elapsed, moves = 0.0, 0
+  for game in range(games):
+    sid = f"sid-{game}"
+    await manager.handle_connect(sid, {})
+    game_session = manager.game_sessions[sid]
+    while game_session.game.status == GameStatus.ONGOING:
+      position = game_session.game.get_board().index(None)
+      started = time.perf_counter()
+      await manager.handle_user_move(sid, {"position": position})
+      elapsed += time.perf_counter() - started
+      moves += 1
+    await manager.handle_disconnect(sid)
+  return elapsed, moves
+
+
+def count_updates(games: int) -> float:
+  """Metric updates per human move."""
+  calls = 0
+
+  def counting(method):
+    def update(self, *args):
+      nonlocal calls
+      calls += 1
+      return method(self, *args)
+
+    return update
+
+  with patched_metrics(counting):
+    _, moves = asyncio.run(play_games(games))
+  return calls / moves
+
+
+def update_cost() -> float:
+  """Seconds per metric update: the slower of a counter increment and a histogram observation."""
+  registry = MetricsRegistry()
+  counter, histogram = registry.counter("c"), registry.histogram("h")
+  number = 200_000
+  return max(
+    min(timeit.repeat(counter.inc, number=number, repeat=5)) / number,
+    min(timeit.repeat(lambda: histogram.observe(0.042), number=number, repeat=5)) / number,
+  )
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--games", type=int, default=200, help="Games per round")
+  parser.add_argument("--rounds", type=int, default=5, help="Rounds per scenario (best is kept)")
+  parser.add_argument("--llm-seconds", type=float, default=1.0, help="Model time of a real turn")
+  args = parser.parse_args()
+  logging.disable(logging.INFO)
+
+  best = {"metrics off": float("inf"), "metrics on": float("inf")}
+  for _ in range(args.rounds):
+    for name in best:  # Alternate scenarios so drift affects both alike
+      if name == "metrics off":
+        with patched_metrics(_noop):
+          elapsed, moves = asyncio.run(play_games(args.games))
+      else:
+        elapsed, moves = asyncio.run(play_games(args.games))
+      best[name] = min(best[name], elapsed / moves)
+
+  baseline = best["metrics off"]
+  for name, per_move in best.items():
+    print(f"{name:>12}: {per_move * 1e6:9.1f} us/move")
+  updates = count_updates(args.games)
+  estimate = updates * update_cost()
+  print(
+    f"{'overhead':>12}: {estimate * 1e6:9.1f} us/move "
+    f"({updates:.0f} updates, {estimate / baseline:.3%} of server work, "
+    f"{estimate / (baseline + args.llm_seconds):.4%} with {args.llm_seconds:g}s of model time)"
+  )
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,88 @@
+# backend/benchmarks/bench_move_results.py
+"""
+Compare pydantic move results and log records with the slotted MoveResult/MoveRecord types.
+
+  uv run python -m benchmarks.bench_move_results --moves 200000
+"""
+
+import argparse
+import time
+
+from src.tic_tac_toe.models import (
+  BoardUpdateResult,
+  GameLogRecord,
+  GameStatus,
+  MoveRecord,
+  MoveResult,
+  Player,
+)
+
+BOARD = [Player.O, None, Player.X, None, Player.O, None, None, None, Player.X]
+
+
+def pydantic_move(turn: int) -> dict:
+  """What a move cost before: a validated log record and result, dumped once per emit."""
+  GameLogRecord(turn=turn, player=Player.X, position=2, success=True)
+  result = BoardUpdateResult(
+    success=True, message="Move successful.", board_state=list(BOARD), status=GameStatus.ONGOING
+  )
+  # AI_TOOL_EXECUTED, the tool return value and GAME_OVER_RESULT each dumped the result
+  result.model_dump(mode="json")
+  result.model_dump(mode="json")
+  return result.model_dump(mode="json")
+
+
+def slotted_move(turn: int) -> dict:
+  MoveRecord(turn, Player.X, 2, True)
+  result = MoveResult(True, "Move successful.", list(BOARD), GameStatus.ONGOING)
+  result.to_json()
+  result.to_json()
+  return result.to_json()
+
+
+def run(move, moves: int) -> float:
+  started = time.perf_counter()
+  for turn in range(moves):
+    move(turn)
+  return time.perf_counter() - started
+
+
+def serialize(results: list, dump) -> float:
+  started = time.perf_counter()
+  for result in results:
+    dump(result)
+  return time.perf_counter() - started
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--moves", type=int, default=200_000, help="Moves per variant")
+  args = parser.parse_args()
+
+  baseline = None
+  for name, move in (("pydantic", pydantic_move), ("slotted", slotted_move)):
+    elapsed = run(move, args.moves)
+    baseline = baseline or elapsed
+    print(
+      f"{name:>9}: {args.moves / elapsed:,.0f} moves/s, {elapsed * 1e6 / args.moves:.2f} µs/move "
+      f"({baseline / elapsed:.2f}x)"
+    )
+
+  model = BoardUpdateResult(
+    success=True, message="Move successful.", board_state=list(BOARD), status=GameStatus.ONGOING
+  )
+  dump = serialize([model] * args.moves, lambda result: result.model_dump(mode="json"))
+  fresh = [
+    MoveResult(True, "Move successful.", list(BOARD), GameStatus.ONGOING) for _ in range(args.moves)
+  ]
+  first = serialize(fresh, MoveResult.to_json)
+  cached = serialize(fresh, MoveResult.to_json)
+  print(
+    f"serialize: model_dump(mode='json') {dump * 1e9 / args.moves:,.0f} ns, "
+    f"to_json {first * 1e9 / args.moves:,.0f} ns (first call), "
+    f"{cached * 1e9 / args.moves:,.0f} ns (cached)"
+  )
+
+
+if __name__ == "__main__":
+  main()
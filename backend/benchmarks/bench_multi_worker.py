@@ -0,0 +1,131 @@
+# backend/benchmarks/bench_multi_worker.py
+"""
+Load-test game moves across 1..N worker processes sharing one Redis-protocol session store.
+
+  uv run python -m benchmarks.bench_multi_worker --workers 1 2 4 --sessions 32 --rounds 6
+
+Each worker runs its own TicTacToeManager whose agents stream a recorded turn from the stand-in
+LLM server (tests/fixtures/llm_stub.py) served by the parent process. Sessions are re-partitioned
+between workers every round, so every move reads the state another worker saved. Without
+--redis-url an in-process stand-in (see tests/fixtures/redis_stub.py) is served from the parent
+process too; both are single-threaded, so use a real Redis server for larger runs.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import multiprocessing
+import threading
+import time
+
+from src.tic_tac_toe.models import GameStatus
+from src.tic_tac_toe.store import RedisSessionStore
+from src.utils.llm_clients import LLMClientRegistry
+from tests.fixtures.llm_stub import StubLLMServer, chat_agent
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.redis_stub import StubRedisServer
+
+
+async def _play(
+  url: str, llm_url: str, index: int, workers: int, sessions: int, rounds: int, barrier
+) -> int:
+  store = RedisSessionStore(url)
+  llm_clients = LLMClientRegistry()
+  client = llm_clients.get(llm_url, "stand-in", "unused")
+  manager, sio = make_manager(chat_agent(client), session_store=store)
+  moves = 0
+  barrier.wait()
+  for round_number in range(rounds):
+    for session in range(sessions):
+      if (session + round_number) % workers != index:
+        continue
+      sid = f"sid-{session}"
+      game_session = await manager._get_session(sid)
+      if game_session is None or game_session.game.status != GameStatus.ONGOING:
+        await manager.handle_game_initialization(sid)
+        game_session = manager.game_sessions[sid]
+      position = game_session.game.get_board().index(None)
+      await manager.handle_user_move(sid, {"position": position})
+      moves += 1
+    sio.emitted.clear()
+    barrier.wait()  # No two workers ever touch the same session at once
+  await store.aclose()
+  await llm_clients.aclose()
+  return moves
+
+
+def _worker(
+  url: str, llm_url: str, index: int, workers: int, sessions: int, rounds: int, barrier, results
+):
+  with contextlib.redirect_stdout(io.StringIO()):
+    results.put(asyncio.run(_play(url, llm_url, index, workers, sessions, rounds, barrier)))
+
+
+@contextlib.contextmanager
+def _stub_server(server):
+  """Serve a stand-in (Redis or LLM) from a background thread so forked workers can reach it."""
+  loop = asyncio.new_event_loop()
+  thread = threading.Thread(target=loop.run_forever, daemon=True)
+  thread.start()
+  asyncio.run_coroutine_threadsafe(server.__aenter__(), loop).result()
+  try:
+    yield server
+  finally:
+    asyncio.run_coroutine_threadsafe(server.__aexit__(None, None, None), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+
+
+def run(url: str, llm_url: str, workers: int, sessions: int, rounds: int) -> tuple[int, float]:
+  barrier = multiprocessing.Barrier(workers + 1)
+  results = multiprocessing.Queue()
+  processes = [
+    multiprocessing.Process(
+      target=_worker, args=(url, llm_url, index, workers, sessions, rounds, barrier, results)
+    )
+    for index in range(workers)
+  ]
+  for process in processes:
+    process.start()
+  barrier.wait()  # Workers are set up; start the clock
+  started = time.perf_counter()
+  for _ in range(rounds):
+    barrier.wait()
+  elapsed = time.perf_counter() - started
+  moves = sum(results.get() for _ in processes)
+  for process in processes:
+    process.join()
+  return moves, elapsed
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts")
+  parser.add_argument("--sessions", type=int, default=32, help="Concurrent game sessions")
+  parser.add_argument("--rounds", type=int, default=6, help="Moves per session")
+  parser.add_argument("--redis-url", help="Use this Redis server instead of the in-process stub")
+  parser.add_argument(
+    "--ttft", type=float, default=0.0, help="Stand-in LLM's seconds to first token"
+  )
+  parser.add_argument("--token-delay", type=float, default=0.0, help="Seconds between its tokens")
+  args = parser.parse_args()
+
+  with contextlib.ExitStack() as stack:
+    url = args.redis_url or stack.enter_context(_stub_server(StubRedisServer())).url
+    llm = StubLLMServer(ttft=args.ttft, token_delay=args.token_delay)
+    llm_url = stack.enter_context(_stub_server(llm)).base_url
+    baseline = None
+    for workers in args.workers:
+      moves, elapsed = run(url, llm_url, workers, args.sessions, args.rounds)
+      throughput = moves / elapsed
+      baseline = baseline or throughput
+      print(
+        f"{workers:>3} workers: {moves} moves in {elapsed:.2f}s, "
+        f"{throughput:,.0f} moves/s ({throughput / baseline:.2f}x)"
+      )
+  print(f"(measured on {multiprocessing.cpu_count()} CPU cores)")
+
+
+if __name__ == "__main__":
+  main()
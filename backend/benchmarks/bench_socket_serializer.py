@@ -0,0 +1,74 @@
+# backend/benchmarks/bench_socket_serializer.py
+"""
+Compare JSON and MessagePack Socket.IO packets for a game's worth of emits (the recorded fixture
+stream plus nine board deltas): bytes on the wire and encode CPU per game.
+
+  uv run python -m benchmarks.bench_socket_serializer --games 2000
+"""
+
+import argparse
+import time
+
+from socketio.packet import EVENT, Packet
+
+from src.utils.socket_serializer import NegotiatedPacket
+from tests.fixtures.message_stream_01 import streaming_response
+
+STREAM_EVENTS = {
+  "text_reasoning": "AGENT_REASONING_CHUNK",
+  "text": "AGENT_STREAM_TOKEN",
+  "function_call": "AGENT_FUNCTION_CALL",
+  "function_result": "AGENT_FUNCTION_RESULT",
+}
+
+
+def game_emits() -> list[list]:
+  """Event name and payload of every emit in one game."""
+  emits = [
+    [STREAM_EVENTS[update["contents"][0]["type"]], update]
+    for update in streaming_response
+    if update["contents"] and update["contents"][0]["type"] in STREAM_EVENTS
+  ]
+  for v, position in enumerate((4, 0, 8, 2, 6, 3, 5, 1, 7), start=2):
+    mark = "O" if v % 2 == 0 else "X"
+    emits.append(["BOARD_DELTA", {"v": v, "pos": position, "mark": mark, "status": "ongoing"}])
+  return emits
+
+
+def wire_bytes(encoded) -> int:
+  parts = encoded if isinstance(encoded, list) else [encoded]
+  return sum(len(part.encode() if isinstance(part, str) else part) for part in parts)
+
+
+def run(encode, emits: list[list], games: int) -> tuple[int, float]:
+  size = sum(wire_bytes(encode(data)) for data in emits)
+  started = time.perf_counter()
+  for _ in range(games):
+    for data in emits:
+      encode(data)
+  return size, time.perf_counter() - started
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--games", type=int, default=2_000, help="Games to encode per serializer")
+  args = parser.parse_args()
+
+  emits = game_emits()
+  print(f"{len(emits)} emits per game")
+  variants = (
+    ("json", lambda data: Packet(EVENT, data=data, namespace="/").encode()),
+    ("msgpack", lambda data: bytes(NegotiatedPacket(EVENT, data=data, namespace="/").encode())),
+  )
+  baseline = None
+  for name, encode in variants:
+    size, elapsed = run(encode, emits, args.games)
+    baseline = baseline or (size, elapsed)
+    print(
+      f"{name:>8}: {size:,} bytes/game ({size / baseline[0]:.0%}), "
+      f"{elapsed * 1e6 / args.games:,.0f} µs encode/game ({baseline[1] / elapsed:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+  main()
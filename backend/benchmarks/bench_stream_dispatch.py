@@ -0,0 +1,132 @@
+# backend/benchmarks/bench_stream_dispatch.py
+"""
+Replay the recorded fixture stream through the legacy routing loop and the StreamDispatcher,
+reporting `to_dict()` calls, container allocations and CPU time per update.
+
+  uv run python -m benchmarks.bench_stream_dispatch --rounds 200
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from agent_framework import AgentRunResponseUpdate
+
+from src.utils.stream_dispatch import StreamDispatcher, emit_as_update
+from tests.fixtures.message_stream_01 import streaming_response
+
+LEGACY_EVENTS = {
+  "text_reasoning": "AGENT_REASONING_CHUNK",
+  "text": "AGENT_STREAM_TOKEN",
+  "function_call": "AGENT_FUNCTION_CALL",
+  "function_result": "AGENT_FUNCTION_RESULT",
+}
+
+
+class Counters:
+  enabled = False
+  to_dict_calls = 0
+  containers = 0
+
+
+def _count_containers(value) -> int:
+  """Count the dicts/lists a serialized update is made of (each one is a fresh allocation)."""
+  if isinstance(value, dict):
+    return 1 + sum(_count_containers(v) for v in value.values())
+  if isinstance(value, list):
+    return 1 + sum(_count_containers(v) for v in value)
+  return 0
+
+
+def _instrument_to_dict() -> None:
+  original = AgentRunResponseUpdate.to_dict
+
+  def counting_to_dict(self, *args, **kwargs):
+    data = original(self, *args, **kwargs)
+    if not Counters.enabled:
+      return data
+    Counters.to_dict_calls += 1
+    Counters.containers += _count_containers(data)
+    return data
+
+  AgentRunResponseUpdate.to_dict = counting_to_dict
+
+
+async def _sink(event: str, payload: dict) -> None:
+  return None
+
+
+async def legacy_loop(updates) -> None:
+  """The pre-dispatcher loop from handle_user_move (print is formatted but not written)."""
+  for update in updates:
+    _ = f"Agent stream token: {update.to_dict()}"
+    contents = update.to_dict().get("contents", [])
+    update_type = contents[0].get("type", "") if contents else ""
+    event = LEGACY_EVENTS.get(update_type)
+    if event:
+      await _sink(event, update.to_dict())
+
+
+async def dispatcher_loop(updates) -> None:
+  dispatcher = StreamDispatcher(
+    {content_type: emit_as_update(_sink, event) for content_type, event in LEGACY_EVENTS.items()}
+  )
+  for update in updates:
+    update_dict = await dispatcher.dispatch(update)
+    _ = f"Agent stream token: {update_dict}"
+
+
+def _measure(name: str, loop_fn, updates, rounds: int) -> dict:
+  Counters.to_dict_calls = Counters.containers = 0
+  Counters.enabled = True
+  asyncio.run(loop_fn(updates))  # counting pass
+  Counters.enabled = False
+  calls, containers = Counters.to_dict_calls, Counters.containers
+
+  tracemalloc.start()
+  asyncio.run(loop_fn(updates))
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  started = time.perf_counter()
+  for _ in range(rounds):
+    asyncio.run(loop_fn(updates))
+  elapsed = time.perf_counter() - started
+
+  n = len(updates)
+  return {
+    "name": name,
+    "to_dict/update": calls / n,
+    "containers/update": containers / n,
+    "peak KiB": peak / 1024,
+    "us/update": elapsed / (rounds * n) * 1e6,
+  }
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--rounds", type=int, default=200, help="Timed replays of the fixture")
+  args = parser.parse_args()
+
+  _instrument_to_dict()
+  updates = [AgentRunResponseUpdate.from_dict(data) for data in streaming_response]
+  rows = [
+    _measure("legacy", legacy_loop, updates, args.rounds),
+    _measure("dispatcher", dispatcher_loop, updates, args.rounds),
+  ]
+
+  print(f"Fixture updates: {len(updates)}, rounds: {args.rounds}")
+  header = ["name", "to_dict/update", "containers/update", "peak KiB", "us/update"]
+  print("  ".join(f"{h:>18}" for h in header))
+  for row in rows:
+    print("  ".join(f"{row[h]:>18.2f}" if h != "name" else f"{row[h]:>18}" for h in header))
+  legacy, new = rows
+  print(
+    f"Saved per update: {legacy['to_dict/update'] - new['to_dict/update']:.2f} to_dict() calls, "
+    f"{legacy['containers/update'] - new['containers/update']:.2f} container allocations"
+  )
+
+
+if __name__ == "__main__":
+  main()
@@ -18,11 +18,98 @@ class Settings(BaseSettings):
 
   API_PORT: int = 8000
 
+  # Logging (LOG_LEVELS sets levels per logger, e.g. "src.tic_tac_toe=DEBUG,src.stream=DEBUG";
+  # LOG_FORMAT is "text" (key=value) or "json"; per-chunk stream logs are only kept for a
+  # sampled fraction of sessions)
+  LOG_LEVEL: str = "INFO"
+  LOG_LEVELS: str = ""
+  LOG_FORMAT: str = "text"
+  LOG_STREAM_SAMPLE_RATE: float = 0.01
+
+  # Prometheus scrape endpoint for this process's metrics (None disables it)
+  METRICS_PATH: str | None = "/metrics"
+
+  # Move Tracing (OpenTelemetry spans per human move, tagged with session.id and turn).
+  # TRACE_EXPORTER is "file" (OTLP/JSON lines at TRACE_FILE_PATH; render timelines with
+  # python -m src.utils.tracing), "otlp" (gRPC to TRACE_OTLP_ENDPOINT) or None to disable;
+  # TRACE_SAMPLE_RATE is the fraction of sessions traced
+  TRACE_EXPORTER: str | None = None
+  TRACE_FILE_PATH: str = "traces.jsonl"
+  TRACE_OTLP_ENDPOINT: str = "http://localhost:4317"
+  TRACE_SAMPLE_RATE: float = 1.0
+
   # OpenAI API - Compliant Server Settings
   OPENAI_API_BASE_URL: str | None = None
   OPENAI_API_MODEL_ID: str = "gpt-5-nano"
   OPENAI_API_KEY: str | None = None
 
+  # LLM Connection Pool (shared by all sessions)
+  LLM_MAX_CONNECTIONS: int = 100
+  LLM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+  LLM_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+  LLM_PREWARM_CONNECTIONS: int = 2
+  # LLM Admission Control (agent runs in flight and tokens per minute across all sessions, 0
+  # disables either cap; a session's first run is charged the estimate, later ones its last run)
+  LLM_MAX_CONCURRENT_RUNS: int = 32
+  LLM_TOKENS_PER_MINUTE: int = 0
+  LLM_RUN_TOKEN_ESTIMATE: int = 2000
+
+  # Game Engine ("bitboard" caches win/draw status incrementally, "list" is the reference engine)
+  GAME_ENGINE: str = "bitboard"
+  # Perfect-play table file (python -m src.tic_tac_toe.solver <path>); built on first use if missing
+  SOLVER_TABLE_PATH: str | None = None
+
+  # Agent Turn Deadline (seconds to call agent_make_move before the solver moves; 0 disables)
+  AGENT_MOVE_TIMEOUT_SECONDS: float = 30.0
+
+  # Agent Prompt ("compact" boards are 3 short rows; "box" is the 13-line box-drawing rendering)
+  AGENT_BOARD_FORMAT: str = "compact"
+  # Prompt cache key sent with every agent request (None: off). Set it (e.g. "tic_tac_toe_agent")
+  # on OpenAI-hosted models so requests sharing the fixed instructions + tools prefix are routed
+  # to the same prompt cache; leave it off for endpoints that reject unknown request fields
+  AGENT_PROMPT_CACHE_KEY: str | None = None
+
+  # Agent Context Budget (per session: exchanges kept verbatim, finished games kept as one-line
+  # summaries before folding into a win/loss tally; 0 disables either limit)
+  AGENT_CONTEXT_MAX_EXCHANGES: int = 8
+  AGENT_CONTEXT_MAX_GAME_SUMMARIES: int = 5
+
+  # Speculative Agent Turns (agent replies run ahead for the top-K predicted human moves while
+  # the human thinks; 0 disables. MAX_RUNS caps runs in flight across all sessions)
+  AGENT_SPECULATION_TOP_K: int = 0
+  AGENT_SPECULATION_MAX_RUNS: int = 32
+
+  # Agent Pool (pre-built agents re-bound to each new session)
+  AGENT_POOL_MAX_IDLE: int = 32
+  AGENT_POOL_WARM_SIZE: int = 4
+
+  # Session Lifecycle (idle sessions are swept, the least recently used evicted past the cap)
+  SESSION_IDLE_TTL_SECONDS: float = 1800.0
+  SESSION_MAX_COUNT: int = 10_000
+  SESSION_SWEEP_INTERVAL_SECONDS: float = 60.0
+  # Game events queued per session behind the one being handled (more are refused with BUSY)
+  SESSION_MAILBOX_SIZE: int = 8
+
+  # Horizontal Scaling (shared session store and Socket.IO pub/sub; None keeps both in-process)
+  SESSION_STORE_URL: str | None = None
+  SOCKETIO_MESSAGE_QUEUE_URL: str | None = None
+
+  # Outbound Socket Buffers (per client: events are buffered once its transport has MAX_PACKETS
+  # unsent, stream chunks shed past the budget; a client that can't keep up within the budget or
+  # STALL_SECONDS is disconnected, 0 disables the stall timeout)
+  SOCKET_SEND_BUFFER_BYTES: int = 256 * 1024
+  SOCKET_SEND_BUFFER_MESSAGES: int = 512
+  SOCKET_TRANSPORT_MAX_PACKETS: int = 16
+  SOCKET_SEND_STALL_SECONDS: float = 30.0
+
+  # Socket.IO Packet Encoding ("msgpack" lets clients negotiate binary MessagePack; others get JSON)
+  SOCKETIO_SERIALIZER: str = "json"
+
+  # Agent Stream Batching (set STREAM_BATCH_MAX_DELAY_MS=0 to emit every chunk)
+  STREAM_BATCH_MAX_DELAY_MS: int = 50
+  STREAM_BATCH_MAX_BYTES: int = 1024
+  STREAM_BATCH_MAX_TOKENS: int = 32
+
   @property
   def is_production(self) -> bool:
     """Check if running in production environment."""
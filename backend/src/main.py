@@ -1,17 +1,84 @@
 # src/main.py
 """Main entry point for the application."""
 
-from fastapi import FastAPI
-from socketio import ASGIApp, AsyncServer
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
+from openai import OpenAIError
+from socketio import ASGIApp, AsyncRedisManager
 
 from src.config import settings
 from src.tic_tac_toe import TicTacToeManager
+from src.tic_tac_toe.solver import get_solver
+from src.utils.llm_clients import llm_clients
+from src.utils.log import configure_logging
+from src.utils.metrics import PROMETHEUS_CONTENT_TYPE, metrics, render_prometheus
+from src.utils.socket_serializer import create_socket_server
+from src.utils.tracing import configure_tracing
+
+configure_logging(
+  settings.LOG_LEVEL,
+  settings.LOG_LEVELS,
+  settings.LOG_FORMAT,
+  stream_sample_rate=settings.LOG_STREAM_SAMPLE_RATE,
+)
+log = logging.getLogger(__name__)
+tracer_provider = (
+  configure_tracing(
+    settings.TRACE_EXPORTER,
+    path=settings.TRACE_FILE_PATH,
+    endpoint=settings.TRACE_OTLP_ENDPOINT,
+    sample_rate=settings.TRACE_SAMPLE_RATE,
+  )
+  if settings.TRACE_EXPORTER
+  else None
+)
+
 
-app = FastAPI(title="Realtime Demo")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  """Warm the LLM and agent pools and start the session sweeper; tear them down on shutdown."""
+  if settings.LLM_PREWARM_CONNECTIONS > 0:
+    try:
+      client = llm_clients.get_default()
+    except OpenAIError as e:
+      log.warning("LLM connection pool not warmed: %s", e)
+    else:
+      warmed = await llm_clients.warm_up(client, connections=settings.LLM_PREWARM_CONNECTIONS)
+      log.info("LLM connection pool warmed: %d/%d", warmed, settings.LLM_PREWARM_CONNECTIONS)
+  try:
+    built = tic_tac_toe_manager.agent_pool.warm_up(settings.AGENT_POOL_WARM_SIZE)
+  except OpenAIError as e:
+    log.warning("Agent pool not warmed: %s", e)
+  else:
+    log.info("Agent pool warmed: %d agents", built)
+  # Load the solver table now so the first engine fallback move doesn't pay for it
+  get_solver(settings.SOLVER_TABLE_PATH)
+  tic_tac_toe_manager.game_sessions.start_sweeper(settings.SESSION_SWEEP_INTERVAL_SECONDS)
+  yield
+  await tic_tac_toe_manager.game_sessions.stop_sweeper()
+  if tic_tac_toe_manager.session_store is not None:
+    await tic_tac_toe_manager.session_store.aclose()
+  await llm_clients.aclose()
+  if tracer_provider is not None:
+    tracer_provider.shutdown()  # Exports the spans still batched
+
+
+app = FastAPI(title="Realtime Demo", lifespan=lifespan)
+
+# With a message queue, emits to a sid reach it whichever worker holds its connection
+client_manager = (
+  AsyncRedisManager(settings.SOCKETIO_MESSAGE_QUEUE_URL)
+  if settings.SOCKETIO_MESSAGE_QUEUE_URL
+  else None
+)
 
-sio = AsyncServer(
+sio = create_socket_server(
+  settings.SOCKETIO_SERIALIZER,
   async_mode="asgi",
   cors_allowed_origins=["*"],
+  client_manager=client_manager,
 )
 
 sio_app = ASGIApp(
@@ -26,15 +93,14 @@ sio_app = ASGIApp(
 # #########################################################
 @sio.event
 async def CONNECTION_TEST(sid: str, data: dict | None = None):
-  print(f"CONNECTION_TEST received from client: {sid} with data: {data}")
+  log.debug("CONNECTION_TEST received: %s", data, extra={"sid": sid})
 
 
 @sio.event
 async def PING(sid: str, data: dict | None = None):
-  print(f"PING event received from client: {sid}, calling CONNECTION_TEST...")
+  log.debug("PING received, calling CONNECTION_TEST", extra={"sid": sid})
   result = await sio.call("CONNECTION_TEST", {}, to=sid)
-  print(f"Result from CONNECTION_TEST: {result}")
-  print("Responding with PONG...")
+  log.debug("CONNECTION_TEST result: %s, responding with PONG", result, extra={"sid": sid})
   await sio.emit("PONG", {"message": "PONG"}, to=sid)
 
 
@@ -44,15 +110,27 @@ async def PING(sid: str, data: dict | None = None):
 tic_tac_toe_manager = TicTacToeManager(sio)
 
 
+# #########################################################
+# Metrics (this process's counters, for Prometheus to scrape)
+# #########################################################
+if settings.METRICS_PATH:
+
+  @app.get(settings.METRICS_PATH, include_in_schema=False)
+  async def prometheus_metrics() -> Response:
+    return Response(render_prometheus(metrics), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 if __name__ == "__main__":
   import uvicorn
 
   # Hot-reload is enabled by default, disabled only in production
   hot_reload = not settings.is_production
 
-  print(f"Starting API server: {app.title}")
-  print(f"  Environment: {settings.ENVIRONMENT}")
-  print(f"  Hot-reload: {hot_reload}")
+  log.info(
+    "Starting API server: %s",
+    app.title,
+    extra={"environment": settings.ENVIRONMENT, "hot_reload": hot_reload},
+  )
 
   uvicorn.run(
     "src.main:sio_app",
@@ -1,11 +1,11 @@
 # backend/src/tic_tac_toe/agent.py
 
 
-from agent_framework import ChatAgent
-from agent_framework.openai import OpenAIResponsesClient
+from agent_framework import ChatAgent, ChatClientProtocol
 
-from src.config import settings
-from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.agent_pool import AgentBinding
+from src.utils.llm_clients import llm_clients
+from src.utils.tracing import tracer
 
 PROMPT = """You are an unbearably smug, sarcastic tic-tac-toe master with perfect memory of the entire game.
 You play as X, and the human plays as O. The human always goes first.
@@ -31,27 +31,68 @@ Keep your responses brief and to the point. Do not ramble on or go on tangents.
 You may only make one move per turn. Do not make multiple moves per turn. Wait for the human to make their move before you make your move.
 
 You will be asked questions after the game ends. Remember every move and every insult you threw.
+
+Boards are shown as rows for positions 0-2, 3-5 and 6-8. Every move the human makes comes with the
+current board, so you only need get_board_string() if you lose track.
 """
 
+# Board renderings for the agent: TicTacToe method and the tool description that goes with it
+BOARD_FORMATS: dict[str, tuple[str, str]] = {
+  "compact": (
+    "get_board_compact",
+    "Get the board as three rows (positions 0-2, 3-5, 6-8) of X, O and . for empty cells.",
+  ),
+  "box": (
+    "get_board_string",
+    "Get a string representation of the board for display with clean box-drawing borders.",
+  ),
+}
 
-def create_tic_tac_toe_agent(game: TicTacToe, agent_move_tool) -> ChatAgent:
-  # Create OpenAI client
-  client = OpenAIResponsesClient(
-    base_url=settings.OPENAI_API_BASE_URL,
-    model_id=settings.OPENAI_API_MODEL_ID,
-    api_key=settings.OPENAI_API_KEY,
-  )
-  print("Initializing Agent...")
-  print(f"LLM Client config - Base URL: {settings.OPENAI_API_BASE_URL}")
-  print(f"LLM Client config - Model: {settings.OPENAI_API_MODEL_ID}")
-  print(f"LLM Client config - API Key present: {bool(settings.OPENAI_API_KEY)}")
-  print("Agent initialized")
 
-  # Create agent with game tools (use session-level tool for moves)
+def _board_format(board_format: str) -> tuple[str, str]:
+  try:
+    return BOARD_FORMATS[board_format]
+  except KeyError:
+    raise ValueError(
+      f"Unknown board format: {board_format} (expected one of {list(BOARD_FORMATS)})"
+    )
+
+
+def render_board(game, board_format: str = "compact") -> str:
+  """Render a game's board in one of the BOARD_FORMATS."""
+  return getattr(game, _board_format(board_format)[0])()
+
+
+def create_board_tool(binding: AgentBinding, board_format: str = "compact"):
+  """Create a board-reading tool that follows the binding, so it survives rebinding to new games."""
+  method, description = _board_format(board_format)
+
+  def get_board_string() -> str:
+    with tracer.start_as_current_span("tool.get_board_string"):
+      return getattr(binding.game, method)()
+
+  # Fixed per format, so the tool schema is byte-identical across agents and turns
+  get_board_string.__doc__ = description
+  return get_board_string
+
+
+def create_tic_tac_toe_agent(
+  binding: AgentBinding,
+  agent_move_tool,
+  chat_client: ChatClientProtocol | None = None,
+  board_format: str = "compact",
+  prompt_cache_key: str | None = None,
+) -> ChatAgent:
+  # Reuse the process-wide pooled OpenAI client
+  client = chat_client or llm_clients.get_default()
+
+  # Create agent with game tools (tools act on whichever game the binding points at).
+  # Instructions and tools form the same prefix on every request; the turn's board goes last.
   return ChatAgent(
     chat_client=client,
     name="tic_tac_toe_agent",
     description="Sassy Tic-Tac-Toe player with perfect memory",
     instructions=PROMPT,
-    tools=[game.get_board_string, agent_move_tool],
+    tools=[create_board_tool(binding, board_format), agent_move_tool],
+    additional_chat_options={"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None,
   )
@@ -0,0 +1,115 @@
+# backend/src/tic_tac_toe/agent_pool.py
+"""Pool of pre-built agents whose game-bound tools can be re-pointed at a new session."""
+
+import time
+from typing import Awaitable, Callable, Optional
+
+from agent_framework import ChatAgent
+
+from src.tic_tac_toe.game import TicTacToe
+from src.utils.metrics import metrics
+
+MoveHandler = Callable[[int], Awaitable[dict]]
+
+
+class AgentBinding:
+  """
+  Mutable target for an agent's game tools - rebinding swaps the game/sid the tools act on.
+  `on_move`, when set, takes the agent's moves instead of the session (see speculation).
+  """
+
+  __slots__ = ("sid", "game", "on_move")
+
+  def __init__(self, sid: Optional[str] = None, game: Optional[TicTacToe] = None):
+    self.sid = sid
+    self.game = game
+    self.on_move: Optional[MoveHandler] = None
+
+  def bind(
+    self, sid: Optional[str], game: Optional[TicTacToe], on_move: Optional[MoveHandler] = None
+  ) -> None:
+    self.sid = sid
+    self.game = game
+    self.on_move = on_move
+
+
+class PooledAgent:
+  """An agent together with the binding its tools were built against."""
+
+  __slots__ = ("agent", "binding")
+
+  def __init__(self, agent: ChatAgent, binding: AgentBinding):
+    self.agent = agent
+    self.binding = binding
+
+
+class AgentPool:
+  """
+  Keeps up to `max_idle` pre-built agents ready for checkout.
+  Checkout binds an idle agent to the session's game and sid (a hit), building a new one only
+  when the pool is empty (a miss). Released agents are unbound and kept if there is room.
+  """
+
+  def __init__(self, factory: Callable[[AgentBinding], ChatAgent], max_idle: int = 32):
+    self._factory = factory
+    self.max_idle = max_idle
+    self._idle: list[PooledAgent] = []
+    self.hit_count = 0
+    self.miss_count = 0
+    self.hits = metrics.counter(
+      "agent_pool_checkouts_total", "Agent checkouts by result", {"result": "hit"}
+    )
+    self.misses = metrics.counter(
+      "agent_pool_checkouts_total", "Agent checkouts by result", {"result": "miss"}
+    )
+    self.checkout_seconds = metrics.histogram(
+      "agent_pool_checkout_seconds", "Time to check out (and build, on a miss) an agent"
+    )
+    self.idle_gauge = metrics.gauge("agent_pool_idle", "Pre-built agents waiting for a session")
+
+  @property
+  def idle(self) -> int:
+    return len(self._idle)
+
+  @property
+  def hit_rate(self) -> float:
+    total = self.hit_count + self.miss_count
+    return self.hit_count / total if total else 0.0
+
+  def _build(self) -> PooledAgent:
+    binding = AgentBinding()
+    return PooledAgent(self._factory(binding), binding)
+
+  def warm_up(self, size: int) -> int:
+    """Pre-build agents until `size` are idle (capped at `max_idle`), returning how many."""
+    built = 0
+    while len(self._idle) < min(size, self.max_idle):
+      self._idle.append(self._build())
+      built += 1
+    self.idle_gauge.set(len(self._idle))
+    return built
+
+  def checkout(
+    self, sid: str, game: TicTacToe, on_move: Optional[MoveHandler] = None
+  ) -> PooledAgent:
+    """Take an agent from the pool (or build one) with its tools bound to `game` and `sid`."""
+    started = time.perf_counter()
+    if self._idle:
+      pooled = self._idle.pop()
+      self.hit_count += 1
+      self.hits.inc()
+    else:
+      pooled = self._build()
+      self.miss_count += 1
+      self.misses.inc()
+    pooled.binding.bind(sid, game, on_move)
+    self.checkout_seconds.observe(time.perf_counter() - started)
+    self.idle_gauge.set(len(self._idle))
+    return pooled
+
+  def release(self, pooled: PooledAgent) -> None:
+    """Unbind an agent and return it to the pool, dropping it if the pool is full."""
+    pooled.binding.bind(None, None)
+    if len(self._idle) < self.max_idle:
+      self._idle.append(pooled)
+    self.idle_gauge.set(len(self._idle))
@@ -0,0 +1,119 @@
+# backend/src/tic_tac_toe/bitboard.py
+"""Bitboard tic-tac-toe engine: a drop-in TicTacToe with incremental, cached win/draw detection."""
+
+from typing import List, Optional, Tuple
+
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import GameStatus, Player
+
+FULL_BOARD = 0b111_111_111
+
+# Bit i is board position i; rows, columns, then diagonals
+LINE_MASKS: tuple[int, ...] = (
+  0b000_000_111,
+  0b000_111_000,
+  0b111_000_000,
+  0b001_001_001,
+  0b010_010_010,
+  0b100_100_100,
+  0b100_010_001,
+  0b001_010_100,
+)
+
+# Only the lines through the last move can have been completed by it
+LINES_THROUGH: tuple[tuple[int, ...], ...] = tuple(
+  tuple(mask for mask in LINE_MASKS if mask >> position & 1) for position in range(9)
+)
+
+
+class BitboardTicTacToe(TicTacToe):
+  """
+  TicTacToe keeping the board as two 9-bit integers (one per player). A move only tests the
+  2-4 lines through its position, a full board is a popcount, and the status and winner are
+  cached, so `get_game_status`, `check_win` and `check_draw` are O(1).
+  `board` returns a copy of a cell list mirrored from the bitboards; assigning a list to it
+  re-derives the bitboards.
+  """
+
+  def __init__(self, starting_player: Player = Player.O):
+    self._x = 0
+    self._o = 0
+    self._cells: List[Optional[Player]] = [None] * 9  # Mirror of the bitboards for board views
+    self._winner: Optional[Player] = None
+    super().__init__(starting_player)
+
+  @property
+  def board(self) -> List[Optional[Player]]:
+    return self._cells.copy()
+
+  @board.setter
+  def board(self, cells: List[Optional[Player]]) -> None:
+    self._cells = list(cells)
+    self._x = sum(1 << i for i, cell in enumerate(cells) if cell == Player.X)
+    self._o = sum(1 << i for i, cell in enumerate(cells) if cell == Player.O)
+    self._winner = None
+    for mask in LINE_MASKS:
+      if self._x & mask == mask:
+        self._winner = Player.X
+      elif self._o & mask == mask:
+        self._winner = Player.O
+    if self._winner:
+      self.status = GameStatus.WIN
+    elif (self._x | self._o).bit_count() == 9:
+      self.status = GameStatus.DRAW
+    else:
+      self.status = GameStatus.ONGOING
+
+  def _validate_empty(self, position: int) -> bool:
+    """Check if the spot is empty."""
+    return not (self._x | self._o) >> position & 1
+
+  def _place(self, player: Player, position: int) -> None:
+    """Set the player's bit and update the cached status from the lines through `position`."""
+    if player == Player.X:
+      self._x |= 1 << position
+      marks = self._x
+    else:
+      self._o |= 1 << position
+      marks = self._o
+    self._cells[position] = player
+    for mask in LINES_THROUGH[position]:
+      if marks & mask == mask:
+        self._winner = player
+        self.status = GameStatus.WIN
+        return
+    if (self._x | self._o).bit_count() == 9:
+      self.status = GameStatus.DRAW
+
+  def check_win(self) -> Optional[Player]:
+    """Get the winner, if any (cached when the winning move was placed)."""
+    return self._winner
+
+  def check_draw(self) -> bool:
+    """Check if the board is full."""
+    return (self._x | self._o) == FULL_BOARD
+
+  def get_game_status(self) -> Tuple[GameStatus, Optional[Player]]:
+    """
+    Get the current game status.
+    Returns (status, winner_value if win else None)
+    """
+    return self.status, self._winner
+
+  def get_board(self) -> List[Optional[Player]]:
+    """Get a snapshot of the board (copy), with player values or None."""
+    return self._cells.copy()
+
+
+GAME_ENGINES: dict[str, type[TicTacToe]] = {
+  "list": TicTacToe,
+  "bitboard": BitboardTicTacToe,
+}
+
+
+def create_game(engine: str = "bitboard") -> TicTacToe:
+  """Create a game with the named engine ("bitboard" or "list")."""
+  try:
+    return GAME_ENGINES[engine]()
+  except KeyError:
+    raise ValueError(f"Unknown game engine: {engine} (expected one of {list(GAME_ENGINES)})")
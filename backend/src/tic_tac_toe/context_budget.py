@@ -0,0 +1,130 @@
+# backend/src/tic_tac_toe/context_budget.py
+"""
+Context budget for a session's AgentThread: the thread is re-sent on every agent run, so it is
+kept to the last few exchanges verbatim plus a one-line summary per finished game.
+
+Game summaries are built from the game log when the game is reset (no extra LLM call) and stored
+in the thread itself, marked by their message ids, so they travel with the thread through the
+session store. Summaries past the budget fold into a single running tally of results.
+"""
+
+from agent_framework import AgentThread, ChatMessage
+
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import GameStatus, Player
+
+SUMMARY_ID = "game-summary"  # message_id: game-summary:<game number>:<outcome>
+TALLY_ID = "game-tally"  # message_id: game-tally:<games>:<ai wins>:<human wins>:<ties>
+
+OUTCOMES = ("ai", "human", "tie", "unfinished")
+_OUTCOME_TEXT = {
+  "ai": "you won",
+  "human": "the human won",
+  "tie": "it was a tie",
+  "unfinished": "reset before it finished",
+}
+
+
+def game_outcome(game: TicTacToe) -> str:
+  status, winner = game.get_game_status()
+  if status == GameStatus.DRAW:
+    return "tie"
+  if status == GameStatus.WIN:
+    return "ai" if winner == Player.X else "human"
+  return "unfinished"
+
+
+def _fields(message: ChatMessage, kind: str) -> list[str] | None:
+  """The id fields after `kind` if the message is one of our markers, else None."""
+  parts = (message.message_id or "").split(":")
+  return parts[1:] if parts[0] == kind else None
+
+
+class ContextBudget:
+  """
+  Keeps at most `max_exchanges` exchanges (a user message and everything the agent added after
+  it) and `max_game_summaries` game summaries in a thread; 0 disables either limit.
+  """
+
+  __slots__ = ("max_exchanges", "max_game_summaries")
+
+  def __init__(self, max_exchanges: int = 8, max_game_summaries: int = 5):
+    self.max_exchanges = max_exchanges
+    self.max_game_summaries = max_game_summaries
+
+  async def close_game(self, thread: AgentThread, game: TicTacToe) -> None:
+    """Summarize the game (before it is reset) into the thread, then trim the thread."""
+    moves = [record for record in game.game_log if record.success]
+    if not moves:
+      return
+    messages = await self._messages(thread)
+    number = 1 + sum(
+      int(fields[0]) if kind == TALLY_ID else 1
+      for message in messages
+      for kind in (SUMMARY_ID, TALLY_ID)
+      if (fields := _fields(message, kind)) is not None
+    )
+    outcome = game_outcome(game)
+    played = " ".join(f"{record.player.value}{record.position}" for record in moves)
+    summary = ChatMessage(
+      role="user",
+      text=f"Game {number} (O = human, X = you): {played} - {_OUTCOME_TEXT[outcome]}.",
+      message_id=f"{SUMMARY_ID}:{number}:{outcome}",
+    )
+    await thread.on_new_messages(summary)
+    await self.trim(thread)
+
+  async def trim(self, thread: AgentThread) -> None:
+    """Drop the oldest exchanges and fold the oldest summaries into the tally, if over budget."""
+    messages = await self._messages(thread)
+    tally = [0, 0, 0, 0]  # games, ai, human, tie
+    summaries: list[int] = []
+    exchanges: list[int] = []  # Index of the user message starting each exchange
+    for index, message in enumerate(messages):
+      if (fields := _fields(message, TALLY_ID)) is not None:
+        tally = [a + int(b) for a, b in zip(tally, fields)]
+      elif _fields(message, SUMMARY_ID) is not None:
+        summaries.append(index)
+      elif message.role.value == "user":
+        exchanges.append(index)
+
+    folded = summaries[: -self.max_game_summaries] if self.max_game_summaries else []
+    dropped_exchanges = exchanges[: -self.max_exchanges] if self.max_exchanges else []
+    if not folded and not dropped_exchanges:
+      return
+    for index in folded:
+      outcome = _fields(messages[index], SUMMARY_ID)[1]
+      tally[0] += 1
+      if outcome in OUTCOMES[:3]:
+        tally[1 + OUTCOMES.index(outcome)] += 1
+    # Keep the summaries left and everything from the first kept exchange on
+    start = exchanges[len(dropped_exchanges)] if dropped_exchanges else 0
+    drop = set(folded)
+    kept = [
+      message
+      for index, message in enumerate(messages)
+      if index not in drop
+      and _fields(message, TALLY_ID) is None
+      and (index >= start or _fields(message, SUMMARY_ID) is not None)
+    ]
+    if tally[0]:
+      kept.insert(0, self._tally_message(*tally))
+    thread.message_store.messages[:] = kept
+
+  @staticmethod
+  def _tally_message(games: int, ai: int, human: int, ties: int) -> ChatMessage:
+    return ChatMessage(
+      role="user",
+      text=(
+        f"Before the games below you played {games} games: "
+        f"you won {ai}, the human won {human}, {ties} ties."
+      ),
+      message_id=f"{TALLY_ID}:{games}:{ai}:{human}:{ties}",
+    )
+
+  @staticmethod
+  async def _messages(thread: AgentThread) -> list[ChatMessage]:
+    # Threads kept by the service (service_thread_id) have no local store to trim
+    if thread.message_store is None:
+      return []
+    return await thread.message_store.list_messages()
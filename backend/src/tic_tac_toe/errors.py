@@ -36,3 +36,9 @@ class AgentTimeoutError(AgentErrorBase):
   """Exception raised for agent timeout."""
 
   pass
+
+
+class AgentRunCancelledError(AgentErrorBase):
+  """Exception raised when an agent run is cancelled by a reset, disconnect or newer query."""
+
+  pass
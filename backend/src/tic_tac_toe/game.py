@@ -1,7 +1,11 @@
 # backend/src/tic_tac_toe/game.py
+import logging
 from typing import List, Optional, Tuple
 
-from src.tic_tac_toe.models import BoardUpdateResult, GameLogRecord, GameStatus, Player
+from src.tic_tac_toe.game_log import GameLog
+from src.tic_tac_toe.models import GameStatus, MoveResult, Player
+
+log = logging.getLogger(__name__)
 
 
 class TicTacToe:
@@ -13,18 +17,20 @@ class TicTacToe:
   def __init__(self, starting_player: Player = Player.O):
     self.board: List[Optional[Player]] = [None] * 9
     self.current_player: Player = Player.O
-    self.game_log: List[GameLogRecord] = []
+    self.game_log: GameLog = GameLog()  # Append-only event store the board can be replayed from
     self.status: GameStatus = GameStatus.ONGOING
     self.turn: int = 1  # Starts at 1 for the first move
+    self.version: int = 0  # Bumped by every board change, including resets; never goes back
 
-  def reset(self) -> BoardUpdateResult:
+  def reset(self) -> MoveResult:
     """Reset the game state to initial state."""
     self.board = [None] * 9
     self.current_player = Player.O
-    self.game_log = []
+    self.game_log = GameLog()
     self.status = GameStatus.ONGOING
     self.turn = 1
-    return BoardUpdateResult(
+    self.version += 1
+    return MoveResult(
       success=True,
       status=self.status,
       message="Game reset successfully.",
@@ -44,7 +50,7 @@ class TicTacToe:
     """Check if it's the correct player's turn."""
     return player == self.current_player
 
-  def make_move(self, player: Player, position: int) -> BoardUpdateResult:
+  def make_move(self, player: Player, position: int) -> MoveResult:
     """
     Make a move for the given player at the position.
     Validates the move, updates the board, logs history, swaps player, checks status, and adds to messages.
@@ -52,37 +58,31 @@ class TicTacToe:
     """
     # Validation block (for future abstraction)
     if self.status != GameStatus.ONGOING:
-      return BoardUpdateResult(
+      return MoveResult(
         success=False,
         status=self.status,
         message=f"Game is not ongoing. Current status: {self.status.value}",
         board_state=self.get_board(),
       )
     if not self._validate_turn(player):
-      self.game_log.append(
-        GameLogRecord(turn=self.turn, player=player, position=position, success=False)
-      )
-      return BoardUpdateResult(
+      self.game_log.record(self.turn, player, position, False)
+      return MoveResult(
         success=False,
         status=self.status,
         message=f"It's not {player.value}'s turn.",
         board_state=self.get_board(),
       )
     if not self._validate_position(position):
-      self.game_log.append(
-        GameLogRecord(turn=self.turn, player=player, position=position, success=False)
-      )
-      return BoardUpdateResult(
+      self.game_log.record(self.turn, player, position, False)
+      return MoveResult(
         success=False,
         status=self.status,
         message=f"Invalid position: {position} (must be 0-8).",
         board_state=self.get_board(),
       )
     if not self._validate_empty(position):
-      self.game_log.append(
-        GameLogRecord(turn=self.turn, player=player, position=position, success=False)
-      )
-      return BoardUpdateResult(
+      self.game_log.record(self.turn, player, position, False)
+      return MoveResult(
         success=False,
         status=self.status,
         message=f"Position {position} is not empty.",
@@ -90,11 +90,10 @@ class TicTacToe:
       )
 
     # Update board and history
-    self.board[position] = player
-    self.game_log.append(
-      GameLogRecord(turn=self.turn, player=player, position=position, success=True)
-    )
+    self._place(player, position)
+    self.game_log.record(self.turn, player, position, True)
     self.turn += 1
+    self.version += 1
 
     # Swap player
     self.current_player = Player.O if player == Player.X else Player.X
@@ -108,23 +107,27 @@ class TicTacToe:
     else:
       message = f"Move successful. Now {self.current_player.value}'s turn."
 
-    return BoardUpdateResult(
+    return MoveResult(
       success=True,
       status=status,
       message=message,
       board_state=self.get_board(),
     )
 
-  def take_X_move(self, position: int) -> BoardUpdateResult:
+  def take_X_move(self, position: int) -> MoveResult:
     """Hardcoded method for making a move as X, calling make_move."""
-    print(f"Taking X move at position: {position}")
+    log.debug("Taking X move at position %d", position)
     return self.make_move(Player.X, position)
 
-  def take_O_move(self, position: int) -> BoardUpdateResult:
+  def take_O_move(self, position: int) -> MoveResult:
     """Hardcoded method for making a move as O, calling make_move."""
-    print(f"Taking O move at position: {position}")
+    log.debug("Taking O move at position %d", position)
     return self.make_move(Player.O, position)
 
+  def _place(self, player: Player, position: int) -> None:
+    """Put the player's mark on a validated empty position."""
+    self.board[position] = player
+
   # Win check strategies (grouped for future abstraction, e.g., into Strategy pattern if extending to other games)
   def _check_rows(self) -> Optional[Player]:
     """Check for a winner in rows."""
@@ -188,11 +191,12 @@ class TicTacToe:
     lower_border = "└───┴───┴───┘"
     lines.append(upper_border)
 
+    board = self.get_board()
     for row in range(3):
       row_cells = []
       for col in range(3):
         idx = row * 3 + col
-        cell = self.board[idx]
+        cell = board[idx]
         mark = cell.value if cell else " "
         row_cells.append(f" {mark} ")
       lines.append("│" + "│".join(row_cells) + "│")
@@ -205,6 +209,32 @@ class TicTacToe:
     lines.append(lower_border)
     return "\n".join(lines)
 
+  def get_board_compact(self) -> str:
+    """Get the board as three rows of X, O and . (empty), e.g. "X.O\n.O.\n..X" - about 4 tokens."""
+    marks = "".join(cell.value if cell else "." for cell in self.get_board())
+    return f"{marks[0:3]}\n{marks[3:6]}\n{marks[6:9]}"
+
   def get_current_turn(self) -> str:
     """Get whose turn it is."""
     return self.current_player.value
+
+  # State snapshots (used by external session stores)
+  def export_state(self) -> dict:
+    """Get a compact, JSON-ready snapshot of the turn, status and packed game log."""
+    return {
+      "player": self.current_player.value,
+      "status": self.status.value,
+      "turn": self.turn,
+      "version": self.version,
+      "log": self.game_log.export(),
+    }
+
+  def load_state(self, state: dict) -> None:
+    """Restore a snapshot from `export_state` in place, so tools bound to this game stay valid."""
+    self.game_log = GameLog.from_export(state["log"])
+    # The board is derived from the log rather than stored alongside it
+    self.board = self.game_log.replay()
+    self.current_player = Player(state["player"])
+    self.status = GameStatus(state["status"])
+    self.turn = state["turn"]
+    self.version = state["version"]
@@ -0,0 +1,140 @@
+# backend/src/tic_tac_toe/game_log.py
+"""
+Append-only, array-backed game log: the event store a game's board can be replayed from.
+
+Each move attempt is one signed 32-bit int in an `array("i")`: bit 0 is success, bit 1 the player
+(1 for X), bits 2-7 the turn and the remaining bits the position as a signed value (clamped to
++/-2^23, which only ever affects rejected moves). Only the first `max_failures` rejected moves are
+recorded, so a client spamming bad moves can't grow the log; later ones are just counted.
+Every `SNAPSHOT_INTERVAL` successful moves the board is packed into a uint32 snapshot
+(X bits, then O bits shifted by 9), so `replay` applies at most `SNAPSHOT_INTERVAL - 1` moves.
+"""
+
+from array import array
+from typing import Iterator, List, Optional
+
+from src.tic_tac_toe.models import MoveRecord, Player
+
+MAX_FAILED_MOVES = 32
+SNAPSHOT_INTERVAL = 3
+
+_SUCCESS_BIT = 0b1
+_X_BIT = 0b10
+_TURN_SHIFT = 2
+_TURN_MASK = 0x3F
+_POSITION_SHIFT = 8
+_POSITION_LIMIT = 1 << 23
+
+
+def _pack(turn: int, player: Player, position: int, success: bool) -> int:
+  position = max(-_POSITION_LIMIT, min(position, _POSITION_LIMIT - 1))
+  return (
+    position << _POSITION_SHIFT
+    | (turn & _TURN_MASK) << _TURN_SHIFT
+    | (_X_BIT if player == Player.X else 0)
+    | (_SUCCESS_BIT if success else 0)
+  )
+
+
+def _unpack(event: int) -> MoveRecord:
+  return MoveRecord(
+    event >> _TURN_SHIFT & _TURN_MASK,
+    Player.X if event & _X_BIT else Player.O,
+    event >> _POSITION_SHIFT,
+    bool(event & _SUCCESS_BIT),
+  )
+
+
+class GameLog:
+  """
+  Sequence of MoveRecord views over packed events. Compares equal to another GameLog with the
+  same events, or to a list of the same MoveRecords.
+  """
+
+  __slots__ = ("_events", "_moves", "_snapshots", "_failures", "dropped_failures", "max_failures")
+
+  def __init__(self, max_failures: int = MAX_FAILED_MOVES):
+    self._events = array("i")
+    self._moves = array("B")  # Event index of each successful move, in turn order
+    self._snapshots = array("I")  # Packed board after every SNAPSHOT_INTERVAL successful moves
+    self._failures = 0
+    self.dropped_failures = 0  # Rejected moves past the cap, counted but not recorded
+    self.max_failures = max_failures
+
+  # ==================== Recording ====================
+
+  def record(self, turn: int, player: Player, position: int, success: bool) -> bool:
+    """Append a move attempt. Returns False if it was a rejected move dropped by the cap."""
+    if not success:
+      if self._failures >= self.max_failures:
+        self.dropped_failures += 1
+        return False
+      self._failures += 1
+    else:
+      self._moves.append(len(self._events))
+    self._events.append(_pack(turn, player, position, success))
+    if success and len(self._moves) % SNAPSHOT_INTERVAL == 0:
+      self._snapshots.append(self._pack_board(len(self._moves)))
+    return True
+
+  def _pack_board(self, moves: int) -> int:
+    """Pack the board after the first `moves` successful moves, starting from a snapshot."""
+    snapshots = min(moves // SNAPSHOT_INTERVAL, len(self._snapshots))
+    board = self._snapshots[snapshots - 1] if snapshots else 0
+    for index in self._moves[snapshots * SNAPSHOT_INTERVAL : moves]:
+      event = self._events[index]
+      shift = 0 if event & _X_BIT else 9
+      board |= 1 << ((event >> _POSITION_SHIFT) + shift)
+    return board
+
+  # ==================== Replay and Export ====================
+
+  def replay(self, upto_turn: Optional[int] = None) -> List[Optional[Player]]:
+    """Board cells after every successful move up to and including `upto_turn` (None: all)."""
+    moves = len(self._moves) if upto_turn is None else max(0, min(upto_turn, len(self._moves)))
+    board = self._pack_board(moves)
+    return [
+      Player.X if board >> i & 1 else Player.O if board >> (i + 9) & 1 else None for i in range(9)
+    ]
+
+  def export(self) -> List[int]:
+    """Packed events as a JSON-ready list of ints; rebuild with `GameLog.from_export`."""
+    return self._events.tolist()
+
+  @classmethod
+  def from_export(cls, events: List[int], max_failures: int = MAX_FAILED_MOVES) -> "GameLog":
+    """Rebuild a log (and its snapshots) from `export()` output."""
+    log = cls(max_failures)
+    for event in events:
+      record = _unpack(event)
+      log.record(record.turn, record.player, record.position, record.success)
+    return log
+
+  def nbytes(self) -> int:
+    """Size of the packed event, move index and snapshot buffers."""
+    return sum(
+      len(buffer) * buffer.itemsize for buffer in (self._events, self._moves, self._snapshots)
+    )
+
+  # ==================== Sequence Views ====================
+
+  def __len__(self) -> int:
+    return len(self._events)
+
+  def __getitem__(self, index: int) -> MoveRecord:
+    return _unpack(self._events[index])
+
+  def __iter__(self) -> Iterator[MoveRecord]:
+    return map(_unpack, self._events)
+
+  def __eq__(self, other: object) -> bool:
+    if isinstance(other, GameLog):
+      return self._events == other._events
+    if isinstance(other, list):
+      return list(self) == other
+    return NotImplemented
+
+  __hash__ = None
+
+  def __repr__(self) -> str:
+    return f"GameLog({list(self)!r})"
@@ -1,13 +1,41 @@
 # backend/src/tic_tac_toe/manager.py
 """Manager class for the tic-tac-toe game."""
 
+import asyncio
+import logging
+import random
+import time
+from contextlib import aclosing, suppress
+from contextvars import ContextVar
+
 from agent_framework import AgentThread, ChatAgent, ChatMessage
-from pydantic import BaseModel, ConfigDict
+from opentelemetry import trace
+from pydantic import BaseModel, ConfigDict, Field
 from socketio import AsyncServer
 
-from src.tic_tac_toe.agent import create_tic_tac_toe_agent
+from src.config import settings
+from src.tic_tac_toe.agent import create_tic_tac_toe_agent, render_board
+from src.tic_tac_toe.agent_pool import AgentBinding, AgentPool, PooledAgent
+from src.tic_tac_toe.bitboard import create_game
+from src.tic_tac_toe.context_budget import ContextBudget
+from src.tic_tac_toe.errors import AgentRunCancelledError, AgentTimeoutError
 from src.tic_tac_toe.game import TicTacToe
-from src.tic_tac_toe.models import GameStatus, Player, PlayerMoveRequest
+from src.tic_tac_toe.models import GameStatus, MoveResult, Player, PlayerMoveRequest
+from src.tic_tac_toe.sessions import SessionRegistry
+from src.tic_tac_toe.solver import get_solver
+from src.tic_tac_toe.speculation import SpeculativeRun, fork_thread, predict_human_moves
+from src.tic_tac_toe.store import create_session_store, decode_session, encode_session
+from src.utils.llm_scheduler import QUERY, SPECULATIVE, TURN, Grant, llm_scheduler
+from src.utils.log import stream_log, stream_log_enabled
+from src.utils.mailbox import Mailbox
+from src.utils.metrics import metrics
+from src.utils.outbound import OutboundChannel, transport_queue
+from src.utils.stream_batcher import StreamBatcher
+from src.utils.stream_dispatch import StreamDispatcher, emit_as_update
+from src.utils.token_usage import TokenUsage
+from src.utils.tracing import SESSION_ID_ATTR, TURN_ATTR, StreamPhases, tracer
+
+log = logging.getLogger(__name__)
 
 
 class GameSession(BaseModel):
@@ -15,8 +43,46 @@ class GameSession(BaseModel):
 
   session_id: str
   game: TicTacToe
-  agent: ChatAgent
+  pooled_agent: PooledAgent
   thread: AgentThread
+  context: ContextBudget  # Bounds what of the thread is re-sent on each agent run
+  batcher: StreamBatcher
+  dispatcher: StreamDispatcher
+  usage: TokenUsage  # Tokens used by the current (or last) agent turn
+  run_tokens: int = 0  # Tokens the last agent run used: the admission estimate for the next
+  version: int = 0  # Version last saved to / loaded from the session store
+  turn_started_at: float | None = None  # Set while waiting for the agent's move
+  # Bumped by every reset and disconnect; agent runs from an older generation can't move
+  generation: int = 0
+  turn_task: asyncio.Task | None = None  # In-flight agent turn
+  query_task: asyncio.Task | None = None  # In-flight post-game answer
+  # Agent turns started ahead for predicted human moves, by position
+  speculations: dict[int, SpeculativeRun] = Field(default_factory=dict)
+
+  @property
+  def agent(self) -> ChatAgent:
+    return self.pooled_agent.agent
+
+
+# Session generation the current agent run started in (set inside each run's task)
+_run_generation: ContextVar[int | None] = ContextVar("run_generation", default=None)
+
+# Phases of handle_user_move timed in user_move_seconds: checking and playing the human's move,
+# sending it, the agent's first stream update and its move (both from the start of its turn),
+# and the whole handler
+USER_MOVE_PHASES = ("validate", "emit", "agent_first_token", "agent_move", "total")
+
+# Buckets for the agent's output rate, in tokens per second
+TOKENS_PER_SECOND_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+# Why the server played the agent's move: it hit the deadline, its turn ended without a move, or
+# its run failed (e.g. the LLM request errored). Each leaves its own note in the agent's thread.
+FALLBACK_NOTES = {
+  "timeout": "I didn't make my move in time",
+  "no_move": "I ended my turn without making a move",
+  "error": "My turn failed before I could move",
+}
+FALLBACK_REASONS = tuple(FALLBACK_NOTES)
 
 
 class TicTacToeManager:
@@ -24,53 +90,379 @@ class TicTacToeManager:
 
   def __init__(self, sio: AsyncServer):
     self.sio = sio
-    self.game_sessions: dict[str, GameSession] = {}
+    self.game_sessions: SessionRegistry[GameSession] = SessionRegistry(
+      idle_ttl=settings.SESSION_IDLE_TTL_SECONDS,
+      max_sessions=settings.SESSION_MAX_COUNT,
+      on_evict=self._on_session_evicted,
+    )
+    self.agent_pool = AgentPool(self._create_agent, max_idle=settings.AGENT_POOL_MAX_IDLE)
+    self.mailboxes: dict[str, Mailbox] = {}
+    # Per-client send buffers, from connect to disconnect
+    self.outbound: dict[str, OutboundChannel] = {}
+    # Process-wide LLM admission control shared by every session's agent runs
+    self.llm_scheduler = llm_scheduler
+    self.mailbox_rejections = {
+      reason: metrics.counter(
+        "session_mailbox_rejected_total", "Socket events refused by a mailbox", {"reason": reason}
+      )
+      for reason in ("move_pending", "queue_full")
+    }
+    # Shared store so any worker can pick up a session (None keeps sessions in-process only)
+    self.session_store = create_session_store(
+      settings.SESSION_STORE_URL, ttl=settings.SESSION_IDLE_TTL_SECONDS
+    )
+    # Deadline for the agent to call agent_make_move before the solver moves for it (0 disables)
+    self.agent_move_timeout = settings.AGENT_MOVE_TIMEOUT_SECONDS
+    self.user_move_seconds = {
+      phase: metrics.histogram(
+        "user_move_seconds", "Time spent handling a human move, by phase", {"phase": phase}
+      )
+      for phase in USER_MOVE_PHASES
+    }
+    # Time from the start of the agent's turn until X is played
+    self.ai_move_seconds = self.user_move_seconds["agent_move"]
+    self.output_tokens_per_second = metrics.histogram(
+      "agent_output_tokens_per_second",
+      "Output tokens per second of agent turns",
+      buckets=TOKENS_PER_SECOND_BUCKETS,
+    )
+    self.llm_errors: dict[str, object] = {}
+    # Spans for each human move (no-ops unless tracing is configured)
+    self.tracer = tracer
+    # Socket traffic by event
+    self.connections = metrics.gauge("socket_connections", "Connected socket clients")
+    self.events_emitted: dict[str, object] = {}
+    self.fallback_moves = {
+      reason: metrics.counter(
+        "agent_move_fallbacks_total", "Moves played by the engine for the agent", {"reason": reason}
+      )
+      for reason in FALLBACK_REASONS
+    }
+    # Speculative turns: runs per session (0 disables) and in flight across all sessions
+    self.speculation_top_k = settings.AGENT_SPECULATION_TOP_K
+    self.speculation_max_runs = settings.AGENT_SPECULATION_MAX_RUNS
+    self.speculative_runs = 0
+    self.speculation_results = {
+      result: metrics.counter(
+        "agent_speculation_turns_total",
+        "Agent turns by whether a speculative run for the human's move was adopted",
+        {"result": result},
+      )
+      for result in ("hit", "miss")
+    }
+    self.speculation_wasted_tokens = metrics.counter(
+      "agent_speculation_wasted_tokens_total", "Tokens reported by discarded speculative runs"
+    )
+    self.speculation_saved_seconds = metrics.histogram(
+      "agent_speculation_saved_seconds", "Agent turn time already done when a run is adopted"
+    )
+    self.token_counters = {
+      kind: metrics.counter("agent_tokens_total", "LLM tokens used by agent turns", {"kind": kind})
+      for kind in ("input", "cached_input", "output")
+    }
     self._register_handlers()
 
   def _register_handlers(self) -> None:
     """Register all socket event listeners."""
     self.sio.on("connect", self.handle_connect)
-    self.sio.on("GAME_RESET", self.handle_game_initialization)
-    self.sio.on("USER_MOVE", self.handle_user_move)
-    self.sio.on("post_game_query", self.handle_post_game_query)
+    self.sio.on("disconnect", self.handle_disconnect)
+    # Game events go through the session's mailbox and are handled one at a time, in order
+    self.sio.on("GAME_RESET", self._counted("GAME_RESET", self.enqueue_game_reset))
+    self.sio.on("USER_MOVE", self._counted("USER_MOVE", self.enqueue_user_move))
+    self.sio.on("BOARD_SYNC", self._counted("BOARD_SYNC", self.handle_board_sync))
+    self.sio.on("post_game_query", self._counted("post_game_query", self.enqueue_post_game_query))
 
-  def _create_agent_move_tool(self, sid: str, game: TicTacToe):
-    """Create a session-specific tool for agent moves with socket emission."""
+  @staticmethod
+  def _counted(event: str, handler):
+    """Wrap a socket event handler to count the events it receives."""
+    received = metrics.counter(
+      "socket_events_received_total", "Socket events received from clients", {"event": event}
+    )
 
-    async def agent_make_move(position: int) -> dict:
-      """Agent tool: Make X move at position, update game, and emit socket events."""
-      # Make the move
-      result = game.take_X_move(position)
+    async def counted(sid: str, *args):
+      received.inc()
+      return await handler(sid, *args)
 
-      if not result.success:
-        return result.model_dump(mode="json")
-
-      # Emit board update to frontend
-      # Use Pydantic's model_dump with mode='json' to automatically serialize enums
-      result_dict = result.model_dump(mode="json")
-      await self.sio.emit(
-        "AI_TOOL_EXECUTED",
-        {
-          "message": result_dict["message"],
-          "board_state": result_dict["board_state"],
-          "status": result_dict["status"],
-        },
-        to=sid,
+    return counted
+
+  # Mailboxes: the socket handlers above only queue work (coalescing duplicates and letting a
+  # reset or new question cut short what it supersedes); a per-session worker runs it.
+  def _mailbox(self, sid: str) -> Mailbox:
+    mailbox = self.mailboxes.get(sid)
+    if mailbox is None:
+      mailbox = self.mailboxes[sid] = Mailbox(sid, maxsize=settings.SESSION_MAILBOX_SIZE)
+    return mailbox
+
+  async def _reject(self, sid: str, event: str, reason: str) -> None:
+    """Tell the client an event was not queued (backpressure), so it can roll back or retry."""
+    self.mailbox_rejections[reason].inc()
+    depth = self.mailboxes[sid].depth if sid in self.mailboxes else 0
+    await self._emit("BUSY", {"event": event, "reason": reason, "depth": depth}, to=sid)
+
+  async def enqueue_user_move(self, sid: str, data: dict = {}):
+    """Queue a USER_MOVE; a repeat of a queued move is coalesced, a different one rejected."""
+    mailbox = self._mailbox(sid)
+    position = data.get("position") if isinstance(data, dict) else None
+    queued = mailbox.queued("USER_MOVE")
+    if queued:
+      if all(envelope.key == position for envelope in queued):
+        return  # Double-click on the same cell: one move is already waiting
+      await self._reject(sid, "USER_MOVE", "move_pending")
+      return
+    if mailbox.post("USER_MOVE", lambda: self.handle_user_move(sid, data), position) is None:
+      await self._reject(sid, "USER_MOVE", "queue_full")
+
+  async def enqueue_game_reset(self, sid: str, data: dict = {}):
+    """Queue a GAME_RESET, first cutting short the run and the queued events it supersedes."""
+    mailbox = self._mailbox(sid)
+    game_session = self.game_sessions.get(sid)
+    if game_session:
+      self._stop_agent_runs(game_session)
+    mailbox.interrupt(("USER_MOVE", "post_game_query"))
+    mailbox.drop(("USER_MOVE", "post_game_query", "GAME_RESET"))
+    if mailbox.post("GAME_RESET", lambda: self.handle_game_initialization(sid, data)) is None:
+      await self._reject(sid, "GAME_RESET", "queue_full")
+
+  async def enqueue_post_game_query(self, sid: str, data: dict = {}):
+    """Queue a question, interrupting the answer in flight; a newer one replaces a queued one."""
+    mailbox = self._mailbox(sid)
+    mailbox.interrupt(("post_game_query",))
+    call = lambda: self.handle_post_game_query(sid, data)  # noqa: E731
+    queued = mailbox.queued("post_game_query")
+    if queued:
+      mailbox.replace(queued[-1], call)
+    elif mailbox.post("post_game_query", call) is None:
+      await self._reject(sid, "post_game_query", "queue_full")
+
+  # Outbound: emits to a client go through its channel, which buffers them while its transport is
+  # backed up, sheds stream chunks past the budget and disconnects a client that can't keep up.
+  def _create_outbound(self, sid: str) -> OutboundChannel:
+    async def emit(event: str, payload) -> None:
+      await self.sio.emit(event, payload, to=sid)
+
+    def transport_depth() -> int:
+      queue = transport_queue(self.sio, sid)
+      return queue.qsize() if queue is not None else 0
+
+    return OutboundChannel(
+      sid,
+      emit,
+      transport_depth,
+      on_slow=lambda: self.sio.disconnect(sid),
+      max_bytes=settings.SOCKET_SEND_BUFFER_BYTES,
+      max_messages=settings.SOCKET_SEND_BUFFER_MESSAGES,
+      max_transport_packets=settings.SOCKET_TRANSPORT_MAX_PACKETS,
+      stall_seconds=settings.SOCKET_SEND_STALL_SECONDS,
+    )
+
+  async def _emit(self, event: str, data=None, to: str | None = None) -> None:
+    """Emit to a client through its outbound channel (directly if it has none)."""
+    emitted = self.events_emitted.get(event)
+    if emitted is None:
+      emitted = self.events_emitted[event] = metrics.counter(
+        "socket_events_emitted_total", "Socket events sent to clients", {"event": event}
+      )
+    emitted.inc()
+    channel = self.outbound.get(to)
+    if channel is None:
+      await self.sio.emit(event, data, to=to)
+    else:
+      await channel.send(event, data)
+
+  def _on_session_evicted(self, sid: str, game_session: GameSession, reason: str) -> None:
+    """Release per-session resources when a session is dropped (disconnect, idle TTL or LRU)."""
+    log.info("Session evicted", extra={"sid": sid, "reason": reason})
+    tasks = self._stop_agent_runs(game_session)
+    mailbox = self.mailboxes.pop(sid, None)
+    if mailbox is not None:
+      tasks += mailbox.close()
+    if not tasks:
+      self.agent_pool.release(game_session.pooled_agent)
+      return
+    # The agent goes back to the pool only once the handler and runs using it have unwound
+    unwound = asyncio.gather(*tasks, return_exceptions=True)
+    unwound.add_done_callback(lambda _: self.agent_pool.release(game_session.pooled_agent))
+
+  def _create_session(self, sid: str, context: ContextBudget | None = None) -> GameSession:
+    """
+    Create and register a fresh game session with a pooled agent bound to its game. `context`
+    overrides the settings' context budget for this session.
+    """
+    game = create_game(settings.GAME_ENGINE)
+    game.reset()  # Sync call, no await
+    batcher = self._create_stream_batcher(sid)
+    usage = TokenUsage()
+    # Check out a pre-built agent with its tools bound to this session's game
+    pooled_agent = self.agent_pool.checkout(sid, game)
+    game_session = GameSession(
+      session_id=sid,
+      game=game,
+      pooled_agent=pooled_agent,
+      thread=AgentThread(),
+      context=context
+      or ContextBudget(
+        settings.AGENT_CONTEXT_MAX_EXCHANGES, settings.AGENT_CONTEXT_MAX_GAME_SUMMARIES
+      ),
+      batcher=batcher,
+      dispatcher=self._create_turn_dispatcher(batcher, usage),
+      usage=usage,
+    )
+    self.game_sessions[sid] = game_session
+    return game_session
+
+  async def _get_session(self, sid: str) -> GameSession | None:
+    """Get the local session, refreshed from the store when another worker saved a newer one."""
+    game_session = self.game_sessions.get(sid)
+    if self.session_store is None:
+      return game_session
+    stored = await self.session_store.load(sid, game_session.version if game_session else None)
+    if stored is None or stored[1] is None:
+      return game_session
+    version, blob = stored
+    game_state, thread = await decode_session(blob)
+    if game_session is None:
+      game_session = self._create_session(sid)
+    # Restore in place so the pooled agent's tools stay bound to the same game object
+    game_session.game.load_state(game_state)
+    game_session.thread = thread
+    game_session.version = version
+    return game_session
+
+  async def _save_session(self, game_session: GameSession) -> None:
+    """Write the session to the session store (if configured) after it changed."""
+    if self.session_store is None:
+      return
+    blob = await encode_session(game_session.game, game_session.thread)
+    game_session.version = await self.session_store.save(game_session.session_id, blob)
+
+  def _create_stream_batcher(self, sid: str) -> StreamBatcher:
+    """Create a session-specific batcher that coalesces agent stream chunks before emitting."""
+
+    async def emit(event: str, payload: dict) -> None:
+      await self._emit(event, payload, to=sid)
+
+    return StreamBatcher(
+      emit,
+      max_delay_ms=settings.STREAM_BATCH_MAX_DELAY_MS,
+      max_bytes=settings.STREAM_BATCH_MAX_BYTES,
+      max_tokens=settings.STREAM_BATCH_MAX_TOKENS,
+    )
+
+  def _create_turn_dispatcher(self, batcher: StreamBatcher, usage: TokenUsage) -> StreamDispatcher:
+    """Create the handler table routing agent turn content to socket events (via the batcher)."""
+    return StreamDispatcher(
+      {
+        "text_reasoning": emit_as_update(batcher.add, "AGENT_REASONING_CHUNK"),
+        "text": emit_as_update(batcher.add, "AGENT_STREAM_TOKEN"),
+        "function_call": emit_as_update(batcher.add, "AGENT_FUNCTION_CALL"),
+        "function_result": emit_as_update(batcher.add, "AGENT_FUNCTION_RESULT"),
+        "game_over": emit_as_update(batcher.add, "AGENT_GAME_OVER"),
+        "usage": usage.handle,
+      }
+    )
+
+  def _create_query_dispatcher(self, sid: str, usage: TokenUsage) -> StreamDispatcher:
+    """Create the handler table streaming post-game answers to the client as ai_message."""
+
+    async def emit_text(content: dict, update: dict) -> None:
+      await self._emit("ai_message", {"text": content.get("text", "")}, to=sid)
+
+    return StreamDispatcher({"text": emit_text, "usage": usage.handle})
+
+  def _admission(self, game_session: GameSession, priority: int, event: str | None = None):
+    """
+    A slot from the LLM scheduler for one of the session's agent runs, charged the tokens of its
+    last run. If the run has to wait, the client is sent QUEUED with its place in line.
+    """
+    sid = game_session.session_id
+    on_queued = None
+    if event is not None:
+
+      async def on_queued(position: int) -> None:
+        await self._emit("QUEUED", {"event": event, "position": position}, to=sid)
+
+    estimate = game_session.run_tokens or settings.LLM_RUN_TOKEN_ESTIMATE
+    return self.llm_scheduler.slot(sid, priority, estimate, on_queued)
+
+  @staticmethod
+  def _settle(grant: Grant, game_session: GameSession, usage: TokenUsage) -> None:
+    """Charge the run's actual usage, if it reported any, and remember it for the next run."""
+    if usage.requests:
+      grant.tokens = game_session.run_tokens = usage.total_tokens
+
+  def _create_agent(self, binding: AgentBinding) -> ChatAgent:
+    """Build a poolable agent whose tools act on whatever session the binding points at."""
+    return create_tic_tac_toe_agent(
+      binding,
+      self._create_agent_move_tool(binding),
+      board_format=settings.AGENT_BOARD_FORMAT,
+      prompt_cache_key=settings.AGENT_PROMPT_CACHE_KEY,
+    )
+
+  async def _apply_agent_move(self, sid: str, game: TicTacToe, position: int) -> MoveResult:
+    """Make an X move (for the agent's tool or the fallback engine) and emit socket events."""
+    game_session = self.game_sessions.get(sid)
+    generation = _run_generation.get()
+    if generation is not None and (game_session is None or game_session.generation != generation):
+      # A run that outlived its game (reset or disconnect) must not touch the new one
+      return MoveResult(
+        success=False,
+        status=game.status,
+        message="The game this move was for was reset or closed; the move was discarded.",
+        board_state=game.get_board(),
       )
+    # Make the move
+    result = game.take_X_move(position)
+
+    if not result.success:
+      return result
+
+    # Flush buffered commentary so it reaches the client before the move
+    if game_session:
+      await game_session.batcher.flush()
+      if game_session.turn_started_at is not None:
+        self.ai_move_seconds.observe(time.perf_counter() - game_session.turn_started_at)
+        game_session.turn_started_at = None
+    with self.tracer.start_as_current_span("emit"):
+      # Emit just the changed cell to the frontend
+      await self._emit("BOARD_DELTA", self._board_delta(game, position, Player.X), to=sid)
 
       # Check if game is over and emit appropriate event
       status, winner = game.get_game_status()
       if status != GameStatus.ONGOING:
         if status == GameStatus.DRAW:
-          await self.sio.emit("GAME_OVER_RESULT", "Tie", to=sid)
+          await self._emit("GAME_OVER_RESULT", "Tie", to=sid)
         elif winner == Player.X:
-          await self.sio.emit("GAME_OVER_RESULT", "AI wins", to=sid)
+          await self._emit("GAME_OVER_RESULT", "AI wins", to=sid)
         elif winner == Player.O:
-          await self.sio.emit("GAME_OVER_RESULT", "Human wins", to=sid)
+          await self._emit("GAME_OVER_RESULT", "Human wins", to=sid)
         else:
-          await self.sio.emit("ERROR", {"message": "Game over reason not found"}, to=sid)
+          await self._emit("ERROR", {"message": "Game over reason not found"}, to=sid)
+
+    return result
+
+  # Board sync protocol: every board change bumps game.version and goes out as a one-cell
+  # BOARD_DELTA; a full BOARD_SNAPSHOT is only sent on connect, reset, or a client's BOARD_SYNC.
+  @staticmethod
+  def _board_delta(game: TicTacToe, position: int, player: Player) -> dict:
+    return {"v": game.version, "pos": position, "mark": player.value, "status": game.status.value}
 
-      return result.model_dump(mode="json")
+  @staticmethod
+  def _board_snapshot(game: TicTacToe) -> dict:
+    board = [player.value if player is not None else None for player in game.get_board()]
+    return {"v": game.version, "board": board, "status": game.status.value}
+
+  def _create_agent_move_tool(self, binding: AgentBinding):
+    """Create a binding-aware tool for agent moves with socket emission."""
+
+    async def agent_make_move(position: int) -> dict:
+      """Agent tool: Make X move at position, update game, and emit socket events."""
+      attributes = {"position": position, "speculative": binding.on_move is not None}
+      with self.tracer.start_as_current_span("tool.agent_make_move", attributes=attributes):
+        if binding.on_move is not None:  # Speculative run: the move stays on its forked game
+          return await binding.on_move(position)
+        result = await self._apply_agent_move(binding.sid, binding.game, position)
+        return result.to_json()
 
     # Set function metadata for agent framework
     agent_make_move.__name__ = "agent_make_move"
@@ -84,108 +476,377 @@ class TicTacToeManager:
   async def handle_connect(self, sid: str, environ: dict):
     """Handle client connection and initialize game session."""
     # User authentication goes here
-    print(f"Client connected: {sid}")
+    log.info("Client connected", extra={"sid": sid})
+    self.connections.inc()
+    self.outbound[sid] = self._create_outbound(sid)
     await self.handle_game_initialization(sid)
 
+  async def handle_disconnect(self, sid: str, *args):
+    """Handle client disconnection - dropping the session (its agent returns to the pool)."""
+    log.info("Client disconnected", extra={"sid": sid})
+    self.connections.dec()
+    channel = self.outbound.pop(sid, None)
+    if channel is not None:
+      channel.close()
+    mailbox = self.mailboxes.pop(sid, None)
+    if mailbox is not None:
+      await mailbox.aclose()
+    game_session = self.game_sessions.get(sid)
+    if game_session:
+      await self._cancel_agent_runs(game_session)
+    self.game_sessions.pop(sid, None)
+    if self.session_store is not None:
+      await self.session_store.delete(sid)
+
   # Initialize a new game session
   async def handle_game_initialization(self, sid: str, data: dict = {}):
     """Handle game initialization events - killing any running thread and resetting the game session."""
-    print(f"Resetting game for client: {sid}")
+    log.info("Resetting game", extra={"sid": sid})
     # 1. Find the game session by sid in the game_sessions dictionary (creating it, if it doesn't exist)
-    game_session = self.game_sessions.get(sid)
+    game_session = await self._get_session(sid)
     if not game_session:
       # Initialize the game services (game, agent, agent_thread)
-      game = TicTacToe()
-      game.reset()  # Sync call, no await
-      # Create session-specific agent move tool
-      agent_move_tool = self._create_agent_move_tool(sid, game)
-      agent = create_tic_tac_toe_agent(game, agent_move_tool)
-      # Create the game session
-      game_session = GameSession(
-        session_id=sid,
-        game=game,
-        agent=agent,
-        thread=AgentThread(),
-      )
-      self.game_sessions[sid] = game_session
+      game_session = self._create_session(sid)
     else:
-      # Reset the game in the game session
-      # TODO: Kill running thread if necessary
+      # Stop the agent's turn or answer still running for the old game, then reset the game
+      await self._cancel_agent_runs(game_session)
+      # The agent stays bound to the same game object, so it is reused as-is.
+      # The finished game is kept in the thread as a one-line summary from its log.
+      await game_session.context.close_game(game_session.thread, game_session.game)
       game_session.game.reset()  # Sync call
-      # Recreate agent move tool for the reset game
-      agent_move_tool = self._create_agent_move_tool(sid, game_session.game)
-      game_session.agent = create_tic_tac_toe_agent(game_session.game, agent_move_tool)
-    # Emit updated board state after reset
-    board = game_session.game.get_board()
-    serialized_board = [player.value if player is not None else None for player in board]
-    await self.sio.emit("BOARD_STATE_UPDATED", serialized_board, to=sid)
+    await self._save_session(game_session)
+    # Emit the full board after reset
+    await self._emit("BOARD_SNAPSHOT", self._board_snapshot(game_session.game), to=sid)
+    await self._speculate(game_session)
     return True
 
-  # Handle a user move
-  async def handle_user_move(self, sid: str, data: dict = {}):
-    """Handle user move events."""
-    # 0. Validate the user move data received from the client
-    user_move = PlayerMoveRequest(**data)
-    position = PlayerMoveRequest(**data).position
-    # 1. Find the game session by sid in the game_sessions dictionary (creating if not exists by calling initialization)
-    game_session = self.game_sessions.get(sid)
+  async def handle_board_sync(self, sid: str, data: dict = {}):
+    """Handle a client's report of a version gap by sending a snapshot (unless it's current)."""
+    game_session = await self._get_session(sid)
     if not game_session:
       await self.handle_game_initialization(sid)
-      game_session = self.game_sessions[sid]
-    # 2. Make the move for the user (human as O)
-    result = game_session.game.take_O_move(position)
-    if not result.success:
-      await self.sio.emit("ERROR", {"message": result.message}, to=sid)
       return
-    print(f"🔧 Move result: {result}")
-    # 3. Emit the results of the user's move to the client
-    await self.sio.emit("USER_MOVE_RESULT", user_move.model_dump(), to=sid)
-    # Use Pydantic's model_dump with mode='json' to automatically serialize enums
-    result_dict = result.model_dump(mode="json")
-    await self.sio.emit("BOARD_STATE_UPDATED", result_dict["board_state"], to=sid)
-    # 4. If the game is over, emit the appropriate result to the client (win/loss/tie)
-    status, winner = game_session.game.get_game_status()
+    if data.get("v") != game_session.game.version:
+      await self._emit("BOARD_SNAPSHOT", self._board_snapshot(game_session.game), to=sid)
+
+  # Handle a user move
+  async def handle_user_move(self, sid: str, data: dict = {}):
+    """Handle user move events."""
+    started = time.perf_counter()
+    with self.tracer.start_as_current_span("user_move", attributes={SESSION_ID_ATTR: sid}) as span:
+      try:
+        await self._handle_user_move(sid, data, started, span)
+      finally:
+        self.user_move_seconds["total"].observe(time.perf_counter() - started)
+
+  async def _handle_user_move(self, sid: str, data: dict, started: float, span: trace.Span):
+    with self.tracer.start_as_current_span("validate"):
+      # 0. Validate the user move data received from the client
+      user_move = PlayerMoveRequest(**data)
+      position = PlayerMoveRequest(**data).position
+      # 1. Find the game session by sid in the game_sessions dictionary (creating if not exists by calling initialization)
+      game_session = await self._get_session(sid)
+      if not game_session:
+        await self.handle_game_initialization(sid)
+        game_session = self.game_sessions[sid]
+      # 2. Make the move for the user (human as O)
+      result = game_session.game.take_O_move(position)
+      if not result.success:
+        await self._emit("ERROR", {"message": result.message}, to=sid)
+        return
+    span.set_attribute(TURN_ATTR, game_session.game.get_board().count(Player.O))
+    log.debug("Human move: %s", result, extra={"sid": sid})
+    validated = time.perf_counter()
+    self.user_move_seconds["validate"].observe(validated - started)
+    with self.tracer.start_as_current_span("emit"):
+      # 3. Confirm the user's move to the client as a single delta
+      await self._emit(
+        "BOARD_DELTA", self._board_delta(game_session.game, position, Player.O), to=sid
+      )
+      # 4. If the game is over, emit the appropriate result to the client (win/loss/tie)
+      status, winner = game_session.game.get_game_status()
+      if status != GameStatus.ONGOING:
+        if status == GameStatus.DRAW:
+          await self._emit("GAME_OVER_RESULT", "Tie", to=sid)
+        elif winner == Player.X:
+          await self._emit("GAME_OVER_RESULT", "AI wins", to=sid)
+        elif winner == Player.O:
+          await self._emit("GAME_OVER_RESULT", "Human wins", to=sid)
+        else:
+          await self._emit("ERROR", {"message": "Game over reason not found"}, to=sid)
+    self.user_move_seconds["emit"].observe(time.perf_counter() - validated)
     if status != GameStatus.ONGOING:
-      if status == GameStatus.DRAW:
-        await self.sio.emit("GAME_OVER_RESULT", "Tie", to=sid)
-      elif winner == Player.X:
-        await self.sio.emit("GAME_OVER_RESULT", "AI wins", to=sid)
-      elif winner == Player.O:
-        await self.sio.emit("GAME_OVER_RESULT", "Human wins", to=sid)
-      else:
-        await self.sio.emit("ERROR", {"message": "Game over reason not found"}, to=sid)
+      self._discard_speculations(game_session)
+      await self._save_session(game_session)
       return
     # 5. If the game is not over, run the agent's response to the user's move
     # The agent will call agent_make_move tool which handles emissions
     if game_session.game.get_current_turn() == "X":
-      message_text = (
-        f"The user has placed their marker at position {user_move.position}. Your turn!"
+      message_text = self._turn_message(game_session.game, user_move.position)
+      speculation = self._adopt_speculation(game_session, position)
+      log.debug("Executing agent turn", extra={"sid": sid})
+      await game_session.context.trim(game_session.thread)
+      game_session.usage.reset()
+      turn_started = time.perf_counter()
+      try:
+        await self._run_agent_turn(game_session, message_text, speculation)
+      except AgentRunCancelledError:
+        # A reset or disconnect took over the session; its output is already discarded
+        log.info("Agent turn cancelled", extra={"sid": sid})
+        return
+      except AgentTimeoutError as e:
+        log.warning("%s - playing an engine move instead", e, extra={"sid": sid})
+        await self._play_fallback_move(game_session, "timeout", prompt=message_text)
+      except Exception as e:
+        # Anything else the run raised would leave the game stuck on X's turn
+        if self._awaiting_agent_move(game_session):
+          log.warning(
+            "Agent turn failed (%r) - playing an engine move instead", e, extra={"sid": sid}
+          )
+          await self._play_fallback_move(game_session, "error", prompt=message_text)
+        else:
+          log.warning("Agent turn failed after its move: %r", e, extra={"sid": sid})
+      else:
+        if self._awaiting_agent_move(game_session):
+          log.warning(
+            "Agent finished its turn without moving - playing an engine move instead",
+            extra={"sid": sid},
+          )
+          await self._play_fallback_move(game_session, "no_move")
+      self._record_turn_usage(game_session, time.perf_counter() - turn_started)
+      # Emit whatever is still buffered once the stream completes
+      await game_session.batcher.flush()
+    await self._save_session(game_session)
+    await self._speculate(game_session)
+
+  @staticmethod
+  def _turn_message(game: TicTacToe, position: int) -> str:
+    """The agent's turn prompt after the human played `position` on `game`."""
+    # Only this last message changes between turns, so the rest of the context stays cacheable
+    board = render_board(game, settings.AGENT_BOARD_FORMAT)
+    return f"The user has placed their marker at position {position}.\nBoard:\n{board}\nYour turn!"
+
+  # Speculation: while the human thinks, agent turns for the likeliest human moves run on forks
+  # of the game and thread (see speculation.py); the real move adopts its run or starts fresh.
+  async def _speculate(self, game_session: GameSession) -> None:
+    """Start speculative runs for the top predicted human moves, within the process budget."""
+    game = game_session.game
+    if not self.speculation_top_k or game.status != GameStatus.ONGOING:
+      return
+    if game.current_player != Player.O or game_session.speculations:
+      return
+    # Fork from the thread as the real turn will see it
+    await game_session.context.trim(game_session.thread)
+    store = game_session.thread.message_store
+    messages = await store.list_messages() if store is not None else []
+    solver = get_solver(settings.SOLVER_TABLE_PATH)
+    for position in predict_human_moves(game.get_board(), self.speculation_top_k, solver):
+      if self.speculative_runs >= self.speculation_max_runs:
+        break
+      fork = type(game)()
+      fork.load_state(game.export_state())
+      fork.take_O_move(position)
+      if fork.get_game_status()[0] != GameStatus.ONGOING:
+        continue  # The game would end on the human's move: no agent turn to run
+      run = SpeculativeRun(
+        position, fork, fork_thread(messages), self._turn_message(fork, position)
+      )
+      pooled = self.agent_pool.checkout(game_session.session_id, fork, on_move=run.make_move)
+      self.speculative_runs += 1
+      run.start(pooled, self._on_speculation_done, self._admission(game_session, SPECULATIVE))
+      game_session.speculations[position] = run
+
+  # Cancellation: a reset or disconnect bumps the session's generation and cancels its runs.
+  # Runs close their upstream stream as they unwind, and any move a run still manages to make
+  # is dropped by _apply_agent_move because its generation is out of date.
+  def _stop_agent_runs(self, game_session: GameSession) -> list[asyncio.Task]:
+    """Invalidate the session's agent runs and drop their unsent output; returns the tasks."""
+    game_session.generation += 1
+    self._discard_speculations(game_session)
+    tasks = [
+      task
+      for task in (game_session.turn_task, game_session.query_task)
+      if task is not None and not task.done()
+    ]
+    for task in tasks:
+      task.cancel()
+    game_session.batcher.discard()
+    game_session.turn_started_at = None
+    return tasks
+
+  async def _cancel_agent_runs(self, game_session: GameSession) -> None:
+    """Stop the session's agent runs and wait for them to unwind."""
+    tasks = self._stop_agent_runs(game_session)
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+  @staticmethod
+  async def _await_run(run: asyncio.Task) -> None:
+    """Await an agent run task; its cancellation by another handler is AgentRunCancelledError."""
+    try:
+      await run
+    except asyncio.CancelledError:
+      if run.cancelled() and not asyncio.current_task().cancelling():
+        raise AgentRunCancelledError("Agent run was cancelled") from None
+      raise
+
+  def _on_speculation_done(self, run: SpeculativeRun) -> None:
+    self.speculative_runs -= 1
+    self.agent_pool.release(run.pooled)
+
+  def _discard_speculations(
+    self, game_session: GameSession, keep: SpeculativeRun | None = None
+  ) -> None:
+    """Cancel the session's speculative runs (except `keep`), counting their tokens as wasted."""
+    for run in game_session.speculations.values():
+      if run is not keep:
+        run.cancel()
+        self.speculation_wasted_tokens.inc(run.usage.input_tokens + run.usage.output_tokens)
+    game_session.speculations.clear()
+
+  def _adopt_speculation(self, game_session: GameSession, position: int) -> SpeculativeRun | None:
+    """Take the speculative run for the human's actual move, if any, discarding the rest."""
+    if not game_session.speculations:
+      return None
+    run = game_session.speculations.get(position)
+    if run is not None and not run.admitted:
+      run = None  # Still waiting behind other sessions' runs: start fresh at turn priority
+    self._discard_speculations(game_session, keep=run)
+    if run is None:
+      self.speculation_results["miss"].inc()
+      return None
+    self.speculation_results["hit"].inc()
+    self.speculation_saved_seconds.observe(run.saved_seconds)
+    return run
+
+  def _record_turn_usage(self, game_session: GameSession, seconds: float) -> None:
+    usage = game_session.usage
+    if not usage.requests:
+      return
+    log.info("Agent turn usage: %s", usage.report(), extra={"sid": game_session.session_id})
+    self.token_counters["input"].inc(usage.input_tokens)
+    self.token_counters["cached_input"].inc(usage.cached_input_tokens)
+    self.token_counters["output"].inc(usage.output_tokens)
+    if seconds > 0:
+      self.output_tokens_per_second.observe(usage.output_tokens / seconds)
+
+  def _first_token(self, game_session: GameSession) -> None:
+    """Time the agent's first stream update of a turn (only while it has yet to move)."""
+    if game_session.turn_started_at is not None:
+      elapsed = time.perf_counter() - game_session.turn_started_at
+      self.user_move_seconds["agent_first_token"].observe(elapsed)
+      trace.get_current_span().add_event("first_update")
+
+  def _count_llm_error(self, error: Exception) -> None:
+    name = type(error).__name__
+    counter = self.llm_errors.get(name)
+    if counter is None:
+      counter = self.llm_errors[name] = metrics.counter(
+        "llm_errors_total", "Agent runs that failed, by exception type", {"error": name}
       )
-      print("Executing agent turn...")
-      async for update in game_session.agent.run_stream(
+    counter.inc()
+
+  @staticmethod
+  def _awaiting_agent_move(game_session: GameSession) -> bool:
+    game = game_session.game
+    return game.status == GameStatus.ONGOING and game.current_player == Player.X
+
+  async def _stream_agent_turn(self, game_session: GameSession, message_text: str) -> None:
+    _run_generation.set(game_session.generation)
+    # Live turns go ahead of answers and speculation; time spent queued counts to the deadline
+    async with self._admission(game_session, TURN, "USER_MOVE") as grant:
+      trace.get_current_span().add_event("admitted")
+      stream = game_session.agent.run_stream(
         thread=game_session.thread,
         messages=[ChatMessage(role="user", text=message_text)],
-      ):
-        # Stream agent updates to frontend (tool handles board/game-over emissions)
-        print(f"Agent stream token: {update.to_dict()}")
-        contents = update.to_dict().get("contents", [])
-        update_type = contents[0].get("type", "") if contents else ""
-        # Reasoning Chunks
-        if update_type == "text_reasoning":
-          await self.sio.emit("AGENT_REASONING_CHUNK", update.to_dict(), to=sid)
-        # Text Chunks
-        if update_type == "text":
-          await self.sio.emit("AGENT_STREAM_TOKEN", update.to_dict(), to=sid)
-        # Function Calling and Results
-        elif update_type == "function_call":
-          await self.sio.emit("AGENT_FUNCTION_CALL", update.to_dict(), to=sid)
-        elif update_type == "function_result":
-          await self.sio.emit("AGENT_FUNCTION_RESULT", update.to_dict(), to=sid)
-
-        elif update_type == "game_over":
-          await self.sio.emit("AGENT_GAME_OVER", update.to_dict(), to=sid)
+      )
+      first = True
+      with self.tracer.start_as_current_span("agent.run_stream") as span:
+        phases = StreamPhases(self.tracer, span)
+        try:
+          async with aclosing(stream):  # Cancelling closes the upstream response right away
+            async for update in stream:
+              if first:
+                first = False
+                self._first_token(game_session)
+              phases.update(update.contents)
+              # Stream agent updates to frontend (tool handles board/game-over emissions)
+              update_dict = await game_session.dispatcher.dispatch(update)
+              if stream_log_enabled(game_session.session_id):
+                stream_log.debug(
+                  "Agent stream token: %s", update_dict, extra={"sid": game_session.session_id}
+                )
+        except Exception as e:
+          self._count_llm_error(e)
+          raise
+        finally:
+          phases.end()
+          self._settle(grant, game_session, game_session.usage)
+
+  async def _replay_speculation(self, game_session: GameSession, run: SpeculativeRun) -> None:
+    """Play an adopted speculative run into the session as if it were streaming live."""
+    _run_generation.set(game_session.generation)
+    self._first_token(game_session)  # Adopted runs have already started streaming
+    try:
+      async for event in run.events():
+        if isinstance(event, int):
+          await self._apply_agent_move(game_session.session_id, game_session.game, event)
         else:
-          pass
+          await game_session.dispatcher.dispatch(event)
+      await game_session.thread.on_new_messages(run.new_messages())
+    finally:
+      run.cancel()  # When the deadline cancels the replay
+
+  async def _run_agent_turn(
+    self, game_session: GameSession, message_text: str, speculation: SpeculativeRun | None = None
+  ) -> None:
+    """
+    Stream the agent's turn (or replay the adopted `speculation` of it). If it hasn't moved by
+    the deadline, the stream is cancelled and AgentTimeoutError raised; once it has moved, its
+    commentary may run past the deadline. AgentRunCancelledError is raised if a reset or
+    disconnect cancels the turn.
+    """
+    attributes = {"speculation": speculation is not None}
+    with self.tracer.start_as_current_span("agent_turn", attributes=attributes):
+      game_session.turn_started_at = time.perf_counter()
+      if speculation is not None:
+        stream = self._replay_speculation(game_session, speculation)
+      else:
+        stream = self._stream_agent_turn(game_session, message_text)
+      turn = asyncio.create_task(stream)
+      game_session.turn_task = turn
+      try:
+        done, _ = await asyncio.wait({turn}, timeout=self.agent_move_timeout or None)
+        if turn not in done and self._awaiting_agent_move(game_session):
+          turn.cancel()
+          with suppress(asyncio.CancelledError):
+            await turn
+          raise AgentTimeoutError(f"Agent did not move within {self.agent_move_timeout}s")
+        await self._await_run(turn)
+      finally:
+        if not turn.done():
+          turn.cancel()
+        if game_session.turn_task is turn:
+          game_session.turn_task = None
+
+  async def _play_fallback_move(
+    self, game_session: GameSession, reason: str, prompt: str | None = None
+  ) -> None:
+    """
+    Play a perfect-play move for X and note it in the agent thread so the agent's memory matches
+    the board. `prompt` is the turn's user message, recorded when the run was cancelled before
+    the framework could save it.
+    """
+    self.fallback_moves[reason].inc()
+    game = game_session.game
+    position = random.choice(get_solver(settings.SOLVER_TABLE_PATH).best_moves(game.get_board()))
+    with self.tracer.start_as_current_span("fallback_move", attributes={"reason": reason}):
+      await self._apply_agent_move(game_session.session_id, game, position)
+    note = ChatMessage(
+      role="assistant",
+      text=f"({FALLBACK_NOTES[reason]}, so X was played at position {position} for me.)",
+    )
+    messages = [ChatMessage(role="user", text=prompt), note] if prompt else [note]
+    await game_session.thread.on_new_messages(messages)
 
   async def handle_post_game_query(self, sid: str, data: dict = {}):
     """Handle post-game query events."""
@@ -193,16 +854,42 @@ class TicTacToeManager:
     if not query:
       return
     # Find the game session
-    game_session = self.game_sessions.get(sid)
+    game_session = await self._get_session(sid)
     if not game_session:
       await self.handle_game_initialization(sid)
       game_session = self.game_sessions[sid]
-    # Run the agent with the query and stream response as ai_message
-    async for update in game_session.agent.run_stream(
-      thread=game_session.thread,
-      messages=[ChatMessage(role="user", text=query)],
-    ):
-      await self.sio.emit(
-        "ai_message", {"text": update.to_dict().get("text", "")}, to=sid
-      )  # Assuming update has text
-    # TODO: Adjust based on actual update structure for ai_message
+    # A new question interrupts the answer still streaming (barge-in)
+    if game_session.query_task is not None and not game_session.query_task.done():
+      game_session.query_task.cancel()
+      await asyncio.gather(game_session.query_task, return_exceptions=True)
+    # Run the agent with the query and stream text as ai_message
+    await game_session.context.trim(game_session.thread)
+    answer = asyncio.create_task(self._stream_query(game_session, query))
+    game_session.query_task = answer
+    try:
+      await self._await_run(answer)
+    except AgentRunCancelledError:
+      log.info("Post-game answer interrupted", extra={"sid": sid})
+      return
+    finally:
+      if game_session.query_task is answer:
+        game_session.query_task = None
+    await self._save_session(game_session)
+
+  async def _stream_query(self, game_session: GameSession, query: str) -> None:
+    usage = TokenUsage()
+    dispatcher = self._create_query_dispatcher(game_session.session_id, usage)
+    async with self._admission(game_session, QUERY, "post_game_query") as grant:
+      stream = game_session.agent.run_stream(
+        thread=game_session.thread,
+        messages=[ChatMessage(role="user", text=query)],
+      )
+      try:
+        async with aclosing(stream):
+          async for update in stream:
+            await dispatcher.dispatch(update)
+      except Exception as e:
+        self._count_llm_error(e)
+        raise
+      finally:
+        self._settle(grant, game_session, usage)
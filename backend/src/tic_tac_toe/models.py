@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Literal, Optional
 
@@ -64,3 +65,71 @@ class BoardState(BaseModel):
   game_over_reason: Literal["AI wins", "Human wins", "Tie", None] = Field(
     ..., description="The reason the game is over (AI wins, Human wins, Tie, or None)"
   )
+
+
+# Hot-path types returned by the game engine. The pydantic models above stay the API boundary
+# (validation, schemas); these skip validation and cache their JSON-ready form.
+
+
+# Enum `.value` is a descriptor lookup; a dict is several times faster per cell
+_CELL_JSON = {None: None, Player.O: Player.O.value, Player.X: Player.X.value}
+
+
+@dataclass(slots=True)
+class MoveRecord:
+  """Game log entry; `to_model()` gives the GameLogRecord for the API boundary."""
+
+  turn: int
+  player: Player
+  position: int
+  success: bool
+
+  def to_model(self) -> GameLogRecord:
+    return GameLogRecord(
+      turn=self.turn, player=self.player, position=self.position, success=self.success
+    )
+
+
+@dataclass(slots=True, eq=False)
+class MoveResult:
+  """
+  Result of a move or reset. `to_json()` builds the same dict as
+  `BoardUpdateResult.model_dump(mode="json")` once and caches it, so treat that dict as read-only.
+  Compares equal to a BoardUpdateResult with the same fields.
+  """
+
+  success: bool
+  message: str
+  board_state: List[Optional[Player]]
+  status: GameStatus
+  _json: Optional[dict] = field(default=None, init=False, repr=False)
+
+  def _fields(self) -> tuple:
+    return self.success, self.message, self.board_state, self.status
+
+  def __eq__(self, other: object) -> bool:
+    if isinstance(other, MoveResult):
+      return self._fields() == other._fields()
+    if isinstance(other, BoardUpdateResult):
+      return self._fields() == (other.success, other.message, other.board_state, other.status)
+    return NotImplemented
+
+  __hash__ = None
+
+  def to_json(self) -> dict:
+    if self._json is None:
+      self._json = {
+        "success": self.success,
+        "message": self.message,
+        "board_state": [_CELL_JSON[cell] for cell in self.board_state],
+        "status": self.status.value,
+      }
+    return self._json
+
+  def to_model(self) -> BoardUpdateResult:
+    return BoardUpdateResult(
+      success=self.success,
+      message=self.message,
+      board_state=self.board_state,
+      status=self.status,
+    )
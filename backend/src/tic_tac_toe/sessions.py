@@ -0,0 +1,121 @@
+# backend/src/tic_tac_toe/sessions.py
+"""Session registry with idle-TTL and LRU eviction for per-client game state."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Iterator, Optional, TypeVar
+
+from src.utils.metrics import metrics
+
+SessionT = TypeVar("SessionT")
+
+EVICTION_REASONS = ("disconnect", "ttl", "lru")
+
+
+class SessionRegistry(Generic[SessionT]):
+  """
+  Dict-like store of sessions keyed by sid, ordered from least to most recently used.
+  `get` marks a session as used; sessions idle for longer than `idle_ttl` are removed by `sweep`
+  (run periodically by the background sweeper), and adding past `max_sessions` evicts the least
+  recently used one. `on_evict(sid, session, reason)` is called for every removal.
+  """
+
+  def __init__(
+    self,
+    idle_ttl: float = 1800.0,
+    max_sessions: int = 10_000,
+    on_evict: Optional[Callable[[str, SessionT, str], None]] = None,
+    clock: Callable[[], float] = time.monotonic,
+  ):
+    self.idle_ttl = idle_ttl
+    self.max_sessions = max_sessions
+    self.on_evict = on_evict
+    self._clock = clock
+    self._sessions: OrderedDict[str, tuple[SessionT, float]] = OrderedDict()
+    self._sweeper: Optional[asyncio.Task] = None
+    self.live_gauge = metrics.gauge("sessions_live", "Game sessions currently held in memory")
+    self.evictions = {
+      reason: metrics.counter(
+        "sessions_evicted_total", "Sessions removed by reason", {"reason": reason}
+      )
+      for reason in EVICTION_REASONS
+    }
+
+  def __len__(self) -> int:
+    return len(self._sessions)
+
+  def __contains__(self, sid: str) -> bool:
+    return sid in self._sessions
+
+  def __iter__(self) -> Iterator[str]:
+    return iter(self._sessions)
+
+  def __getitem__(self, sid: str) -> SessionT:
+    session = self.get(sid)
+    if session is None:
+      raise KeyError(sid)
+    return session
+
+  def __setitem__(self, sid: str, session: SessionT) -> None:
+    self._sessions[sid] = (session, self._clock())
+    self._sessions.move_to_end(sid)
+    while len(self._sessions) > self.max_sessions:
+      oldest_sid = next(iter(self._sessions))
+      self._evict(oldest_sid, "lru")
+    self.live_gauge.set(len(self._sessions))
+
+  def get(self, sid: str, default: Optional[SessionT] = None) -> Optional[SessionT]:
+    """Get a session, marking it as most recently used."""
+    entry = self._sessions.get(sid)
+    if entry is None:
+      return default
+    self._sessions[sid] = (entry[0], self._clock())
+    self._sessions.move_to_end(sid)
+    return entry[0]
+
+  def pop(self, sid: str, default: Optional[SessionT] = None) -> Optional[SessionT]:
+    """Remove a session on client disconnect."""
+    if sid not in self._sessions:
+      return default
+    return self._evict(sid, "disconnect")
+
+  def _evict(self, sid: str, reason: str) -> SessionT:
+    session, _ = self._sessions.pop(sid)
+    self.evictions[reason].inc()
+    self.live_gauge.set(len(self._sessions))
+    if self.on_evict:
+      self.on_evict(sid, session, reason)
+    return session
+
+  def sweep(self) -> int:
+    """Evict sessions idle for longer than the TTL, oldest first. Returns how many were evicted."""
+    deadline = self._clock() - self.idle_ttl
+    evicted = 0
+    while self._sessions:
+      sid, (_, last_used) = next(iter(self._sessions.items()))
+      if last_used > deadline:
+        break
+      self._evict(sid, "ttl")
+      evicted += 1
+    return evicted
+
+  def start_sweeper(self, interval: float) -> None:
+    """Start the background task that periodically evicts idle sessions."""
+    if self._sweeper is None or self._sweeper.done():
+      self._sweeper = asyncio.create_task(self._sweep_forever(interval))
+
+  async def stop_sweeper(self) -> None:
+    if self._sweeper is None:
+      return
+    self._sweeper.cancel()
+    try:
+      await self._sweeper
+    except asyncio.CancelledError:
+      pass
+    self._sweeper = None
+
+  async def _sweep_forever(self, interval: float) -> None:
+    while True:
+      await asyncio.sleep(interval)
+      self.sweep()
@@ -0,0 +1,156 @@
+# backend/src/tic_tac_toe/solver.py
+"""
+Perfect-play solver table covering every reachable tic-tac-toe position.
+
+The table is a dense array of 3^9 uint16 entries indexed by the board's base-3 key (digit i is
+cell i: 0 empty, 1 O, 2 X). Bits 0-8 hold the optimal moves as a position mask and bits 9-10 the
+game-theoretic value for the player to move, offset by 2 (1 loss, 2 draw, 3 win); 0 marks a
+position that can't arise in a game where O moves first. Write it to a file with
+
+  uv run python -m src.tic_tac_toe.solver solver_table.bin
+"""
+
+import mmap
+import sys
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from src.tic_tac_toe.bitboard import LINES_THROUGH
+from src.tic_tac_toe.models import Player
+
+TABLE_SIZE = 3**9
+POW3 = tuple(3**i for i in range(9))
+CELL_DIGITS = {None: 0, Player.O: 1, Player.X: 2}
+
+FILE_MAGIC = b"TTT1"
+HEADER_SIZE = 8  # Magic, then the entry count as a little-endian uint32
+
+MOVES_MASK = 0x1FF
+VALUE_SHIFT = 9
+
+WIN, DRAW, LOSS = 1, 0, -1
+
+
+def board_key(board: Sequence[Optional[Player]]) -> int:
+  """Base-3 key of a board given as 9 cells of Player or None."""
+  return sum(POW3[i] * CELL_DIGITS[cell] for i, cell in enumerate(board))
+
+
+def _bits_key(x: int, o: int) -> int:
+  return sum(POW3[i] * (1 if o >> i & 1 else 2 if x >> i & 1 else 0) for i in range(9))
+
+
+def _build_entries() -> array:
+  """Negamax over every position reachable from the empty board, memoized by bitboards."""
+  entries = array("H", bytes(2 * TABLE_SIZE))
+
+  @lru_cache(maxsize=None)
+  def solve(mover: int, opponent: int, last_move: int) -> int:
+    """Value of the position for `mover`, after the opponent played `last_move` (-1: none)."""
+    if last_move >= 0 and any(opponent & mask == mask for mask in LINES_THROUGH[last_move]):
+      value, best = LOSS, 0
+    elif mover | opponent == 0x1FF:
+      value, best = DRAW, 0
+    else:
+      value, best = LOSS - 1, 0
+      occupied = mover | opponent
+      for position in range(9):
+        if occupied >> position & 1:
+          continue
+        score = -solve(opponent, mover | 1 << position, position)
+        if score > value:
+          value, best = score, 1 << position
+        elif score == value:
+          best |= 1 << position
+    # O moves first, so O is to move whenever both players have the same number of marks
+    o_to_move = mover.bit_count() == opponent.bit_count()
+    o, x = (mover, opponent) if o_to_move else (opponent, mover)
+    entries[_bits_key(x, o)] = (value + 2) << VALUE_SHIFT | best
+    return value
+
+  solve(0, 0, -1)
+  return entries
+
+
+class SolverTable:
+  """O(1) lookups of position values and optimal moves over a built or memory-mapped table."""
+
+  def __init__(self, entries: Sequence[int], mapping: Optional[mmap.mmap] = None):
+    if len(entries) != TABLE_SIZE:
+      raise ValueError(f"Solver table must have {TABLE_SIZE} entries, got {len(entries)}")
+    self._entries = entries
+    self._mapping = mapping
+
+  @classmethod
+  def build(cls) -> "SolverTable":
+    return cls(_build_entries())
+
+  @classmethod
+  def load(cls, path: str | Path) -> "SolverTable":
+    """Memory-map a table written by `save` (copied into memory on big-endian hosts)."""
+    with open(path, "rb") as file:
+      mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if mapping[:4] != FILE_MAGIC:
+      mapping.close()
+      raise ValueError(f"{path} is not a solver table")
+    count = int.from_bytes(mapping[4:HEADER_SIZE], "little")
+    if sys.byteorder == "little":
+      return cls(memoryview(mapping)[HEADER_SIZE : HEADER_SIZE + 2 * count].cast("H"), mapping)
+    entries = array("H", mapping[HEADER_SIZE : HEADER_SIZE + 2 * count])
+    entries.byteswap()
+    mapping.close()
+    return cls(entries)
+
+  def save(self, path: str | Path) -> None:
+    entries = array("H", self._entries)
+    if sys.byteorder != "little":
+      entries.byteswap()
+    with open(path, "wb") as file:
+      file.write(FILE_MAGIC + len(entries).to_bytes(4, "little"))
+      entries.tofile(file)
+
+  def close(self) -> None:
+    """Release the file mapping of a loaded table."""
+    if self._mapping is not None:
+      self._entries.release()
+      self._mapping.close()
+      self._mapping = None
+
+  def __len__(self) -> int:
+    """Number of reachable positions in the table."""
+    return sum(1 for entry in self._entries if entry)
+
+  def _entry(self, board: Sequence[Optional[Player]]) -> int:
+    entry = self._entries[board_key(board)]
+    if not entry:
+      raise ValueError("Board is not reachable in a game where O moves first")
+    return entry
+
+  def value(self, board: Sequence[Optional[Player]]) -> int:
+    """Game-theoretic value for the player to move: 1 win, 0 draw, -1 loss."""
+    return (self._entry(board) >> VALUE_SHIFT) - 2
+
+  def best_moves(self, board: Sequence[Optional[Player]]) -> List[int]:
+    """Positions that keep the best achievable outcome for the player to move (empty if over)."""
+    moves = self._entry(board) & MOVES_MASK
+    return [position for position in range(9) if moves >> position & 1]
+
+
+_solver: Optional[SolverTable] = None
+
+
+def get_solver(path: str | Path | None = None) -> SolverTable:
+  """Process-wide table: memory-mapped from `path` when it exists, otherwise built on first use."""
+  global _solver
+  if _solver is None:
+    _solver = SolverTable.load(path) if path and Path(path).exists() else SolverTable.build()
+  return _solver
+
+
+if __name__ == "__main__":
+  output = sys.argv[1] if len(sys.argv) > 1 else "solver_table.bin"
+  table = SolverTable.build()
+  table.save(output)
+  print(f"Wrote {len(table)} positions to {output} ({Path(output).stat().st_size} bytes)")
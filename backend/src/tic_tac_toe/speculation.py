@@ -0,0 +1,144 @@
+# backend/src/tic_tac_toe/speculation.py
+"""
+Speculative agent turns, started while the human is thinking.
+
+For each of the likeliest human moves, the agent's reply is run ahead of time on a forked game
+(with that move played) and a forked copy of the thread. Nothing reaches the client: stream
+updates and the agent's move are buffered in order. When the real move arrives, the matching run
+is adopted. Its buffer, and whatever it still streams, is replayed into the real session, and
+its new messages are appended to the real thread. The other runs are cancelled. A run only ever
+touches its own fork, so a misprediction leaves the real thread and game as they were.
+"""
+
+import asyncio
+import time
+from contextlib import aclosing, nullcontext
+from typing import AsyncContextManager, AsyncIterator, List, Optional, Sequence
+
+from agent_framework import AgentThread, ChatMessage, ChatMessageStore
+
+from src.tic_tac_toe.agent_pool import PooledAgent
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import Player
+from src.tic_tac_toe.solver import SolverTable
+from src.utils.stream_dispatch import StreamDispatcher
+from src.utils.token_usage import TokenUsage
+
+# Tie-break for equally good human moves: centre, corners, then edges
+CELL_PREFERENCE = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+_DONE = object()
+
+
+def predict_human_moves(
+  board: Sequence[Optional[Player]], k: int, solver: SolverTable
+) -> List[int]:
+  """The `k` likeliest human (O) moves: the solver's optimal moves first, then the rest."""
+  best = set(solver.best_moves(board))
+  empty = [position for position in CELL_PREFERENCE if board[position] is None]
+  return sorted(empty, key=lambda position: position not in best)[:k]
+
+
+def fork_thread(messages: Sequence[ChatMessage]) -> AgentThread:
+  """A thread with its own store, starting from `messages` (which are shared, not copied)."""
+  return AgentThread(message_store=ChatMessageStore(list(messages)))
+
+
+class SpeculativeRun:
+  """
+  One agent turn run ahead for a predicted human move. `events()` yields its stream updates
+  (dicts) and the agent's move (an int) in the order they happened, buffered until adopted.
+  """
+
+  __slots__ = (
+    "position",
+    "game",
+    "thread",
+    "message_text",
+    "pooled",
+    "usage",
+    "started_at",
+    "finished_at",
+    "task",
+    "admitted",
+    "_forked_length",
+    "_dispatcher",
+    "_events",
+  )
+
+  def __init__(self, position: int, game: TicTacToe, thread: AgentThread, message_text: str):
+    self.position = position
+    self.game = game  # Fork with the predicted move played
+    self.thread = thread  # Fork of the session's thread
+    self.message_text = message_text
+    self.pooled: Optional[PooledAgent] = None  # Checked out with `make_move` as its move tool
+    self.usage = TokenUsage()
+    self.started_at = time.perf_counter()
+    self.finished_at: Optional[float] = None
+    self.task: Optional[asyncio.Task] = None
+    self.admitted = False  # Whether the run got past admission control and started streaming
+    self._forked_length = len(thread.message_store.messages)
+    self._dispatcher = StreamDispatcher({"usage": self.usage.handle})
+    self._events: asyncio.Queue = asyncio.Queue()
+
+  def start(
+    self, pooled: PooledAgent, on_done, admission: Optional[AsyncContextManager] = None
+  ) -> None:
+    """
+    Run the turn with `pooled` in the background, once `admission` (an LLM scheduler slot, held
+    for the run) lets it in; `on_done(run)` is called when it stops.
+    """
+    self.pooled = pooled
+    self.task = asyncio.create_task(self._run(admission or nullcontext()))
+    self.task.add_done_callback(lambda task: self._finished(task, on_done))
+
+  def _finished(self, task: asyncio.Task, on_done) -> None:
+    # Mark a failure as retrieved: it only matters (and is re-raised by events()) if adopted
+    if not task.cancelled():
+      task.exception()
+    on_done(self)
+
+  async def _run(self, admission: AsyncContextManager) -> None:
+    try:
+      async with admission as grant:
+        self.admitted = True
+        stream = self.pooled.agent.run_stream(
+          thread=self.thread, messages=[ChatMessage(role="user", text=self.message_text)]
+        )
+        try:
+          async with aclosing(stream):  # Cancelling closes the upstream response right away
+            async for update in stream:
+              # Serialized now, while the human thinks, rather than on replay
+              self._events.put_nowait(await self._dispatcher.dispatch(update))
+        finally:
+          if grant is not None and self.usage.requests:
+            grant.tokens = self.usage.total_tokens
+    finally:
+      self.finished_at = time.perf_counter()
+      self._events.put_nowait(_DONE)
+
+  async def make_move(self, position: int) -> dict:
+    """The agent's move tool while speculating: plays on the fork and buffers the move."""
+    result = self.game.take_X_move(position)
+    if result.success:
+      self._events.put_nowait(position)
+    return result.to_json()
+
+  async def events(self) -> AsyncIterator[dict | int]:
+    """Buffered, then live, events until the run ends; re-raises the run's error, if any."""
+    while (event := await self._events.get()) is not _DONE:
+      yield event
+    await self.task
+
+  def new_messages(self) -> list[ChatMessage]:
+    """Messages the run added to its forked thread."""
+    return self.thread.message_store.messages[self._forked_length :]
+
+  @property
+  def saved_seconds(self) -> float:
+    """How much of the turn was already done: its head start, up to the time it took."""
+    return (self.finished_at or time.perf_counter()) - self.started_at
+
+  def cancel(self) -> None:
+    if self.task is not None and not self.task.done():
+      self.task.cancel()
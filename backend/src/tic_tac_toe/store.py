@@ -0,0 +1,144 @@
+# backend/src/tic_tac_toe/store.py
+"""External session stores so game sessions can be shared between server workers."""
+
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Optional
+from urllib.parse import urlparse
+
+from agent_framework import AgentThread
+
+from src.tic_tac_toe.game import TicTacToe
+
+StoredSession = tuple[int, Optional[bytes]]
+
+
+# ==================== Session Codec ====================
+
+
+async def encode_session(game: TicTacToe, thread: AgentThread) -> bytes:
+  """Serialize game state, game log and agent thread history as compressed compact JSON."""
+  state = {"game": game.export_state(), "thread": await thread.serialize()}
+  return zlib.compress(json.dumps(state, separators=(",", ":")).encode())
+
+
+async def decode_session(blob: bytes) -> tuple[dict, AgentThread]:
+  """Inverse of `encode_session`: returns the game snapshot and a rebuilt agent thread."""
+  state = json.loads(zlib.decompress(blob))
+  return state["game"], await AgentThread.deserialize(state["thread"])
+
+
+# ==================== Stores ====================
+
+
+class SessionStore(ABC):
+  """
+  Versioned blob store keyed by sid. Every save bumps the session's version, which lets a worker
+  skip re-reading a session it already holds the latest copy of.
+  """
+
+  @abstractmethod
+  async def load(self, sid: str, known_version: Optional[int] = None) -> Optional[StoredSession]:
+    """
+    Get `(version, blob)` for a session, or None if it isn't stored.
+    The blob is None when the stored version equals `known_version`.
+    """
+
+  @abstractmethod
+  async def save(self, sid: str, blob: bytes) -> int:
+    """Store a session blob and return its new version."""
+
+  @abstractmethod
+  async def delete(self, sid: str) -> None:
+    """Remove a session."""
+
+  async def aclose(self) -> None:
+    """Release connections held by the store."""
+
+
+class InMemorySessionStore(SessionStore):
+  """Process-local store for tests and single-worker deployments."""
+
+  def __init__(self):
+    self._sessions: dict[str, tuple[int, bytes]] = {}
+
+  def __len__(self) -> int:
+    return len(self._sessions)
+
+  async def load(self, sid: str, known_version: Optional[int] = None) -> Optional[StoredSession]:
+    entry = self._sessions.get(sid)
+    if entry is None:
+      return None
+    version, blob = entry
+    return version, None if version == known_version else blob
+
+  async def save(self, sid: str, blob: bytes) -> int:
+    version = self._sessions.get(sid, (0, b""))[0] + 1
+    self._sessions[sid] = (version, blob)
+    return version
+
+  async def delete(self, sid: str) -> None:
+    self._sessions.pop(sid, None)
+
+
+class RedisSessionStore(SessionStore):
+  """
+  Store backed by any server speaking the Redis protocol. Each session is a hash holding its
+  version (`v`) and blob (`state`), expiring after `ttl` seconds without a save.
+  """
+
+  def __init__(self, url: str, ttl: float = 1800.0, prefix: str = "tictactoe:session:"):
+    try:
+      from redis import asyncio as aioredis
+    except ImportError as e:
+      raise RuntimeError(
+        "RedisSessionStore requires the redis package (install the 'redis' dependency group)"
+      ) from e
+    self.redis = aioredis.Redis.from_url(url)
+    self.ttl = int(ttl)
+    self.prefix = prefix
+
+  def _key(self, sid: str) -> str:
+    return self.prefix + sid
+
+  async def load(self, sid: str, known_version: Optional[int] = None) -> Optional[StoredSession]:
+    key = self._key(sid)
+    # One round trip when the caller is already up to date; a second only when the blob changed
+    if known_version is not None:
+      version = await self.redis.hget(key, "v")
+      if version is None:
+        return None
+      if int(version) == known_version:
+        return known_version, None
+    version, blob = await self.redis.hmget(key, "v", "state")
+    if version is None or blob is None:
+      return None
+    return int(version), blob
+
+  async def save(self, sid: str, blob: bytes) -> int:
+    key = self._key(sid)
+    async with self.redis.pipeline(transaction=True) as pipe:
+      pipe.hincrby(key, "v", 1)
+      pipe.hset(key, "state", blob)
+      pipe.expire(key, self.ttl)
+      version, _, _ = await pipe.execute()
+    return int(version)
+
+  async def delete(self, sid: str) -> None:
+    await self.redis.delete(self._key(sid))
+
+  async def aclose(self) -> None:
+    await self.redis.aclose()
+
+
+def create_session_store(url: Optional[str], ttl: float = 1800.0) -> Optional[SessionStore]:
+  """Build the store for a URL: None keeps sessions in-process only, `memory://` or `redis://`."""
+  if not url:
+    return None
+  scheme = urlparse(url).scheme.split("+", 1)[0].lower()
+  if scheme == "memory":
+    return InMemorySessionStore()
+  if scheme in ("redis", "rediss", "unix"):
+    return RedisSessionStore(url, ttl=ttl)
+  raise ValueError(f"Unsupported session store URL scheme: {scheme}")
@@ -0,0 +1,106 @@
+# backend/src/utils/llm_clients.py
+"""Process-wide registry of pooled LLM clients shared by every game session."""
+
+import asyncio
+import logging
+
+import httpx
+from agent_framework.openai import OpenAIResponsesClient
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAIError
+
+from src.config import settings
+
+log = logging.getLogger(__name__)
+
+ClientKey = tuple[str | None, str, str | None]
+
+
+class LLMClientRegistry:
+  """
+  Hands out one `OpenAIResponsesClient` per (base_url, model_id, api_key).
+  Clients pointing at the same endpoint with the same key share a single `AsyncOpenAI` and its
+  bounded keep-alive connection pool, so sessions reuse warm connections instead of each paying
+  for a new pool and TLS handshake.
+  """
+
+  def __init__(
+    self,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+  ):
+    self.limits = httpx.Limits(
+      max_connections=max_connections,
+      max_keepalive_connections=max_keepalive_connections,
+      keepalive_expiry=keepalive_expiry,
+    )
+    self._transports: dict[tuple[str | None, str | None], AsyncOpenAI] = {}
+    self._clients: dict[ClientKey, OpenAIResponsesClient] = {}
+
+  def __len__(self) -> int:
+    return len(self._clients)
+
+  def _get_transport(self, base_url: str | None, api_key: str | None) -> AsyncOpenAI:
+    transport = self._transports.get((base_url, api_key))
+    if transport is None:
+      transport = AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        http_client=DefaultAsyncHttpxClient(limits=self.limits),
+      )
+      self._transports[(base_url, api_key)] = transport
+    return transport
+
+  def get(self, base_url: str | None, model_id: str, api_key: str | None) -> OpenAIResponsesClient:
+    """Get (creating on first use) the shared client for this endpoint, model and key."""
+    key = (base_url, model_id, api_key)
+    client = self._clients.get(key)
+    if client is None:
+      log.info(
+        "LLM client created",
+        extra={"base_url": base_url, "model": model_id, "api_key_present": bool(api_key)},
+      )
+      client = OpenAIResponsesClient(
+        model_id=model_id,
+        async_client=self._get_transport(base_url, api_key),
+      )
+      self._clients[key] = client
+    return client
+
+  def get_default(self) -> OpenAIResponsesClient:
+    """Get the client configured by the application settings."""
+    return self.get(
+      settings.OPENAI_API_BASE_URL, settings.OPENAI_API_MODEL_ID, settings.OPENAI_API_KEY
+    )
+
+  async def warm_up(self, client: OpenAIResponsesClient, connections: int = 1) -> int:
+    """
+    Open up to `connections` pooled connections to the client's endpoint ahead of the first turn.
+    Failures are ignored - warm-up is best effort. Returns the number of successful requests.
+    """
+    transport = client.client.with_options(max_retries=0, timeout=5.0)
+
+    async def touch() -> bool:
+      try:
+        await transport.models.list()
+      except (OpenAIError, httpx.HTTPError):
+        return False
+      return True
+
+    results = await asyncio.gather(*(touch() for _ in range(connections)))
+    return sum(results)
+
+  async def aclose(self) -> None:
+    """Close every pooled connection and forget all clients."""
+    transports = list(self._transports.values())
+    self._transports.clear()
+    self._clients.clear()
+    for transport in transports:
+      await transport.close()
+
+
+llm_clients = LLMClientRegistry(
+  max_connections=settings.LLM_MAX_CONNECTIONS,
+  max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+  keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY_SECONDS,
+)
@@ -0,0 +1,183 @@
+# backend/src/utils/llm_scheduler.py
+"""
+Process-wide admission control for LLM runs: caps runs in flight and tokens per minute, and
+queues the rest fairly - by priority class, then round-robin across sessions within a class, so
+one busy session can't starve the others.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from src.config import settings
+from src.utils.metrics import metrics
+
+# Priority classes, most urgent first
+TURN = 0  # The agent's move in a live game
+QUERY = 1  # Answers to post-game questions
+SPECULATIVE = 2  # Turns run ahead for a predicted human move
+PRIORITY_NAMES = ("turn", "query", "speculative")
+
+OnQueued = Callable[[int], Awaitable[None]]
+
+
+class Grant:
+  """Admission for one run. Set `tokens` to the run's actual usage to settle the token budget."""
+
+  __slots__ = ("session", "priority", "estimate", "tokens", "future", "enqueued_at")
+
+  def __init__(self, session: str, priority: int, estimate: int):
+    self.session = session
+    self.priority = priority
+    self.estimate = estimate
+    self.tokens: Optional[int] = None
+    self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+    self.enqueued_at = time.perf_counter()
+
+
+class LLMScheduler:
+  """
+  Admits up to `max_concurrency` runs at once and about `tokens_per_minute` tokens (a token
+  bucket charged each run's estimate up front and settled with its actual usage); 0 disables
+  either limit. Waiting runs are served by priority class, then round-robin by session.
+  """
+
+  def __init__(self, max_concurrency: int = 32, tokens_per_minute: int = 0):
+    self.max_concurrency = max_concurrency
+    self.tokens_per_minute = tokens_per_minute
+    self.in_flight = 0
+    self._tokens = float(tokens_per_minute)
+    self._refilled_at = time.monotonic()
+    # Per priority class: session -> its waiting grants, in round-robin order
+    self._waiting: list[OrderedDict[str, deque[Grant]]] = [OrderedDict() for _ in PRIORITY_NAMES]
+    self._wake: Optional[asyncio.TimerHandle] = None
+    self.in_flight_gauge = metrics.gauge("llm_scheduler_in_flight", "LLM runs admitted")
+    self.waiting_gauge = metrics.gauge("llm_scheduler_waiting", "LLM runs queued for admission")
+    self.wait_seconds = [
+      metrics.histogram(
+        "llm_scheduler_wait_seconds", "Time LLM runs waited for admission", {"priority": name}
+      )
+      for name in PRIORITY_NAMES
+    ]
+
+  @property
+  def waiting(self) -> int:
+    return sum(len(grants) for sessions in self._waiting for grants in sessions.values())
+
+  @asynccontextmanager
+  async def slot(
+    self,
+    session: str,
+    priority: int = TURN,
+    estimate: int = 0,
+    on_queued: Optional[OnQueued] = None,
+  ) -> AsyncIterator[Grant]:
+    """Hold an admission for the duration of the block, waiting in line if needed."""
+    grant = await self.acquire(session, priority, estimate, on_queued)
+    try:
+      yield grant
+    finally:
+      self.release(grant)
+
+  async def acquire(
+    self,
+    session: str,
+    priority: int = TURN,
+    estimate: int = 0,
+    on_queued: Optional[OnQueued] = None,
+  ) -> Grant:
+    """Wait for admission; `on_queued(position)` is awaited if the run has to wait in line."""
+    grant = Grant(session, priority, estimate)
+    self._waiting[priority].setdefault(session, deque()).append(grant)
+    self.waiting_gauge.inc()
+    self._dispatch()
+    try:
+      if not grant.future.done() and on_queued is not None:
+        await on_queued(self.position(grant))
+      await grant.future
+    except asyncio.CancelledError:
+      if grant.future.done() and not grant.future.cancelled():
+        self.release(grant)  # Admitted just as it was cancelled
+      else:
+        self._remove(grant)
+      raise
+    return grant
+
+  def release(self, grant: Grant) -> None:
+    """End an admitted run, refunding (or charging) the difference from its estimate."""
+    self.in_flight -= 1
+    self.in_flight_gauge.dec()
+    if self.tokens_per_minute and grant.tokens is not None:
+      self._tokens += grant.estimate - grant.tokens
+    self._dispatch()
+
+  def position(self, grant: Grant) -> int:
+    """1-based place in line: runs of more urgent classes, then round-robin turns ahead of it."""
+    ahead = sum(
+      len(grants) for sessions in self._waiting[: grant.priority] for grants in sessions.values()
+    )
+    sessions = self._waiting[grant.priority]
+    own = sessions[grant.session]
+    index = own.index(grant)
+    before = True  # Sessions before this one in round-robin order get one more turn
+    for session, grants in sessions.items():
+      if session == grant.session:
+        before = False
+        continue
+      ahead += min(len(grants), index + 1 if before else index)
+    return ahead + index + 1
+
+  def _remove(self, grant: Grant) -> None:
+    sessions = self._waiting[grant.priority]
+    grants = sessions.get(grant.session)
+    if grants is not None and grant in grants:
+      grants.remove(grant)
+      self.waiting_gauge.dec()
+      if not grants:
+        del sessions[grant.session]
+
+  def _refill(self) -> None:
+    now = time.monotonic()
+    rate = self.tokens_per_minute / 60
+    self._tokens = min(self.tokens_per_minute, self._tokens + (now - self._refilled_at) * rate)
+    self._refilled_at = now
+
+  def _dispatch(self) -> None:
+    """Admit waiting runs while there is capacity, most urgent class first."""
+    if self.tokens_per_minute:
+      self._refill()
+    for priority, sessions in enumerate(self._waiting):
+      while sessions:
+        if self.max_concurrency and self.in_flight >= self.max_concurrency:
+          return
+        session, grants = next(iter(sessions.items()))
+        grant = grants[0]
+        # A run bigger than the whole bucket is let through once the bucket is full
+        need = min(grant.estimate, self.tokens_per_minute)
+        if self.tokens_per_minute and self._tokens < need:
+          self._wake_in((need - self._tokens) * 60 / self.tokens_per_minute)
+          return
+        grants.popleft()
+        self.waiting_gauge.dec()
+        # Round-robin: the session goes to the back of its class, if it has more waiting
+        if grants:
+          sessions.move_to_end(session)
+        else:
+          del sessions[session]
+        self.in_flight += 1
+        self.in_flight_gauge.inc()
+        self._tokens -= grant.estimate
+        self.wait_seconds[priority].observe(time.perf_counter() - grant.enqueued_at)
+        grant.future.set_result(None)
+
+  def _wake_in(self, seconds: float) -> None:
+    if self._wake is not None:
+      self._wake.cancel()
+    self._wake = asyncio.get_running_loop().call_later(seconds, self._dispatch)
+
+
+llm_scheduler = LLMScheduler(
+  max_concurrency=settings.LLM_MAX_CONCURRENT_RUNS, tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE
+)
@@ -0,0 +1,148 @@
+# backend/src/utils/log.py
+"""
+Structured logging. Loggers hand records to a queue; a background thread formats and writes
+them, so the event loop never blocks on output. Messages use lazy %-style arguments and extra
+fields (e.g. `extra={"sid": sid}`), which are rendered as key=value pairs or JSON.
+"""
+
+import atexit
+import json
+import logging
+import sys
+import zlib
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Optional, TextIO
+
+# Stream-token debug logs: one record per chunk, so they are only kept for sampled sessions
+STREAM_LOGGER = "src.stream"
+stream_log = logging.getLogger(STREAM_LOGGER)
+
+# LogRecord attributes that are not extra fields
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+  "message",
+  "asctime",
+}
+
+_listener: Optional[QueueListener] = None
+
+
+def record_fields(record: logging.LogRecord) -> dict:
+  """The extra fields a record was logged with."""
+  return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRS}
+
+
+class KeyValueFormatter(logging.Formatter):
+  """`time LEVEL logger message key=value ...` lines."""
+
+  def __init__(self):
+    super().__init__("%(asctime)s %(levelname)s %(name)s %(message)s")
+
+  def format(self, record: logging.LogRecord) -> str:
+    line = super().format(record)
+    fields = record_fields(record)
+    if not fields:
+      return line
+    pairs = " ".join(f"{key}={value}" for key, value in fields.items())
+    head, newline, traceback = line.partition("\n")
+    return f"{head} {pairs}{newline}{traceback}"
+
+
+class JsonFormatter(logging.Formatter):
+  """One JSON object per record."""
+
+  def format(self, record: logging.LogRecord) -> str:
+    entry = {
+      "time": self.formatTime(record),
+      "level": record.levelname,
+      "logger": record.name,
+      "message": record.getMessage(),
+      **record_fields(record),
+    }
+    if record.exc_info:
+      entry["exception"] = self.formatException(record.exc_info)
+    return json.dumps(entry, default=str)
+
+
+FORMATTERS = {"text": KeyValueFormatter, "json": JsonFormatter}
+
+
+class SessionSampler(logging.Filter):
+  """
+  Keeps records for a stable `rate` fraction of sessions (by the record's `sid` field), so a
+  sampled session's log is complete. Records without a `sid` are kept.
+  """
+
+  def __init__(self, rate: float):
+    super().__init__()
+    self.threshold = int(max(0.0, min(rate, 1.0)) * 2**32)
+
+  def sampled(self, sid: str) -> bool:
+    return zlib.crc32(sid.encode()) < self.threshold
+
+  def filter(self, record: logging.LogRecord) -> bool:
+    sid = getattr(record, "sid", None)
+    return sid is None or self.sampled(sid)
+
+
+_stream_sampler = SessionSampler(1.0)
+
+
+def stream_log_enabled(sid: str) -> bool:
+  """
+  Whether to log this session's stream chunks. Check it before logging each chunk: skipping a
+  sampled-out session here costs far less than building a record for the sampler to drop.
+  """
+  return stream_log.isEnabledFor(logging.DEBUG) and _stream_sampler.sampled(sid)
+
+
+def parse_levels(spec: str) -> dict[str, str]:
+  """Per-logger levels from "name=LEVEL,name=LEVEL" (e.g. "src.stream=DEBUG")."""
+  levels = {}
+  for item in spec.split(","):
+    name, _, level = item.partition("=")
+    if not level.strip():
+      continue
+    levels[name.strip()] = level.strip().upper()
+  return levels
+
+
+def configure_logging(
+  level: str = "INFO",
+  levels: str = "",
+  fmt: str = "text",
+  stream_sample_rate: float = 1.0,
+  stream: Optional[TextIO] = None,
+) -> None:
+  """
+  Route all logging through a queue to a background writer thread (replacing earlier setups).
+  `levels` overrides the root `level` per logger; see parse_levels.
+  """
+  formatter = FORMATTERS.get(fmt)
+  if formatter is None:
+    raise ValueError(f"Unknown log format {fmt!r}, expected one of {sorted(FORMATTERS)}")
+  shutdown_logging()
+  handler = logging.StreamHandler(stream or sys.stderr)
+  handler.setFormatter(formatter())
+  queue = SimpleQueue()
+  root = logging.getLogger()
+  root.handlers = [QueueHandler(queue)]
+  root.setLevel(level.upper())
+  for name, logger_level in parse_levels(levels).items():
+    logging.getLogger(name).setLevel(logger_level)
+  global _listener, _stream_sampler
+  _stream_sampler = SessionSampler(stream_sample_rate)
+  stream_log.filters = [_stream_sampler]
+  _listener = QueueListener(queue, handler)
+  _listener.start()
+
+
+def shutdown_logging() -> None:
+  """Write out queued records and stop the writer thread."""
+  global _listener
+  if _listener is not None:
+    _listener.stop()
+    _listener = None
+
+
+atexit.register(shutdown_logging)
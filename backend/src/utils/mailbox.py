@@ -0,0 +1,154 @@
+# backend/src/utils/mailbox.py
+"""
+Per-session mailbox: a bounded FIFO of socket event handler calls run one at a time by a single
+worker task, so a session's events never interleave while different sessions run concurrently.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from src.utils.metrics import metrics
+
+log = logging.getLogger(__name__)
+
+HandlerCall = Callable[[], Awaitable[Any]]
+
+
+class Envelope:
+  """A queued handler call; `done` resolves (to None) once it has run, failed or been dropped."""
+
+  __slots__ = ("event", "call", "key", "enqueued_at", "done")
+
+  def __init__(self, event: str, call: HandlerCall, key: Any = None):
+    self.event = event
+    self.call = call
+    self.key = key  # What the call is about (e.g. a move's position), for coalescing
+    self.enqueued_at = time.perf_counter()
+    self.done: asyncio.Future = asyncio.get_running_loop().create_future()
+
+  def _resolve(self) -> None:
+    if not self.done.done():
+      self.done.set_result(None)
+
+
+class Mailbox:
+  """
+  Holds up to `maxsize` queued calls behind the one in flight. `post` refuses calls when full
+  (the caller signals backpressure); queued calls can be inspected, replaced or dropped, and the
+  call in flight interrupted, so callers can coalesce duplicates and let events supersede others.
+  """
+
+  def __init__(self, name: str, maxsize: int = 8):
+    self.name = name
+    self.maxsize = maxsize
+    self._queue: deque[Envelope] = deque()
+    self._ready = asyncio.Event()
+    self._worker: Optional[asyncio.Task] = None
+    self._current: Optional[Envelope] = None
+    self._current_task: Optional[asyncio.Task] = None
+    self.depth_gauge = metrics.gauge(
+      "session_mailbox_depth", "Socket events queued behind the one being handled, all sessions"
+    )
+
+  @property
+  def depth(self) -> int:
+    return len(self._queue)
+
+  @property
+  def current(self) -> Optional[Envelope]:
+    """The call being handled, if any."""
+    return self._current
+
+  def queued(self, event: str) -> list[Envelope]:
+    return [envelope for envelope in self._queue if envelope.event == event]
+
+  def post(self, event: str, call: HandlerCall, key: Any = None) -> Optional[Envelope]:
+    """Queue a call; returns its envelope, or None if the mailbox is full."""
+    if len(self._queue) >= self.maxsize:
+      return None
+    envelope = Envelope(event, call, key)
+    self._queue.append(envelope)
+    self.depth_gauge.inc()
+    self._ready.set()
+    if self._worker is None:
+      self._worker = asyncio.create_task(self._run())
+    return envelope
+
+  def replace(self, envelope: Envelope, call: HandlerCall, key: Any = None) -> None:
+    """Swap a queued call for a newer one, keeping its place in the queue; its wait starts now."""
+    envelope.call = call
+    envelope.key = key
+    envelope.enqueued_at = time.perf_counter()
+
+  def drop(self, events: Iterable[str]) -> int:
+    """Remove queued calls for `events`, returning how many were dropped."""
+    events = set(events)
+    kept = deque(envelope for envelope in self._queue if envelope.event not in events)
+    dropped = [envelope for envelope in self._queue if envelope.event in events]
+    self._queue = kept
+    self.depth_gauge.dec(len(dropped))
+    for envelope in dropped:
+      envelope._resolve()
+    return len(dropped)
+
+  def interrupt(self, events: Iterable[str]) -> bool:
+    """Cancel the call in flight if it handles one of `events`."""
+    if self._current is None or self._current.event not in set(events):
+      return False
+    self._current_task.cancel()
+    return True
+
+  async def _run(self) -> None:
+    wait_seconds = {}
+    while True:
+      if not self._queue:
+        self._ready.clear()
+        await self._ready.wait()
+        continue
+      envelope = self._queue.popleft()
+      self.depth_gauge.dec()
+      histogram = wait_seconds.get(envelope.event)
+      if histogram is None:
+        histogram = wait_seconds[envelope.event] = metrics.histogram(
+          "session_mailbox_wait_seconds",
+          "Time socket events wait in their session's mailbox",
+          {"event": envelope.event},
+        )
+      histogram.observe(time.perf_counter() - envelope.enqueued_at)
+      self._current = envelope
+      self._current_task = asyncio.create_task(envelope.call())
+      try:
+        await self._current_task
+      except asyncio.CancelledError:
+        # An interrupted call is expected; the worker itself being cancelled is not
+        if asyncio.current_task().cancelling():
+          raise
+      except Exception:
+        log.exception("Error handling %s", envelope.event, extra={"sid": self.name})
+      finally:
+        self._current = self._current_task = None
+        envelope._resolve()
+
+  async def aclose(self) -> None:
+    """Cancel the call in flight and the worker, dropping everything queued."""
+    self.drop({envelope.event for envelope in self._queue})
+    tasks = [task for task in (self._current_task, self._worker) if task is not None]
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    self._worker = None
+
+  def close(self) -> list[asyncio.Task]:
+    """
+    Like `aclose`, for synchronous callers: cancels without waiting, returning the cancelled tasks
+    so the caller can act once they have unwound.
+    """
+    self.drop({envelope.event for envelope in self._queue})
+    tasks = [task for task in (self._current_task, self._worker) if task is not None]
+    for task in tasks:
+      task.cancel()
+    self._worker = None
+    return tasks
@@ -1,10 +1,126 @@
-from agent_framework import ChatMessage
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Optional
 
+from agent_framework import AgentRunResponseUpdate
 
-async def handle_update_message(update: ChatMessage):
-  """Handle an update message - accumulating messages and yeilding them when the message is complete."""
-  raise NotImplementedError("Not implemented")
+TEXT_TYPES = ("text", "text_reasoning")
 
-  # Accumulation and emission logic here
-  current_message = None
-  yield current_message
+
+class MessageAccumulator:
+  """
+  Incrementally assembles streamed content deltas into complete messages.
+  Text and reasoning deltas are buffered in lists and joined once per block; function-call
+  argument deltas are grouped by `call_id` (or `fc_id`) and parsed as JSON when the call closes.
+  A block closes when the content type changes, when a provider sends the duplicated "full text"
+  summary chunk for it, or when the stream ends.
+  """
+
+  def __init__(self):
+    self._text_type: Optional[str] = None
+    self._text_parts: list[str] = []
+    self._text_length = 0
+    self._calls: dict[str, dict[str, Any]] = {}
+    self._call_keys: dict[str, str] = {}
+
+  def feed(self, content: dict) -> list[dict]:
+    """Consume one content item, returning any messages it completed (in stream order)."""
+    content_type = content.get("type")
+    if content_type in TEXT_TYPES:
+      return self._feed_text(content_type, content.get("text") or "")
+    if content_type == "function_call":
+      completed = self._flush_text()
+      self._feed_function_call(content)
+      return completed
+    if content_type == "function_result":
+      completed = self.finish()
+      completed.append(content)
+      return completed
+    return []
+
+  def finish(self) -> list[dict]:
+    """Close any open blocks, returning them in stream order."""
+    return self._flush_text() + self._flush_calls()
+
+  def _feed_text(self, content_type: str, text: str) -> list[dict]:
+    completed = self._flush_calls()
+    if self._text_type is not None and self._text_type != content_type:
+      completed.extend(self._flush_text())
+    if self._text_type is None:
+      self._text_type = content_type
+    elif (
+      len(self._text_parts) > 1
+      and len(text) == self._text_length
+      and text == "".join(self._text_parts)
+    ):
+      # Duplicated summary of the deltas already received - it marks the end of the block
+      completed.extend(self._flush_text())
+      return completed
+    self._text_parts.append(text)
+    self._text_length += len(text)
+    return completed
+
+  def _flush_text(self) -> list[dict]:
+    if self._text_type is None:
+      return []
+    message = {"type": self._text_type, "text": "".join(self._text_parts)}
+    self._text_type, self._text_parts, self._text_length = None, [], 0
+    if not message["text"]:
+      return []
+    return [message]
+
+  def _feed_function_call(self, content: dict) -> None:
+    call_id, fc_id = content.get("call_id"), content.get("fc_id")
+    key = self._call_keys.get(call_id) or self._call_keys.get(fc_id) or call_id or fc_id or ""
+    if call_id:
+      self._call_keys[call_id] = key
+    if fc_id:
+      self._call_keys[fc_id] = key
+    call = self._calls.get(key)
+    if call is None:
+      call = self._calls[key] = {
+        "type": "function_call",
+        "call_id": call_id,
+        "fc_id": fc_id,
+        "name": content.get("name"),
+        "arguments": [],
+      }
+    else:
+      call["call_id"] = call["call_id"] or call_id
+      call["fc_id"] = call["fc_id"] or fc_id
+      call["name"] = call["name"] or content.get("name")
+    arguments = content.get("arguments")
+    if isinstance(arguments, str):
+      call["arguments"].append(arguments)
+    elif arguments is not None:
+      call["arguments"] = arguments
+
+  def _flush_calls(self) -> list[dict]:
+    if not self._calls:
+      return []
+    completed = []
+    for call in self._calls.values():
+      arguments = call["arguments"]
+      if isinstance(arguments, list):
+        raw = "".join(arguments)
+        try:
+          arguments = json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+          arguments = raw  # Leave malformed arguments for the caller to report
+      call["arguments"] = arguments
+      completed.append(call)
+    self._calls, self._call_keys = {}, {}
+    return completed
+
+
+async def handle_update_message(
+  updates: AsyncIterable[AgentRunResponseUpdate | dict],
+) -> AsyncIterator[dict]:
+  """Accumulate `run_stream` updates, yielding complete messages as content dicts once done."""
+  accumulator = MessageAccumulator()
+  async for update in updates:
+    data = update if isinstance(update, dict) else update.to_dict()
+    for content in data.get("contents") or ():
+      for message in accumulator.feed(content):
+        yield message
+  for message in accumulator.finish():
+    yield message
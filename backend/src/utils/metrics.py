@@ -0,0 +1,180 @@
+# backend/src/utils/metrics.py
+"""
+In-process counters, gauges and fixed-bucket histograms for realtime instrumentation. Updates are
+plain attribute arithmetic on the event loop's thread (no locks); `render_prometheus` exposes them
+in the Prometheus text format.
+"""
+
+import bisect
+from typing import Iterable, Optional
+
+LabelKey = tuple[tuple[str, str], ...]
+
+# Latency buckets in seconds, from sub-millisecond bookkeeping up to slow LLM turns
+DEFAULT_BUCKETS: tuple[float, ...] = (
+  0.0005,
+  0.001,
+  0.0025,
+  0.005,
+  0.01,
+  0.025,
+  0.05,
+  0.1,
+  0.25,
+  0.5,
+  1.0,
+  2.5,
+  5.0,
+  10.0,
+  30.0,
+)
+
+
+class Counter:
+  """Monotonically increasing value."""
+
+  __slots__ = ("name", "labels", "value")
+
+  def __init__(self, name: str, labels: LabelKey = ()):
+    self.name = name
+    self.labels = labels
+    self.value = 0.0
+
+  def inc(self, amount: float = 1.0) -> None:
+    self.value += amount
+
+
+class Gauge:
+  """Value that can go up and down."""
+
+  __slots__ = ("name", "labels", "value")
+
+  def __init__(self, name: str, labels: LabelKey = ()):
+    self.name = name
+    self.labels = labels
+    self.value = 0.0
+
+  def set(self, value: float) -> None:
+    self.value = value
+
+  def inc(self, amount: float = 1.0) -> None:
+    self.value += amount
+
+  def dec(self, amount: float = 1.0) -> None:
+    self.value -= amount
+
+
+class Histogram:
+  """Fixed-bucket histogram; `bucket_counts[i]` counts values in (buckets[i-1], buckets[i]]."""
+
+  __slots__ = ("name", "labels", "buckets", "bucket_counts", "sum", "count")
+
+  def __init__(self, name: str, labels: LabelKey = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+    self.name = name
+    self.labels = labels
+    self.buckets = tuple(sorted(buckets))
+    self.bucket_counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+    self.sum = 0.0
+    self.count = 0
+
+  def observe(self, value: float) -> None:
+    self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+    self.sum += value
+    self.count += 1
+
+  def quantile(self, q: float) -> Optional[float]:
+    """Upper bound of the bucket holding the q-th quantile (None when empty)."""
+    if not self.count:
+      return None
+    rank = q * self.count
+    seen = 0
+    for index, bucket_count in enumerate(self.bucket_counts):
+      seen += bucket_count
+      if seen >= rank:
+        return self.buckets[index] if index < len(self.buckets) else float("inf")
+    return float("inf")
+
+
+class MetricsRegistry:
+  """Get-or-create store of metrics keyed by name and label set."""
+
+  def __init__(self):
+    self._metrics: dict[tuple[str, LabelKey], Counter | Gauge | Histogram] = {}
+    self.descriptions: dict[str, str] = {}
+
+  def _get(self, cls, name: str, description: str, labels: Optional[dict], **kwargs):
+    key = (name, tuple(sorted((labels or {}).items())))
+    metric = self._metrics.get(key)
+    if metric is None:
+      metric = self._metrics[key] = cls(name, key[1], **kwargs)
+      self.descriptions.setdefault(name, description)
+    elif not isinstance(metric, cls):
+      raise TypeError(f"Metric {name} is already registered as {type(metric).__name__}")
+    return metric
+
+  def counter(self, name: str, description: str = "", labels: Optional[dict] = None) -> Counter:
+    return self._get(Counter, name, description, labels)
+
+  def gauge(self, name: str, description: str = "", labels: Optional[dict] = None) -> Gauge:
+    return self._get(Gauge, name, description, labels)
+
+  def histogram(
+    self,
+    name: str,
+    description: str = "",
+    labels: Optional[dict] = None,
+    buckets: Iterable[float] = DEFAULT_BUCKETS,
+  ) -> Histogram:
+    return self._get(Histogram, name, description, labels, buckets=buckets)
+
+  def collect(self) -> list[Counter | Gauge | Histogram]:
+    """All registered metrics, grouped by name."""
+    return sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+
+metrics = MetricsRegistry()
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_TYPES = {Counter: "counter", Gauge: "gauge", Histogram: "histogram"}
+
+
+def _escape(value: str) -> str:
+  return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+  if value == float("inf"):
+    return "+Inf"
+  if value == float("-inf"):
+    return "-Inf"
+  return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _labels(labels: LabelKey) -> str:
+  if not labels:
+    return ""
+  return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels) + "}"
+
+
+def render_prometheus(registry: MetricsRegistry = metrics) -> str:
+  """All of the registry's metrics in the Prometheus text exposition format (0.0.4)."""
+  lines = []
+  name = None
+  for metric in registry.collect():
+    if metric.name != name:
+      name = metric.name
+      description = registry.descriptions.get(name, "").replace("\\", "\\\\").replace("\n", "\\n")
+      lines.append(f"# HELP {name} {description}")
+      lines.append(f"# TYPE {name} {_TYPES[type(metric)]}")
+    if isinstance(metric, Histogram):
+      cumulative = 0
+      for bound, bucket_count in zip((*metric.buckets, float("inf")), metric.bucket_counts):
+        cumulative += bucket_count
+        labels = _labels((*metric.labels, ("le", _number(bound))))
+        lines.append(f"{name}_bucket{labels} {cumulative}")
+      lines.append(f"{name}_sum{_labels(metric.labels)} {_number(metric.sum)}")
+      lines.append(f"{name}_count{_labels(metric.labels)} {metric.count}")
+    else:
+      lines.append(f"{name}{_labels(metric.labels)} {_number(metric.value)}")
+  return "\n".join(lines) + "\n"
@@ -0,0 +1,206 @@
+# backend/src/utils/outbound.py
+"""
+Per-client outbound channel: emits go straight to the socket while the client keeps up, and into
+a bounded buffer drained by a writer task once its transport backs up. Over budget, stream chunks
+are shed (never board or game-over events); a client that stays stalled is disconnected.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
+
+from src.utils.metrics import metrics
+
+log = logging.getLogger(__name__)
+
+EmitFn = Callable[[str, Any], Awaitable[Any]]
+
+# Policies for events that may be buffered: KEEP is always delivered; MERGE chunks are merged
+# into a buffered chunk of the same event right before them, and shed when over budget; DROP
+# chunks are shed first
+KEEP, MERGE, DROP = "keep", "merge", "drop"
+EVENT_POLICIES: dict[str, str] = {
+  "AGENT_STREAM_TOKEN": MERGE,
+  "ai_message": MERGE,
+  "AGENT_REASONING_CHUNK": DROP,
+}
+
+
+def transport_queue(sio: Any, sid: str) -> Optional[asyncio.Queue]:
+  """The engine.io send queue of a client connected to this process, if there is one."""
+  try:
+    eio_sid = sio.manager.eio_sid_from_sid(sid, "/")
+    return sio.eio.sockets[eio_sid].queue
+  except (AttributeError, KeyError):
+    return None
+
+
+def _merge(into: Any, payload: Any) -> bool:
+  """Append a text chunk's text to the buffered chunk `into`; False if they can't be merged."""
+  if isinstance(into, dict) and "contents" in into:
+    ours, theirs = into["contents"], payload.get("contents") or []
+    if len(ours) != 1 or len(theirs) != 1 or ours[0].get("type") != theirs[0].get("type"):
+      return False
+    ours[0] = {**ours[0], "text": ours[0].get("text", "") + theirs[0].get("text", "")}
+    return True
+  if isinstance(into, dict) and "text" in into:
+    into["text"] += payload.get("text", "")
+    return True
+  return False
+
+
+def _size(payload: Any) -> int:
+  return len(json.dumps(payload, default=str))
+
+
+class _Buffered:
+  __slots__ = ("event", "payload", "size", "enqueued_at")
+
+  def __init__(self, event: str, payload: Any):
+    self.event = event
+    self.payload = payload
+    self.size = _size(payload)
+    self.enqueued_at = time.monotonic()
+
+
+class OutboundChannel:
+  """
+  Sends one client's events in order. `transport_depth()` is how many packets its transport
+  has yet to write; from `max_transport_packets` on, events are buffered here (up to `max_bytes`
+  and `max_messages`, shedding per EVENT_POLICIES) until it drains. `on_slow()` runs once, in its
+  own task, if the client can't take its KEEP events within budget or hasn't drained for
+  `stall_seconds` (0 disables the timeout).
+  """
+
+  def __init__(
+    self,
+    name: str,
+    emit: EmitFn,
+    transport_depth: Callable[[], int],
+    on_slow: Callable[[], Awaitable[Any]],
+    max_bytes: int = 256 * 1024,
+    max_messages: int = 512,
+    max_transport_packets: int = 16,
+    stall_seconds: float = 30.0,
+    poll_interval: float = 0.01,
+  ):
+    self.name = name
+    self._emit = emit
+    self._transport_depth = transport_depth
+    self._on_slow = on_slow
+    self.max_bytes = max_bytes
+    self.max_messages = max_messages
+    self.max_transport_packets = max_transport_packets
+    self.stall_seconds = stall_seconds
+    self.poll_interval = poll_interval
+    self._buffer: deque[_Buffered] = deque()
+    self.buffered_bytes = 0
+    self._writer: Optional[asyncio.Task] = None
+    self._disconnect: Optional[asyncio.Task] = None
+    self.closed = False
+    self.bytes_gauge = metrics.gauge(
+      "socket_outbound_buffered_bytes", "Bytes of events buffered for slow clients, all clients"
+    )
+    self.messages_gauge = metrics.gauge(
+      "socket_outbound_buffered_messages", "Events buffered for slow clients, all clients"
+    )
+    self.merged = metrics.counter(
+      "socket_outbound_merged_total", "Stream chunks merged into a buffered chunk"
+    )
+    self.dropped = {
+      event: metrics.counter(
+        "socket_outbound_dropped_total", "Stream chunks shed for slow clients", {"event": event}
+      )
+      for event, policy in EVENT_POLICIES.items()
+      if policy != KEEP
+    }
+    self.slow_disconnects = metrics.counter(
+      "socket_slow_consumer_disconnects_total", "Clients disconnected for not keeping up"
+    )
+
+  @property
+  def buffered(self) -> int:
+    return len(self._buffer)
+
+  async def send(self, event: str, payload: Any) -> None:
+    if self.closed:
+      return
+    if not self._buffer and self._transport_depth() < self.max_transport_packets:
+      await self._emit(event, payload)
+      return
+    policy = EVENT_POLICIES.get(event, KEEP)
+    tail = self._buffer[-1] if self._buffer else None
+    mergeable = policy != KEEP and tail is not None and tail.event == event
+    if mergeable and _merge(tail.payload, payload):
+      size = _size(tail.payload)
+      self._account(size - tail.size, 0)
+      tail.size = size
+      self.merged.inc()
+    else:
+      buffered = _Buffered(event, payload)
+      self._buffer.append(buffered)
+      self._account(buffered.size, 1)
+    if not self._shed():
+      self._slow("over budget")
+      return
+    if self._writer is None:
+      self._writer = asyncio.create_task(self._drain())
+
+  def _account(self, size: int, messages: int) -> None:
+    self.buffered_bytes += size
+    self.bytes_gauge.inc(size)
+    self.messages_gauge.inc(messages)
+
+  def _over_budget(self) -> bool:
+    return self.buffered_bytes > self.max_bytes or len(self._buffer) > self.max_messages
+
+  def _shed(self) -> bool:
+    """Shed DROP, then MERGE chunks, oldest first, to get within budget; False if it can't."""
+    for policy in (DROP, MERGE):
+      if not self._over_budget():
+        return True
+      kept = deque()
+      for buffered in self._buffer:
+        if self._over_budget() and EVENT_POLICIES.get(buffered.event, KEEP) == policy:
+          self._account(-buffered.size, -1)
+          self.dropped[buffered.event].inc()
+        else:
+          kept.append(buffered)
+      self._buffer = kept
+    return not self._over_budget()
+
+  async def _drain(self) -> None:
+    try:
+      while self._buffer:
+        if self._transport_depth() >= self.max_transport_packets:
+          waited = time.monotonic() - self._buffer[0].enqueued_at
+          if self.stall_seconds and waited >= self.stall_seconds:
+            self._slow(f"stalled for {waited:.0f}s")
+            return
+          await asyncio.sleep(self.poll_interval)
+          continue
+        buffered = self._buffer.popleft()
+        self._account(-buffered.size, -1)
+        await self._emit(buffered.event, buffered.payload)
+    finally:
+      self._writer = None
+
+  def _slow(self, reason: str) -> None:
+    log.warning("Slow consumer, disconnecting", extra={"sid": self.name, "reason": reason})
+    self.slow_disconnects.inc()
+    self.close()
+    # Not awaited here: the disconnect cancels the session's handlers, which may include the one
+    # whose send got us here
+    self._disconnect = asyncio.create_task(self._on_slow())
+
+  def close(self) -> None:
+    """Drop everything buffered and stop the writer; later sends are ignored."""
+    self.closed = True
+    self._account(-self.buffered_bytes, -len(self._buffer))
+    self._buffer.clear()
+    if self._writer is not None and self._writer is not asyncio.current_task():
+      self._writer.cancel()
+    self._writer = None
@@ -0,0 +1,103 @@
+# backend/src/utils/socket_serializer.py
+"""
+Socket.IO server with per-client packet encoding: MessagePack for clients that ask for it in the
+handshake (`?serializer=msgpack`), JSON for everyone else.
+
+Packets are encoded once in MessagePack; a JSON client gets a JSON encoding built (once per
+packet) when it is sent to them. Incoming frames are decoded by type, binary frames as
+MessagePack and text frames as JSON, so a client can keep sending JSON until it sees the server
+answer in MessagePack.
+"""
+
+from typing import Union
+from urllib.parse import parse_qs
+
+from engineio import packet as eio_packet
+from socketio import AsyncServer
+from socketio.packet import Packet
+
+try:
+  import msgpack
+except ImportError:  # Only needed for SOCKETIO_SERIALIZER=msgpack
+  msgpack = None
+
+SERIALIZERS = ("json", "msgpack")
+
+
+class MsgPackFrame(bytes):
+  """A packet's MessagePack encoding that can also give its JSON encoding, built on first use."""
+
+  packet: "NegotiatedPacket"
+  _json: Union[str, list, None] = None
+
+  def json(self) -> Union[str, list]:
+    if self._json is None:
+      self._json = self.packet.encode_json()
+    return self._json
+
+
+class NegotiatedPacket(Packet):
+  """Socket.IO packet that encodes as MessagePack and decodes either MessagePack or JSON."""
+
+  def encode(self) -> MsgPackFrame:
+    frame = MsgPackFrame(msgpack.dumps(self._to_dict()))
+    frame.packet = self
+    return frame
+
+  def encode_json(self) -> Union[str, list]:
+    return super().encode()
+
+  def decode(self, encoded_packet: Union[str, bytes]) -> int:
+    if isinstance(encoded_packet, str):
+      return super().decode(encoded_packet)
+    decoded = msgpack.loads(encoded_packet)
+    self.packet_type = decoded["type"]
+    self.data = decoded.get("data")
+    self.id = decoded.get("id")
+    self.namespace = decoded["nsp"]
+    return 0
+
+
+class NegotiatingAsyncServer(AsyncServer):
+  """AsyncServer that speaks MessagePack to the clients that negotiated it and JSON to the rest."""
+
+  def __init__(self, **kwargs):
+    super().__init__(serializer=NegotiatedPacket, **kwargs)
+    self.msgpack_clients: set[str] = set()  # Engine.IO sids
+
+  async def _handle_eio_connect(self, eio_sid: str, environ: dict):
+    query = parse_qs(environ.get("QUERY_STRING", ""))
+    if "msgpack" in query.get("serializer", ()):
+      self.msgpack_clients.add(eio_sid)
+    return await super()._handle_eio_connect(eio_sid, environ)
+
+  async def _handle_eio_disconnect(self, eio_sid: str, reason):
+    self.msgpack_clients.discard(eio_sid)
+    return await super()._handle_eio_disconnect(eio_sid, reason)
+
+  async def _send_packet(self, eio_sid: str, pkt: NegotiatedPacket) -> None:
+    encoded = pkt.encode() if eio_sid in self.msgpack_clients else pkt.encode_json()
+    for part in encoded if isinstance(encoded, list) else (encoded,):
+      await self.eio.send(eio_sid, part)
+
+  async def _send_eio_packet(self, eio_sid: str, eio_pkt: eio_packet.Packet) -> None:
+    # Emits are encoded once for every recipient; swap in the JSON encoding for JSON clients
+    if eio_sid in self.msgpack_clients or not isinstance(eio_pkt.data, MsgPackFrame):
+      return await super()._send_eio_packet(eio_sid, eio_pkt)
+    encoded = eio_pkt.data.json()
+    for part in encoded if isinstance(encoded, list) else (encoded,):
+      await super()._send_eio_packet(eio_sid, eio_packet.Packet(eio_packet.MESSAGE, part))
+
+
+def create_socket_server(serializer: str = "json", **kwargs) -> AsyncServer:
+  """Build the Socket.IO server: "json" for JSON only, "msgpack" to let clients negotiate it."""
+  if serializer == "json":
+    return AsyncServer(**kwargs)
+  if serializer == "msgpack":
+    if msgpack is None:
+      raise RuntimeError(
+        "The msgpack serializer requires the msgpack package "
+        "(install the 'msgpack' dependency group)"
+      )
+    return NegotiatingAsyncServer(**kwargs)
+  raise ValueError(f"Unknown Socket.IO serializer: {serializer} (expected one of {SERIALIZERS})")
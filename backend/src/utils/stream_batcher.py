@@ -0,0 +1,122 @@
+# backend/src/utils/stream_batcher.py
+"""Micro-batching of agent stream chunks before they are emitted over the socket."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+EmitFn = Callable[[str, dict], Awaitable[Any]]
+
+# Socket events whose chunks can be merged, keyed by the content type they carry
+BATCHABLE_CONTENT_TYPES: dict[str, str] = {
+  "AGENT_STREAM_TOKEN": "text",
+  "AGENT_REASONING_CHUNK": "text_reasoning",
+}
+
+
+class StreamBatcher:
+  """
+  Coalesces consecutive same-type stream chunks into a single emit.
+  A pending batch is flushed when it is older than `max_delay_ms`, when it reaches
+  `max_bytes` / `max_tokens`, or when a chunk of a different event type arrives.
+  Emitted payloads keep the `update.to_dict()` shape with a single merged content item.
+  """
+
+  def __init__(
+    self,
+    emit: EmitFn,
+    max_delay_ms: int = 50,
+    max_bytes: int = 1024,
+    max_tokens: int = 32,
+  ):
+    self._emit = emit
+    self.max_delay = max_delay_ms / 1000
+    self.max_bytes = max_bytes
+    self.max_tokens = max_tokens
+    self._lock = asyncio.Lock()
+    self._event: Optional[str] = None
+    self._template: Optional[dict] = None
+    self._parts: list[str] = []
+    self._bytes = 0
+    self._started_at = 0.0
+    self._timer: Optional[asyncio.Task] = None
+    self.emit_count = 0
+
+  @staticmethod
+  def _single_text(event: str, payload: dict) -> Optional[str]:
+    """Return the chunk text if the payload is a single mergeable content item."""
+    content_type = BATCHABLE_CONTENT_TYPES.get(event)
+    if content_type is None:
+      return None
+    contents = payload.get("contents")
+    if not contents or len(contents) != 1 or contents[0].get("type") != content_type:
+      return None
+    return contents[0].get("text", "")
+
+  async def add(self, event: str, payload: dict) -> None:
+    """Queue a chunk for emission, merging it into the pending batch when possible."""
+    text = self._single_text(event, payload)
+    async with self._lock:
+      if text is None:
+        # Not mergeable - preserve ordering by flushing before passing it through
+        await self._flush_locked()
+        await self._send(event, payload)
+        return
+      if self._event is not None and self._event != event:
+        await self._flush_locked()
+      if self._event is None:
+        self._event = event
+        self._template = payload
+        self._started_at = time.monotonic()
+        self._schedule_timer()
+      self._parts.append(text)
+      self._bytes += len(text.encode("utf-8"))
+      if (
+        self._bytes >= self.max_bytes
+        or len(self._parts) >= self.max_tokens
+        or time.monotonic() - self._started_at >= self.max_delay
+      ):
+        await self._flush_locked()
+
+  async def flush(self) -> None:
+    """Emit any pending batch immediately."""
+    async with self._lock:
+      await self._flush_locked()
+
+  def discard(self) -> None:
+    """Drop the pending batch without emitting it (the run it came from was cancelled)."""
+    if self._timer is not None:
+      self._timer.cancel()
+      self._timer = None
+    self._event, self._template, self._parts, self._bytes = None, None, [], 0
+
+  async def _flush_locked(self) -> None:
+    if self._timer is not None:
+      if self._timer is not asyncio.current_task():
+        self._timer.cancel()
+      self._timer = None
+    if self._event is None:
+      return
+    event, template, parts = self._event, self._template or {}, self._parts
+    self._event, self._template, self._parts, self._bytes = None, None, [], 0
+    content = dict(template["contents"][0])
+    content["text"] = "".join(parts)
+    payload = dict(template)
+    payload["contents"] = [content]
+    await self._send(event, payload)
+
+  async def _send(self, event: str, payload: dict) -> None:
+    self.emit_count += 1
+    await self._emit(event, payload)
+
+  def _schedule_timer(self) -> None:
+    if self.max_delay <= 0:
+      return
+    self._timer = asyncio.create_task(self._flush_after_delay())
+
+  async def _flush_after_delay(self) -> None:
+    """Flush the pending batch once it has aged out, even if no further chunks arrive."""
+    await asyncio.sleep(self.max_delay)
+    async with self._lock:
+      if self._timer is asyncio.current_task():
+        await self._flush_locked()
@@ -0,0 +1,46 @@
+# backend/src/utils/stream_dispatch.py
+"""Single-pass routing of agent `run_stream` updates to socket events."""
+
+from typing import Any, Awaitable, Callable, Mapping
+
+ContentHandler = Callable[[dict, dict], Awaitable[Any]]
+EmitFn = Callable[[str, dict], Awaitable[Any]]
+
+
+def emit_as_update(emit: EmitFn, event: str) -> ContentHandler:
+  """
+  Build a handler that emits a content item as `event`, keeping the `update.to_dict()` shape.
+  Single-content updates are passed through as-is; mixed updates are split per content item.
+  """
+
+  async def handler(content: dict, update: dict) -> None:
+    contents = update["contents"]
+    if len(contents) == 1:
+      await emit(event, update)
+    else:
+      await emit(event, {**update, "contents": [content]})
+
+  return handler
+
+
+class StreamDispatcher:
+  """
+  Serializes each stream update once and routes every content item through a handler table
+  keyed by content type. Content types without a handler are ignored.
+  """
+
+  def __init__(self, handlers: Mapping[str, ContentHandler]):
+    self.handlers = dict(handlers)
+
+  async def dispatch(self, update: Any) -> dict:
+    """Route all content items of `update` (an update object or its dict) and return the dict."""
+    data = update if isinstance(update, dict) else update.to_dict()
+    contents = data.get("contents")
+    if not contents:
+      return data
+    handlers = self.handlers
+    for content in contents:
+      handler = handlers.get(content.get("type"))
+      if handler is not None:
+        await handler(content, data)
+    return data
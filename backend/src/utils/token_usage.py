@@ -0,0 +1,48 @@
+# backend/src/utils/token_usage.py
+"""Per-turn LLM token accounting from the `usage` content items of agent stream updates."""
+
+# Key the OpenAI clients use for prompt-cache hits in UsageDetails' additional counts
+CACHED_INPUT_KEY = "openai.cached_input_tokens"
+
+
+class TokenUsage:
+  """
+  Token counts summed over the model requests of one agent turn (a tool call means another
+  request re-sending the whole context). Use `handle` as the StreamDispatcher's "usage" handler.
+  """
+
+  __slots__ = ("requests", "input_tokens", "cached_input_tokens", "output_tokens")
+
+  def __init__(self):
+    self.reset()
+
+  def reset(self) -> None:
+    self.requests = 0
+    self.input_tokens = 0
+    self.cached_input_tokens = 0
+    self.output_tokens = 0
+
+  def add(self, details: dict) -> None:
+    """Add one request's usage details (the `details` dict of a usage content item)."""
+    self.requests += 1
+    self.input_tokens += details.get("input_token_count") or 0
+    self.cached_input_tokens += details.get(CACHED_INPUT_KEY) or 0
+    self.output_tokens += details.get("output_token_count") or 0
+
+  async def handle(self, content: dict, update: dict) -> None:
+    self.add(content.get("details") or {})
+
+  @property
+  def total_tokens(self) -> int:
+    return self.input_tokens + self.output_tokens
+
+  @property
+  def cached_ratio(self) -> float:
+    return self.cached_input_tokens / self.input_tokens if self.input_tokens else 0.0
+
+  def report(self) -> str:
+    return (
+      f"{self.requests} requests, {self.input_tokens} input tokens "
+      f"({self.cached_input_tokens} cached, {self.cached_ratio:.0%}), "
+      f"{self.output_tokens} output tokens"
+    )
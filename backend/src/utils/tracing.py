@@ -0,0 +1,264 @@
+# backend/src/utils/tracing.py
+"""
+Move tracing with OpenTelemetry (which agent-framework already depends on). Every human move is
+one trace: spans for validating it, emitting it, the agent's turn with its stream phases
+(reasoning, text, tool calls) and tool calls, tagged with the session id and turn number.
+configure_tracing exports them as OTLP/JSON lines to a file or over OTLP/gRPC to a collector,
+keeping a stable fraction of sessions like the stream-token logs. Without it spans are no-ops.
+
+Render a per-turn timeline from an exported file:
+
+  uv run python -m src.utils.tracing traces.jsonl --sid <sid> --turn 2
+"""
+
+import argparse
+import base64
+import json
+import threading
+from collections import defaultdict
+from typing import Iterable, Optional, Sequence, TextIO
+
+from google.protobuf.json_format import MessageToDict
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+from opentelemetry.sdk.trace.sampling import Decision as SamplingDecision
+from opentelemetry.sdk.trace.sampling import ParentBased, Sampler, SamplingResult
+from opentelemetry.trace import Span, Tracer
+
+from src.utils.log import SessionSampler
+
+# Span attributes that tie a trace to its game: set on each move's root span
+SESSION_ID_ATTR = "session.id"
+TURN_ATTR = "turn"
+
+SERVICE_NAME = "tic-tac-toe-backend"
+
+tracer = trace.get_tracer("src.tic_tac_toe")
+
+# Stream phases by agent-framework content type (usage updates don't start a phase)
+STREAM_PHASES = {
+  "text_reasoning": "reasoning",
+  "text": "text",
+  "function_call": "tool_call",
+  "function_result": "tool_result",
+}
+
+
+class SessionTraceSampler(Sampler):
+  """
+  Samples root spans by their `session.id` attribute, so a sampled session is traced for every
+  move (and the same sessions as the stream-token logs at the same rate). Roots without one are
+  kept. Use it as the root of a ParentBased sampler.
+  """
+
+  def __init__(self, rate: float):
+    self.rate = rate
+    self._sessions = SessionSampler(rate)
+
+  def should_sample(self, parent_context, trace_id, name, kind=None, attributes=None, links=None):
+    sid = (attributes or {}).get(SESSION_ID_ATTR)
+    sampled = sid is None or self._sessions.sampled(str(sid))
+    decision = SamplingDecision.RECORD_AND_SAMPLE if sampled else SamplingDecision.DROP
+    return SamplingResult(decision, attributes if sampled else None)
+
+  def get_description(self) -> str:
+    return f"SessionTraceSampler{{{self.rate}}}"
+
+
+def _hex_ids(value):
+  """OTLP/JSON wants trace and span ids in hex, where protobuf's JSON mapping gives base64."""
+  if isinstance(value, list):
+    return [_hex_ids(item) for item in value]
+  if not isinstance(value, dict):
+    return value
+  return {
+    key: base64.b64decode(item).hex()
+    if key in ("traceId", "spanId", "parentSpanId")
+    else _hex_ids(item)
+    for key, item in value.items()
+  }
+
+
+def encode_otlp_json(spans: Sequence[ReadableSpan]) -> dict:
+  """Spans as an OTLP/JSON ExportTraceServiceRequest (what a collector's file exporter writes)."""
+  return _hex_ids(MessageToDict(encode_spans(spans), use_integers_for_enums=True))
+
+
+class JsonLinesSpanExporter(SpanExporter):
+  """Appends each exported batch to `path` as one line of OTLP/JSON."""
+
+  def __init__(self, path: str):
+    self.path = path
+    self._lock = threading.Lock()
+
+  def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+    line = json.dumps(encode_otlp_json(spans), separators=(",", ":"))
+    with self._lock, open(self.path, "a", encoding="utf-8") as output:
+      output.write(line + "\n")
+    return SpanExportResult.SUCCESS
+
+
+def create_exporter(exporter: str, path: str, endpoint: str) -> SpanExporter:
+  if exporter == "file":
+    return JsonLinesSpanExporter(path)
+  if exporter == "otlp":
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    return OTLPSpanExporter(endpoint=endpoint)
+  raise ValueError(f"Unknown trace exporter {exporter!r}, expected 'file' or 'otlp'")
+
+
+def configure_tracing(
+  exporter: str,
+  path: str = "traces.jsonl",
+  endpoint: str = "http://localhost:4317",
+  sample_rate: float = 1.0,
+) -> TracerProvider:
+  """
+  Install the process's tracer provider: spans of a `sample_rate` fraction of sessions are
+  exported by a background thread (so the event loop never waits on it) with `exporter`.
+  agent-framework's own spans, when it has them enabled, land in the same traces.
+  """
+  provider = TracerProvider(
+    resource=Resource.create({"service.name": SERVICE_NAME}),
+    sampler=ParentBased(SessionTraceSampler(sample_rate)),
+  )
+  provider.add_span_processor(BatchSpanProcessor(create_exporter(exporter, path, endpoint)))
+  trace.set_tracer_provider(provider)
+  return provider
+
+
+class StreamPhases:
+  """
+  Child spans of `parent` for each run of same-kind stream updates (see STREAM_PHASES), so a
+  trace shows how long the model reasoned, wrote and called tools. Feed it every update.
+  """
+
+  def __init__(self, tracer: Tracer, parent: Span):
+    self.tracer = tracer
+    self.parent = parent
+    self.recording = parent.is_recording()
+    self.phase: Optional[str] = None
+    self.span: Optional[Span] = None
+    self.updates = 0
+
+  def update(self, contents: Iterable) -> None:
+    if not self.recording:
+      return
+    phase = next(
+      (STREAM_PHASES[content.type] for content in contents if content.type in STREAM_PHASES), None
+    )
+    if phase is None or phase == self.phase:
+      self.updates += phase is not None
+      return
+    self.end()
+    self.phase, self.updates = phase, 1
+    context = trace.set_span_in_context(self.parent)
+    self.span = self.tracer.start_span(f"llm.{phase}", context=context)
+
+  def end(self) -> None:
+    if self.span is not None:
+      self.span.set_attribute("updates", self.updates)
+      self.span.end()
+      self.span = None
+      self.phase = None
+
+
+# ==================== Timeline ====================
+
+
+def _attribute_value(value: dict):
+  for key in ("stringValue", "boolValue", "doubleValue"):
+    if key in value:
+      return value[key]
+  if "intValue" in value:
+    return int(value["intValue"])
+  return None
+
+
+def read_spans(lines: Iterable[str]) -> list[dict]:
+  """Flatten OTLP/JSON lines into spans with `attributes` as a plain dict."""
+  spans = []
+  for line in lines:
+    if not line.strip():
+      continue
+    for resource_spans in json.loads(line).get("resourceSpans", []):
+      for scope_spans in resource_spans.get("scopeSpans", []):
+        for span in scope_spans.get("spans", []):
+          attributes = {
+            item["key"]: _attribute_value(item["value"]) for item in span.get("attributes", [])
+          }
+          spans.append({**span, "attributes": attributes})
+  return spans
+
+
+def render_timeline(spans: list[dict], width: int = 40) -> str:
+  """One block per trace (a human move): each span's start, duration and a bar, by nesting."""
+  traces: dict[str, list[dict]] = defaultdict(list)
+  for span in spans:
+    traces[span["traceId"]].append(span)
+  blocks = []
+  for trace_spans in sorted(
+    traces.values(), key=lambda s: min(int(x["startTimeUnixNano"]) for x in s)
+  ):
+    ids = {span["spanId"] for span in trace_spans}
+    children = defaultdict(list)
+    for span in trace_spans:
+      children[span.get("parentSpanId") if span.get("parentSpanId") in ids else None].append(span)
+    start = min(int(span["startTimeUnixNano"]) for span in trace_spans)
+    end = max(int(span["endTimeUnixNano"]) for span in trace_spans)
+    scale = width / max(end - start, 1)
+    roots = children[None]
+    attributes = roots[0]["attributes"] if roots else {}
+    header = (
+      f"{attributes.get(SESSION_ID_ATTR, '?')} turn {attributes.get(TURN_ATTR, '?')}: "
+      f"{(end - start) / 1e6:.1f} ms"
+    )
+    lines = [header]
+
+    def walk(span: dict, depth: int) -> None:
+      begin, finish = int(span["startTimeUnixNano"]), int(span["endTimeUnixNano"])
+      left = int((begin - start) * scale)
+      bar = " " * left + "=" * max(1, int((finish - start) * scale) - left)
+      lines.append(
+        f"  {(begin - start) / 1e6:9.1f} {(finish - begin) / 1e6:9.1f} ms  "
+        f"{'  ' * depth + span['name']:<28} |{bar:<{width}}|"
+      )
+      for child in sorted(children[span["spanId"]], key=lambda s: int(s["startTimeUnixNano"])):
+        walk(child, depth + 1)
+
+    for root in sorted(roots, key=lambda s: int(s["startTimeUnixNano"])):
+      walk(root, 0)
+    blocks.append("\n".join(lines))
+  return "\n\n".join(blocks)
+
+
+def _select(spans: list[dict], sid: Optional[str], turn: Optional[int]) -> list[dict]:
+  """Spans of the traces whose root matches `sid` and `turn` (None matches any)."""
+  wanted = {
+    span["traceId"]
+    for span in spans
+    if not span.get("parentSpanId")
+    and (sid is None or span["attributes"].get(SESSION_ID_ATTR) == sid)
+    and (turn is None or span["attributes"].get(TURN_ATTR) == turn)
+  }
+  return [span for span in spans if span["traceId"] in wanted]
+
+
+def main(argv: Optional[list[str]] = None, output: Optional[TextIO] = None) -> None:
+  parser = argparse.ArgumentParser(description="Render per-turn timelines from exported traces.")
+  parser.add_argument("path", help="OTLP/JSON lines file (TRACE_EXPORTER=file)")
+  parser.add_argument("--sid", help="Only this session's turns")
+  parser.add_argument("--turn", type=int, help="Only this turn number")
+  parser.add_argument("--width", type=int, default=40, help="Width of the timeline bars")
+  args = parser.parse_args(argv)
+  with open(args.path, encoding="utf-8") as lines:
+    spans = _select(read_spans(lines), args.sid, args.turn)
+  print(render_timeline(spans, args.width) or "No matching turns", file=output)
+
+
+if __name__ == "__main__":
+  main()
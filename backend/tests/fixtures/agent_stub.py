@@ -0,0 +1,33 @@
+"""Scripted stand-in for the tic-tac-toe ChatAgent that plays through its bound move tool."""
+
+from typing import Iterable
+
+from agent_framework import AgentRunResponseUpdate, AgentThread, ChatMessage
+
+from src.tic_tac_toe.agent_pool import AgentBinding
+
+
+class ScriptedAgent:
+  """
+  Plays X in the first empty cell and records the exchange on the thread, like a real run would,
+  optionally replaying recorded stream updates (dicts) first.
+  Pass it (or a functools.partial of it) to make_manager in tests/fixtures/manager_stub.py.
+  """
+
+  def __init__(self, binding: AgentBinding, move_tool, stream: Iterable[dict] = ()):
+    self.binding = binding
+    self.move_tool = move_tool
+    self.stream = stream
+
+  async def run_stream(self, thread: AgentThread, messages: list[ChatMessage]):
+    await thread.on_new_messages(messages)
+    for update in self.stream:
+      yield AgentRunResponseUpdate.from_dict(update)
+    board = self.binding.game.get_board()
+    if None in board:
+      position = board.index(None)
+      await self.move_tool(position)
+      reply = f"I placed X at position {position}."
+    else:
+      reply = "The board is full."
+    await thread.on_new_messages([ChatMessage(role="assistant", text=reply)])
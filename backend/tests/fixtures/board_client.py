@@ -0,0 +1,55 @@
+# backend/tests/fixtures/board_client.py
+"""Python mirror of the frontend's board sync handling (event_handlers.ts) for protocol tests."""
+
+
+class BoardSyncClient:
+  def __init__(self):
+    self.version = -1
+    self.board: list[str | None] = [None] * 9
+    self.status = "ongoing"
+    self.pending: dict[int, dict] = {}  # Deltas received ahead of a gap, by version
+    self.sync_requests: list[dict] = []  # BOARD_SYNC payloads the client would emit
+
+  def connect(self) -> None:
+    """A new connection is a new server session whose versions start over."""
+    self.version = -1
+    self.pending.clear()
+
+  def receive(self, event: str, data: dict) -> None:
+    if event == "BOARD_SNAPSHOT":
+      self._on_snapshot(data)
+    elif event == "BOARD_DELTA":
+      self._on_delta(data)
+
+  def _on_snapshot(self, snapshot: dict) -> None:
+    # Authoritative even at a lower version (the session was created again); deltas held so far
+    # were sent before it, so it already covers them
+    self.pending.clear()
+    self.version = snapshot["v"]
+    self.board = list(snapshot["board"])
+    self.status = snapshot["status"]
+
+  def _on_delta(self, delta: dict) -> None:
+    if delta["v"] <= self.version:
+      return  # Duplicate, or already covered by a snapshot
+    if delta["v"] > self.version + 1:
+      # A delta went missing (or this one overtook it): hold it and ask for a snapshot once
+      if not self.pending:
+        self.sync_requests.append({"v": self.version})
+      self.pending[delta["v"]] = delta
+      return
+    self._apply(delta)
+    self._drain()
+
+  def _apply(self, delta: dict) -> None:
+    self.version = delta["v"]
+    self.board[delta["pos"]] = delta["mark"]
+    self.status = delta["status"]
+
+  def _drain(self) -> None:
+    """Apply held deltas that are now next in line, dropping any that are stale."""
+    for version in sorted(self.pending):
+      if version <= self.version:
+        del self.pending[version]
+      elif version == self.version + 1:
+        self._apply(self.pending.pop(version))
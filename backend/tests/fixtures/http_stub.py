@@ -0,0 +1,60 @@
+# backend/tests/fixtures/http_stub.py
+"""Minimal keep-alive HTTP/1.1 server used as a local stand-in for an OpenAI-compatible API."""
+
+import asyncio
+import json
+
+DEFAULT_BODY = {"object": "list", "data": []}
+
+
+class StubHTTPServer:
+  """
+  Answers every request with a fixed JSON body, `delay` seconds after reading it, and counts TCP
+  connections and requests.
+  """
+
+  def __init__(self, body: dict | None = None, delay: float = 0.0):
+    self.body = json.dumps(body or DEFAULT_BODY).encode()
+    self.delay = delay
+    self.connections = 0
+    self.requests = 0
+    self._server: asyncio.AbstractServer | None = None
+
+  @property
+  def base_url(self) -> str:
+    host, port = self._server.sockets[0].getsockname()[:2]
+    return f"http://{host}:{port}/v1"
+
+  async def __aenter__(self) -> "StubHTTPServer":
+    self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+    return self
+
+  async def __aexit__(self, *exc_info) -> None:
+    self._server.close()
+    await self._server.wait_closed()
+
+  async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    self.connections += 1
+    try:
+      while True:
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for line in head.split(b"\r\n"):
+          name, _, value = line.partition(b":")
+          if name.strip().lower() == b"content-length":
+            length = int(value.strip())
+        if length:
+          await reader.readexactly(length)
+        self.requests += 1
+        if self.delay:
+          await asyncio.sleep(self.delay)
+        writer.write(
+          b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+          + f"Content-Length: {len(self.body)}\r\n\r\n".encode()
+          + self.body
+        )
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+      pass
+    finally:
+      writer.close()
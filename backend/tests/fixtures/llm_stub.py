@@ -0,0 +1,587 @@
+# backend/tests/fixtures/llm_stub.py
+"""
+Local OpenAI Responses-compatible stand-in that replays recorded LLM streams with set timing.
+
+The game can be benchmarked and tested offline against it: recorded turns stream with
+configurable time-to-first-token, inter-token delay, errors and stalls, and X is played by
+synthesizing `agent_make_move` calls for the board in the turn's prompt.
+
+  uv run python -m tests.fixtures.llm_stub --port 8001 --ttft 0.4 --token-delay 0.02
+  OPENAI_API_BASE_URL=http://127.0.0.1:8001/v1 uv run python -m src.main
+
+With --upstream it records instead: requests are proxied to a real endpoint and every turn is
+written to a compact fixture (see `write_fixture`) that --replay serves later.
+
+  uv run python -m tests.fixtures.llm_stub --upstream https://api.openai.com/v1 --record turns.py
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import re
+import runpy
+import time
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Optional
+
+import httpx
+from agent_framework import ChatClientProtocol
+
+from src.tic_tac_toe.agent import create_tic_tac_toe_agent
+from src.tic_tac_toe.models import Player
+from src.tic_tac_toe.solver import get_solver
+
+# A turn is a list of chunks: ("reasoning", text), ("text", text) or ("call", name, arguments)
+Chunk = tuple
+Turn = list[Chunk]
+
+DEFAULT_REPLAY = str(Path(__file__).with_name("message_stream_01.py"))
+MOVE_TOOL = "agent_make_move"
+BOARD_CELL = {"X": Player.X, "O": Player.O}
+
+
+def compact_updates(updates: Iterable[dict]) -> Turn:
+  """One turn from recorded AgentRunResponseUpdate dicts, merging each call's argument deltas."""
+  chunks: Turn = []
+  call_id = None
+  for update in updates:
+    for content in update.get("contents", []):
+      kind = content.get("type")
+      if kind == "text_reasoning":
+        chunks.append(("reasoning", content["text"]))
+      elif kind == "text":
+        chunks.append(("text", content["text"]))
+      elif kind == "function_call" and content.get("call_id") == call_id:
+        chunks[-1] = ("call", chunks[-1][1], chunks[-1][2] + (content.get("arguments") or ""))
+      elif kind == "function_call":
+        call_id = content.get("call_id")
+        chunks.append(("call", content["name"], content.get("arguments") or ""))
+  return chunks
+
+
+def load_fixture(path: str) -> dict:
+  """
+  Turns and timing from a fixture file: a compact one written by the recorder (`turns`, `ttft`,
+  `token_delay`) or a recorded agent stream like message_stream_01.py (`streaming_response`).
+  """
+  namespace = runpy.run_path(path)
+  if "turns" in namespace:
+    turns = [list(map(tuple, turn)) for turn in namespace["turns"]]
+  else:
+    turns = [compact_updates(namespace["streaming_response"])]
+  fixture = {"turns": turns}
+  for key in ("ttft", "token_delay"):
+    if key in namespace:
+      fixture[key] = namespace[key]
+  return fixture
+
+
+def write_fixture(path: str, turns: list[Turn], ttft: float, token_delay: float, source: str):
+  """Write recorded turns as a compact fixture module that `load_fixture` reads back."""
+  lines = [
+    f"# Recorded from {source} by tests/fixtures/llm_stub.py",
+    f"ttft = {ttft:.3f}",
+    f"token_delay = {token_delay:.4f}",
+    "turns = [",
+  ]
+  for turn in turns:
+    lines.append("  [")
+    lines.extend(f"    {chunk!r}," for chunk in turn)
+    lines.append("  ],")
+  lines.append("]")
+  with open(path, "w", encoding="utf-8") as output:
+    output.write("\n".join(lines) + "\n")
+
+
+def parse_board(prompt: str) -> Optional[list[Optional[Player]]]:
+  """The board after the last "Board:" in a turn prompt, in the compact or box format."""
+  _, found, text = prompt.rpartition("Board:")
+  if not found:
+    return None
+  cells = []
+  for line in text.splitlines():
+    line = line.strip()
+    if "│" in line:
+      cells.extend(cell.strip() for cell in line.strip("│").split("│"))
+    elif re.fullmatch(r"[XO.]{3}", line):
+      cells.extend(line)
+  if len(cells) != 9:
+    return None
+  return [BOARD_CELL.get(cell) for cell in cells]
+
+
+def choose_move(board: list[Optional[Player]], rng: random.Random) -> Optional[int]:
+  """A best move for X by the solver, or the first empty cell if the board isn't reachable."""
+  empty = [position for position, cell in enumerate(board) if cell is None]
+  if not empty:
+    return None
+  try:
+    return rng.choice(get_solver().best_moves(board) or empty)
+  except ValueError:
+    return empty[0]
+
+
+def chat_agent(chat_client: ChatClientProtocol):
+  """make_manager agent: a real tic-tac-toe ChatAgent on `chat_client` (e.g. the stand-in's)."""
+  return partial(create_tic_tac_toe_agent, chat_client=chat_client)
+
+
+def _message_text(item: dict) -> str:
+  content = item.get("content")
+  if isinstance(content, str):
+    return content
+  return "".join(part.get("text", "") for part in content or [] if isinstance(part, dict))
+
+
+class _EventWriter:
+  """
+  Builds one response's output items and, when streaming, writes them as server-sent events over
+  a chunked HTTP body as they grow.
+  """
+
+  def __init__(self, writer: asyncio.StreamWriter, stream: bool):
+    self.writer = writer
+    self.stream = stream
+    self.sequence = itertools.count()
+    self.output: list[dict] = []
+    self.item: Optional[dict] = None
+    self.text: list[str] = []
+
+  async def send(self, event_type: str, **fields) -> None:
+    if not self.stream:
+      return
+    event = {"type": event_type, "sequence_number": next(self.sequence), **fields}
+    data = f"event: {event_type}\ndata: {json.dumps(event)}\n\n".encode()
+    self.writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+    await self.writer.drain()
+
+  async def open(self, item: dict) -> None:
+    await self.close()
+    self.item, self.text = item, []
+    await self.send("response.output_item.added", output_index=len(self.output), item=item)
+
+  async def delta(self, kind: str, text: str, item_id: str) -> None:
+    """Append a reasoning or text delta, opening a new output item when the kind changes."""
+    item_type = "reasoning" if kind == "reasoning" else "message"
+    if self.item is None or self.item["type"] != item_type:
+      item = {"id": item_id, "type": item_type, "summary": []}
+      if item_type == "message":
+        item = {"id": item_id, "type": item_type, "role": "assistant", "content": []}
+      await self.open(item)
+    self.text.append(text)
+    event_type = (
+      "response.reasoning_text.delta" if kind == "reasoning" else "response.output_text.delta"
+    )
+    fields = {} if kind == "reasoning" else {"logprobs": []}
+    await self.send(
+      event_type,
+      item_id=self.item["id"],
+      output_index=len(self.output),
+      content_index=0,
+      delta=text,
+      **fields,
+    )
+
+  async def close(self) -> None:
+    if self.item is None:
+      return
+    item, self.item = self.item, None
+    if item["type"] == "function_call":
+      await self.send(
+        "response.function_call_arguments.done",
+        item_id=item["id"],
+        output_index=len(self.output),
+        arguments=item["arguments"],
+      )
+    elif item["type"] == "reasoning":
+      item["content"] = [{"type": "reasoning_text", "text": "".join(self.text)}]
+    else:
+      item["content"] = [{"type": "output_text", "text": "".join(self.text), "annotations": []}]
+    item["status"] = "completed"
+    await self.send("response.output_item.done", output_index=len(self.output), item=item)
+    self.output.append(item)
+
+
+class StubLLMServer:
+  """
+  OpenAI Responses-compatible stand-in (GET /v1/models, POST /v1/responses, streamed or not).
+
+  A turn's first request streams the recorded chunks before its first tool call, then calls
+  agent_make_move for the board in the prompt (if the request offers that tool); the follow-up
+  request with the tool's output streams the chunks after the turn's last call. Other recorded
+  tool calls are dropped. Turns are served round-robin.
+
+  Timing: `ttft` seconds before the first delta and `token_delay` between deltas, both stretched
+  by in-flight/`capacity` past `capacity` concurrent streams (and answered 429 past twice that).
+  A `error_rate` fraction of requests fail with 500, and a `stall_rate` fraction pause for
+  `stall_seconds` mid-stream.
+
+  With `upstream` set it proxies every request there instead, and `record` names a fixture file
+  (see write_fixture) that the proxied turns are written to as they complete.
+  """
+
+  def __init__(
+    self,
+    turns: Optional[list[Turn]] = None,
+    ttft: float = 0.0,
+    token_delay: float = 0.0,
+    error_rate: float = 0.0,
+    stall_rate: float = 0.0,
+    stall_seconds: float = 5.0,
+    capacity: Optional[int] = None,
+    model: str = "stand-in",
+    seed: Optional[int] = 0,
+    upstream: Optional[str] = None,
+    record: Optional[str] = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+  ):
+    self.turns = turns if turns is not None else load_fixture(DEFAULT_REPLAY)["turns"]
+    self.ttft = ttft
+    self.token_delay = token_delay
+    self.error_rate = error_rate
+    self.stall_rate = stall_rate
+    self.stall_seconds = stall_seconds
+    self.capacity = capacity
+    self.model = model
+    self.upstream = upstream
+    self.record = record
+    self.host = host
+    self.port = port
+    self.rng = random.Random(seed)
+    self.connections = 0
+    self.requests = 0
+    self.errors = 0
+    self.in_flight = 0
+    self._next_turn = itertools.cycle(range(len(self.turns)))
+    self._ids = itertools.count(1)
+    self._turn_by_call: dict[str, int] = {}
+    self._server: asyncio.AbstractServer | None = None
+    self._handlers: dict[asyncio.Task, asyncio.StreamWriter] = {}
+    self._upstream: Optional[httpx.AsyncClient] = None
+    # Recorder state: finished turns, turns waiting on a tool result (by call id) and timings
+    self.recorded: list[Turn] = []
+    self._open_turns: dict[str, Turn] = {}
+    self._first_token_seconds: list[float] = []
+    self._token_gaps: list[float] = []
+
+  @property
+  def base_url(self) -> str:
+    host, port = self._server.sockets[0].getsockname()[:2]
+    return f"http://{host}:{port}/v1"
+
+  async def __aenter__(self) -> "StubLLMServer":
+    if self.upstream:
+      self._upstream = httpx.AsyncClient(base_url=self.upstream.rstrip("/"), timeout=None)
+    self._server = await asyncio.start_server(self._handle, self.host, self.port)
+    return self
+
+  async def __aexit__(self, *exc_info) -> None:
+    self._server.close()
+    for writer in self._handlers.values():
+      writer.close()  # Idle keep-alive connections end their handlers
+    await asyncio.gather(*self._handlers, return_exceptions=True)
+    await self._server.wait_closed()
+    if self._upstream is not None:
+      await self._upstream.aclose()
+
+  async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    self.connections += 1
+    self._handlers[asyncio.current_task()] = writer
+    try:
+      while True:
+        head = await reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        method, path, _ = lines[0].split(" ", 2)
+        headers = {}
+        for line in lines[1:]:
+          name, _, value = line.partition(":")
+          if name:
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+        self.requests += 1
+        if self._upstream is not None:
+          await self._proxy(writer, method, path, headers, body)
+        elif method == "GET" and path.endswith("/models"):
+          self._write_json(writer, 200, {"object": "list", "data": [{"id": self.model}]})
+        elif method == "POST" and path.endswith("/responses"):
+          await self._respond(writer, json.loads(body or b"{}"), len(body))
+        else:
+          self._write_json(writer, 404, {"error": {"message": f"No route for {method} {path}"}})
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+      pass
+    finally:
+      self._handlers.pop(asyncio.current_task(), None)
+      writer.close()
+
+  @staticmethod
+  def _write_json(writer: asyncio.StreamWriter, status: int, body: dict) -> None:
+    data = json.dumps(body).encode()
+    writer.write(
+      f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n".encode()
+      + f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n".encode()
+      + data
+    )
+
+  # ==================== Replay ====================
+
+  def _plan(self, request: dict) -> tuple[Turn, Optional[tuple[str, str]]]:
+    """The chunks to stream for a request and the (call id, arguments) of a move to make."""
+    items = [item for item in request.get("input", []) if isinstance(item, dict)]
+    last = items[-1] if items else {}
+    if last.get("type") == "function_call_output":
+      turn = self.turns[self._turn_by_call.pop(last.get("call_id"), 0)]
+      calls = [index for index, chunk in enumerate(turn) if chunk[0] == "call"]
+      return (turn[calls[-1] + 1 :] if calls else []), None
+
+    index = next(self._next_turn)
+    turn = self.turns[index]
+    tools = {tool.get("name") for tool in request.get("tools") or []}
+    prompts = [_message_text(item) for item in items if item.get("role") == "user"]
+    board = parse_board(prompts[-1]) if prompts else None
+    position = choose_move(board, self.rng) if MOVE_TOOL in tools and board else None
+    if position is None:
+      return [chunk for chunk in turn if chunk[0] != "call"], None
+    first_call = next((i for i, chunk in enumerate(turn) if chunk[0] == "call"), len(turn))
+    call_id = f"call_stub_{next(self._ids)}"
+    self._turn_by_call[call_id] = index
+    return turn[:first_call], (call_id, json.dumps({"position": position}))
+
+  async def _respond(self, writer: asyncio.StreamWriter, request: dict, size: int) -> None:
+    if self.capacity is not None and self.in_flight >= 2 * self.capacity:
+      self.errors += 1
+      self._write_json(writer, 429, {"error": {"message": "Rate limited", "type": "rate_limit"}})
+      return
+    if self.rng.random() < self.error_rate:
+      self.errors += 1
+      self._write_json(writer, 500, {"error": {"message": "Stand-in error", "type": "server"}})
+      return
+    chunks, move = self._plan(request)
+    stall_at = self.rng.randrange(len(chunks) + 1) if self.rng.random() < self.stall_rate else -1
+
+    response = {
+      "id": f"resp_stub_{next(self._ids)}",
+      "object": "response",
+      "created_at": int(time.time()),
+      "model": request.get("model") or self.model,
+      "status": "in_progress",
+      "output": [],
+    }
+    stream = bool(request.get("stream"))
+    if stream:
+      writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n"
+      )
+    self.in_flight += 1
+    try:
+      events = _EventWriter(writer, stream)
+      await events.send("response.created", response=response)
+      await asyncio.sleep(self._delay(self.ttft))
+      for index, (kind, text, *_) in enumerate(chunks):
+        if index:
+          await asyncio.sleep(self._delay(self.token_delay))
+        if index == stall_at:
+          await asyncio.sleep(self.stall_seconds)
+        await events.delta(kind, text, f"{kind[:3]}_{next(self._ids)}")
+      if move is not None:
+        call_id, arguments = move
+        await events.open(
+          {
+            "id": f"fc_{next(self._ids)}",
+            "type": "function_call",
+            "call_id": call_id,
+            "name": MOVE_TOOL,
+            "arguments": arguments,
+          }
+        )
+        await events.send(
+          "response.function_call_arguments.delta",
+          item_id=events.item["id"],
+          output_index=len(events.output),
+          delta=arguments,
+        )
+      await events.close()
+    finally:
+      self.in_flight -= 1
+    output_tokens = len(chunks) + (move is not None)
+    response.update(
+      status="completed",
+      output=events.output,
+      usage={
+        "input_tokens": size // 4,
+        "input_tokens_details": {"cached_tokens": 0},
+        "output_tokens": output_tokens,
+        "output_tokens_details": {
+          "reasoning_tokens": sum(chunk[0] == "reasoning" for chunk in chunks)
+        },
+        "total_tokens": size // 4 + output_tokens,
+      },
+    )
+    if stream:
+      await events.send("response.completed", response=response)
+      writer.write(b"0\r\n\r\n")
+    else:
+      self._write_json(writer, 200, response)
+
+  def _delay(self, seconds: float) -> float:
+    """`seconds`, stretched when more streams are in flight than the stand-in's capacity."""
+    if self.capacity is None:
+      return seconds
+    return seconds * max(1.0, self.in_flight / self.capacity)
+
+  # ==================== Recorder ====================
+
+  async def _proxy(self, writer, method: str, path: str, headers: dict, body: bytes) -> None:
+    """Forward a request upstream and stream its answer back, recording Responses streams."""
+    forwarded = {
+      name: value
+      for name, value in headers.items()
+      if name not in ("host", "content-length", "connection", "accept-encoding")
+    }
+    path = path.split("/v1", 1)[-1]
+    started = time.perf_counter()
+    upstream = await self._upstream.send(
+      self._upstream.build_request(method, path, headers=forwarded, content=body), stream=True
+    )
+    content_type = upstream.headers.get("content-type", "application/json")
+    recording = _Recording(started) if content_type.startswith("text/event-stream") else None
+    try:
+      writer.write(
+        f"HTTP/1.1 {upstream.status_code} {upstream.reason_phrase}\r\n".encode()
+        + f"Content-Type: {content_type}\r\nTransfer-Encoding: chunked\r\n\r\n".encode()
+      )
+      async for data in upstream.aiter_raw():
+        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        await writer.drain()
+        if recording is not None:
+          recording.feed(data)
+      writer.write(b"0\r\n\r\n")
+    finally:
+      await upstream.aclose()
+    if recording is not None and self.record:
+      self._record_response(json.loads(body or b"{}"), recording)
+
+  def _record_response(self, request: dict, recording: "_Recording") -> None:
+    """File a proxied response under its turn; a turn is done once a response makes no calls."""
+    self._first_token_seconds.extend(recording.first_token)
+    self._token_gaps.extend(recording.gaps)
+    results = {
+      item.get("call_id")
+      for item in request.get("input", [])
+      if isinstance(item, dict) and item.get("type") == "function_call_output"
+    }
+    turn = next(
+      (self._open_turns[call_id] for call_id in results if call_id in self._open_turns), []
+    )
+    self._open_turns = {key: value for key, value in self._open_turns.items() if value is not turn}
+    turn.extend(recording.chunks)
+    if recording.call_ids:
+      self._open_turns.update(dict.fromkeys(recording.call_ids, turn))
+      return
+    self.recorded.append(turn)
+    write_fixture(
+      self.record,
+      self.recorded,
+      _mean(self._first_token_seconds),
+      _mean(self._token_gaps),
+      f"{self.upstream} ({request.get('model')})",
+    )
+
+
+class _Recording:
+  """Chunks and token timing of one proxied Responses stream, fed its raw SSE bytes."""
+
+  def __init__(self, started: float):
+    self.started = started
+    self.chunks: Turn = []
+    self.call_ids: list[str] = []
+    self.first_token: list[float] = []
+    self.gaps: list[float] = []
+    self._buffer = b""
+    self._last_token: Optional[float] = None
+
+  def feed(self, data: bytes) -> None:
+    *events, self._buffer = (self._buffer + data).replace(b"\r\n", b"\n").split(b"\n\n")
+    for event in events:
+      lines = event.split(b"\n")
+      payload = b"".join(line[5:].strip() for line in lines if line.startswith(b"data:"))
+      if payload and payload != b"[DONE]":
+        self._event(json.loads(payload))
+
+  def _event(self, event: dict) -> None:
+    kind = event.get("type")
+    if kind in ("response.reasoning_text.delta", "response.reasoning_summary_text.delta"):
+      chunk = ("reasoning", event["delta"])
+    elif kind == "response.output_text.delta":
+      chunk = ("text", event["delta"])
+    elif kind == "response.output_item.done" and event["item"].get("type") == "function_call":
+      item = event["item"]
+      self.call_ids.append(item.get("call_id"))
+      chunk = ("call", item["name"], item.get("arguments", ""))
+    else:
+      return
+    now = time.perf_counter()
+    if self._last_token is None:
+      self.first_token.append(now - self.started)
+    else:
+      self.gaps.append(now - self._last_token)
+    self._last_token = now
+    self.chunks.append(chunk)
+
+
+def _mean(values: list[float]) -> float:
+  return sum(values) / len(values) if values else 0.0
+
+
+async def _serve(args: argparse.Namespace) -> None:
+  fixture = load_fixture(args.replay)
+  server = StubLLMServer(
+    turns=fixture["turns"],
+    ttft=args.ttft if args.ttft is not None else fixture.get("ttft", 0.0),
+    token_delay=(
+      args.token_delay if args.token_delay is not None else fixture.get("token_delay", 0.0)
+    ),
+    error_rate=args.error_rate,
+    stall_rate=args.stall_rate,
+    stall_seconds=args.stall_seconds,
+    capacity=args.capacity,
+    seed=args.seed,
+    upstream=args.upstream,
+    record=args.record,
+    host=args.host,
+    port=args.port,
+  )
+  async with server:
+    mode = f"recording {args.upstream} to {args.record}" if args.upstream else args.replay
+    print(f"Stand-in LLM at {server.base_url} ({mode})")
+    await asyncio.Event().wait()
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+  parser.add_argument("--port", type=int, default=8001, help="Port to listen on")
+  parser.add_argument("--replay", default=DEFAULT_REPLAY, help="Fixture file of turns to serve")
+  parser.add_argument("--ttft", type=float, help="Seconds to first token (default: fixture's)")
+  parser.add_argument("--token-delay", type=float, help="Seconds between tokens")
+  parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction answered 500")
+  parser.add_argument("--stall-rate", type=float, default=0.0, help="Fraction that stall")
+  parser.add_argument("--stall-seconds", type=float, default=5.0, help="Length of a stall")
+  parser.add_argument("--capacity", type=int, help="Streams served at full speed (429 past 2x)")
+  parser.add_argument("--seed", type=int, default=0, help="Seed for errors, stalls and moves")
+  parser.add_argument("--upstream", help="Proxy to this endpoint instead of replaying")
+  parser.add_argument("--record", help="With --upstream, write the proxied turns to this file")
+  args = parser.parse_args()
+  try:
+    asyncio.run(_serve(args))
+  except KeyboardInterrupt:
+    pass
+
+
+if __name__ == "__main__":
+  main()
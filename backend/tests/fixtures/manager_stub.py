@@ -0,0 +1,37 @@
+# backend/tests/fixtures/manager_stub.py
+"""A TicTacToeManager wired to an in-memory socket server and stand-in agents, for tests."""
+
+from typing import Callable, Optional
+
+from src.tic_tac_toe.agent_pool import AgentPool
+from src.tic_tac_toe.manager import TicTacToeManager
+from src.tic_tac_toe.store import SessionStore
+from tests.fixtures.agent_stub import ScriptedAgent
+from tests.fixtures.socket_stub import FakeAsyncServer
+
+
+def make_manager(
+  agent: Callable = ScriptedAgent,
+  timeout: Optional[float] = None,
+  speculation_top_k: Optional[int] = None,
+  max_idle: Optional[int] = None,
+  session_store: Optional[SessionStore] = None,
+) -> tuple[TicTacToeManager, FakeAsyncServer]:
+  """
+  A manager emitting to a FakeAsyncServer, whose agent pool builds each agent as
+  `agent(binding, move_tool)` with the manager's agent_make_move tool for that binding (use
+  functools.partial for more arguments). The other arguments override the settings when given.
+  """
+  sio = FakeAsyncServer()
+  manager = TicTacToeManager(sio)
+  if timeout is not None:
+    manager.agent_move_timeout = timeout
+  if speculation_top_k is not None:
+    manager.speculation_top_k = speculation_top_k
+  if session_store is not None:
+    manager.session_store = session_store
+  manager.agent_pool = AgentPool(
+    lambda binding: agent(binding, manager._create_agent_move_tool(binding)),
+    **({"max_idle": max_idle} if max_idle is not None else {}),
+  )
+  return manager, sio
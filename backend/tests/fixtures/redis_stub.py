@@ -0,0 +1,145 @@
+"""
+In-process stand-in for a Redis server speaking RESP2, covering the commands used by the
+session store and the Socket.IO pub/sub client manager. Expiry is recorded, not enforced.
+"""
+
+import asyncio
+from typing import Optional
+
+
+class StubRedisServer:
+  """
+  Async context manager serving RESP on an ephemeral localhost port.
+  `commands` records every command name received, `expiries` the last EXPIRE per key.
+  """
+
+  def __init__(self):
+    self.data: dict[bytes, bytes | dict[bytes, bytes]] = {}
+    self.expiries: dict[bytes, int] = {}
+    self.commands: list[str] = []
+    self._subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+    self._handlers: set[asyncio.Task] = set()
+    self._server: Optional[asyncio.AbstractServer] = None
+
+  @property
+  def url(self) -> str:
+    host, port = self._server.sockets[0].getsockname()[:2]
+    return f"redis://{host}:{port}/0"
+
+  async def __aenter__(self) -> "StubRedisServer":
+    self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+    return self
+
+  async def __aexit__(self, *exc) -> None:
+    self._server.close()
+    for handler in self._handlers:
+      handler.cancel()
+    await asyncio.gather(*self._handlers, return_exceptions=True)
+    await self._server.wait_closed()
+
+  # ==================== RESP Encoding ====================
+
+  @classmethod
+  def _encode(cls, value) -> bytes:
+    if value is None:
+      return b"$-1\r\n"
+    if isinstance(value, int):
+      return b":%d\r\n" % value
+    if isinstance(value, str):
+      return b"+%s\r\n" % value.encode()
+    if isinstance(value, bytes):
+      return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, Exception):
+      return b"-ERR %s\r\n" % str(value).encode()
+    return b"*%d\r\n" % len(value) + b"".join(cls._encode(item) for item in value)
+
+  @staticmethod
+  async def _read_command(reader: asyncio.StreamReader) -> Optional[list[bytes]]:
+    header = await reader.readline()
+    if not header:
+      return None
+    args = []
+    for _ in range(int(header[1:])):
+      length = int((await reader.readline())[1:])
+      args.append((await reader.readexactly(length + 2))[:-2])
+    return args
+
+  # ==================== Command Handling ====================
+
+  async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    self._handlers.add(asyncio.current_task())
+    queued: Optional[list[tuple[str, list[bytes]]]] = None  # Commands inside MULTI ... EXEC
+    try:
+      while (args := await self._read_command(reader)) is not None:
+        name = args[0].decode().upper()
+        self.commands.append(name)
+        if name == "MULTI":
+          queued, reply = [], "OK"
+        elif name == "EXEC":
+          reply = [self._execute(command, rest, writer) for command, rest in queued or []]
+          queued = None
+        elif queued is not None:
+          queued.append((name, args[1:]))
+          reply = "QUEUED"
+        else:
+          reply = self._execute(name, args[1:], writer)
+        writer.write(self._encode(reply))
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+      pass
+    finally:
+      self._handlers.discard(asyncio.current_task())
+      for writers in self._subscribers.values():
+        writers.discard(writer)
+      writer.close()
+
+  def _hash(self, key: bytes) -> dict[bytes, bytes]:
+    return self.data.setdefault(key, {})
+
+  def _execute(self, name: str, args: list[bytes], writer: asyncio.StreamWriter):
+    if name == "PING":
+      return "PONG"
+    if name in ("CLIENT", "SELECT"):
+      return "OK"
+    if name == "GET":
+      return self.data.get(args[0])
+    if name == "SET":
+      self.data[args[0]] = args[1]
+      return "OK"
+    if name == "DEL":
+      return sum(self.data.pop(key, None) is not None for key in args)
+    if name == "EXISTS":
+      return sum(key in self.data for key in args)
+    if name == "EXPIRE":
+      self.expiries[args[0]] = int(args[1])
+      return int(args[0] in self.data)
+    if name == "HSET":
+      fields = self._hash(args[0])
+      added = sum(field not in fields for field in args[1::2])
+      fields.update(zip(args[1::2], args[2::2]))
+      return added
+    if name == "HGET":
+      return self.data.get(args[0], {}).get(args[1])
+    if name == "HMGET":
+      fields = self.data.get(args[0], {})
+      return [fields.get(field) for field in args[1:]]
+    if name == "HGETALL":
+      return [item for pair in self.data.get(args[0], {}).items() for item in pair]
+    if name == "HINCRBY":
+      fields = self._hash(args[0])
+      fields[args[1]] = b"%d" % (int(fields.get(args[1], b"0")) + int(args[2]))
+      return int(fields[args[1]])
+    if name == "PUBLISH":
+      subscribers = self._subscribers.get(args[0], set())
+      for subscriber in subscribers:
+        subscriber.write(self._encode([b"message", args[0], args[1]]))
+      return len(subscribers)
+    if name == "SUBSCRIBE":
+      replies = []
+      for count, channel in enumerate(args, start=1):
+        self._subscribers.setdefault(channel, set()).add(writer)
+        replies.append(self._encode([b"subscribe", channel, count]))
+      # Each channel gets its own confirmation; the last one is written by the caller
+      writer.write(b"".join(replies[:-1]))
+      return [b"subscribe", args[-1], len(args)]
+    return Exception(f"unknown command '{name}'")
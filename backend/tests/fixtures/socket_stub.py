@@ -0,0 +1,25 @@
+# backend/tests/fixtures/socket_stub.py
+"""In-memory stand-in for socketio.AsyncServer that records handlers and emits."""
+
+
+class FakeAsyncServer:
+  def __init__(self):
+    self.handlers: dict[str, object] = {}
+    self.emitted: list[tuple[str, object, str | None]] = []
+    self.disconnected: list[str] = []
+
+  def on(self, event: str, handler=None):
+    self.handlers[event] = handler
+
+  async def emit(self, event: str, data=None, to: str | None = None, **kwargs) -> None:
+    self.emitted.append((event, data, to))
+
+  async def disconnect(self, sid: str, **kwargs) -> None:
+    """Drop a client, running its disconnect handler like the real server does."""
+    self.disconnected.append(sid)
+    handler = self.handlers.get("disconnect")
+    if handler is not None:
+      await handler(sid)
+
+  def events_for(self, sid: str) -> list[tuple[str, object]]:
+    return [(event, data) for event, data, to in self.emitted if to == sid]
@@ -0,0 +1,152 @@
+import asyncio
+from functools import partial
+
+import pytest
+from agent_framework import AgentRunResponseUpdate, TextContent
+
+from src.tic_tac_toe.manager import TicTacToeManager
+from src.tic_tac_toe.models import Player
+from tests.fixtures.manager_stub import make_manager
+
+DEADLINE = 0.05  # Seconds the agent has to move
+
+
+class StallingAgent:
+  """Streams one chunk of commentary, then hangs (optionally after moving) until cancelled."""
+
+  def __init__(self, binding, move_tool, move_first: bool = False, stall: float = 3600):
+    self.binding = binding
+    self.move_tool = move_tool
+    self.move_first = move_first
+    self.stall = stall
+    self.cancelled = False
+
+  async def run_stream(self, thread, messages):
+    yield AgentRunResponseUpdate(contents=[TextContent(text="Hmm, let me think...")])
+    if self.move_first:
+      await self.move_tool(self.binding.game.get_board().index(None))
+    try:
+      await asyncio.sleep(self.stall)
+    except asyncio.CancelledError:
+      self.cancelled = True
+      raise
+
+
+class SilentAgent:
+  """Finishes its turn without ever calling agent_make_move."""
+
+  def __init__(self, binding, move_tool):
+    self.binding = binding
+
+  async def run_stream(self, thread, messages):
+    yield AgentRunResponseUpdate(contents=[TextContent(text="Your move was... interesting.")])
+
+
+class FailingAgent:
+  """Streams one chunk of commentary, then its LLM request fails."""
+
+  def __init__(self, binding, move_tool):
+    self.binding = binding
+
+  async def run_stream(self, thread, messages):
+    yield AgentRunResponseUpdate(contents=[TextContent(text="Let me see...")])
+    raise ConnectionError("upstream reset")
+
+
+async def _messages(manager: TicTacToeManager, sid: str) -> list[tuple[str, str]]:
+  thread = manager.game_sessions[sid].thread
+  return [
+    (message.role.value, message.text) for message in await thread.message_store.list_messages()
+  ]
+
+
+# ==================== Deadline Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_stalled_agent_is_cancelled_and_engine_moves():
+  manager, sio = make_manager(StallingAgent, timeout=DEADLINE)
+  fallbacks = manager.fallback_moves["timeout"].value
+  await manager.handle_connect("sid-1", {})
+
+  await manager.handle_user_move("sid-1", {"position": 0})
+
+  game_session = manager.game_sessions["sid-1"]
+  assert game_session.agent.cancelled
+  # Perfect play answers a corner opening with the centre
+  assert game_session.game.get_board()[4] == Player.X
+  assert game_session.game.current_player == Player.O
+  events = [
+    "AI_MOVE" if event == "BOARD_DELTA" and data["mark"] == "X" else event
+    for event, data in sio.events_for("sid-1")
+  ]
+  assert events.index("AGENT_STREAM_TOKEN") < events.index("AI_MOVE")
+  assert manager.fallback_moves["timeout"].value == fallbacks + 1
+
+  messages = await _messages(manager, "sid-1")
+  assert [role for role, _ in messages] == ["user", "assistant"]
+  assert messages[1][1] == "(I didn't make my move in time, so X was played at position 4 for me.)"
+
+
+@pytest.mark.asyncio
+async def test_agent_that_moved_may_talk_past_deadline():
+  manager, _ = make_manager(partial(StallingAgent, move_first=True, stall=0.1), timeout=DEADLINE)
+  fallbacks = manager.fallback_moves["timeout"].value
+  await manager.handle_connect("sid-1", {})
+
+  await manager.handle_user_move("sid-1", {"position": 4})
+
+  game_session = manager.game_sessions["sid-1"]
+  assert not game_session.agent.cancelled
+  assert game_session.game.get_board()[0] == Player.X
+  assert manager.fallback_moves["timeout"].value == fallbacks
+
+
+@pytest.mark.asyncio
+async def test_turn_without_move_falls_back_after_stream_ends():
+  manager, _ = make_manager(SilentAgent, timeout=DEADLINE)
+  fallbacks = manager.fallback_moves["no_move"].value
+  await manager.handle_connect("sid-1", {})
+
+  await manager.handle_user_move("sid-1", {"position": 4})
+
+  game_session = manager.game_sessions["sid-1"]
+  assert game_session.game.current_player == Player.O
+  assert game_session.game.get_board().count(Player.X) == 1
+  assert manager.fallback_moves["no_move"].value == fallbacks + 1
+  # No user message is added here: the completed run has already saved the turn
+  ((role, note),) = await _messages(manager, "sid-1")
+  assert role == "assistant"
+  assert note.startswith("(I ended my turn without making a move, so X was played at position")
+
+
+@pytest.mark.asyncio
+async def test_failed_run_falls_back_to_engine_move():
+  manager, _ = make_manager(FailingAgent, timeout=DEADLINE)
+  fallbacks = manager.fallback_moves["error"].value
+  await manager.handle_connect("sid-1", {})
+
+  await manager.handle_user_move("sid-1", {"position": 0})
+
+  game_session = manager.game_sessions["sid-1"]
+  assert game_session.game.get_board()[4] == Player.X
+  assert game_session.game.current_player == Player.O
+  assert manager.fallback_moves["error"].value == fallbacks + 1
+  # The failed run saved nothing, so the turn's prompt is recorded with the note
+  messages = await _messages(manager, "sid-1")
+  assert [role for role, _ in messages] == ["user", "assistant"]
+  assert (
+    messages[1][1] == "(My turn failed before I could move, so X was played at position 4 for me.)"
+  )
+
+
+@pytest.mark.asyncio
+async def test_time_until_ai_move_is_observed():
+  manager, _ = make_manager(timeout=5)
+  observed = manager.ai_move_seconds.count
+  await manager.handle_connect("sid-1", {})
+
+  await manager.handle_user_move("sid-1", {"position": 4})
+
+  assert manager.ai_move_seconds.count == observed + 1
+  assert manager.ai_move_seconds.quantile(0.99) is not None
@@ -0,0 +1,141 @@
+import json
+
+import pytest
+
+from src.tic_tac_toe.agent import create_tic_tac_toe_agent, render_board
+from src.tic_tac_toe.agent_pool import AgentBinding, AgentPool
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import Player
+from src.utils.llm_clients import LLMClientRegistry
+
+
+class FakeAgentFactory:
+  """Counts agent builds and hands back the binding so tests can inspect it."""
+
+  def __init__(self):
+    self.builds = 0
+
+  def __call__(self, binding: AgentBinding):
+    self.builds += 1
+    return {"binding": binding, "build": self.builds}
+
+
+# ==================== Checkout Tests ====================
+
+
+def test_checkout_miss_builds_agent():
+  factory = FakeAgentFactory()
+  pool = AgentPool(factory)
+  game = TicTacToe()
+
+  pooled = pool.checkout("sid-1", game)
+
+  assert factory.builds == 1
+  assert pooled.binding.sid == "sid-1"
+  assert pooled.binding.game is game
+  assert pool.miss_count == 1
+  assert pool.hit_rate == 0.0
+
+
+def test_released_agent_is_reused_and_rebound():
+  factory = FakeAgentFactory()
+  pool = AgentPool(factory)
+  first = pool.checkout("sid-1", TicTacToe())
+  pool.release(first)
+  assert first.binding.sid is None
+  assert first.binding.game is None
+
+  new_game = TicTacToe()
+  second = pool.checkout("sid-2", new_game)
+
+  assert second is first
+  assert factory.builds == 1
+  assert second.binding.sid == "sid-2"
+  assert second.binding.game is new_game
+  assert pool.hit_rate == 0.5
+
+
+def test_warm_up_prebuilds_agents():
+  factory = FakeAgentFactory()
+  pool = AgentPool(factory, max_idle=3)
+
+  assert pool.warm_up(5) == 3
+  assert pool.idle == 3
+
+  pool.checkout("sid-1", TicTacToe())
+  assert pool.hit_count == 1
+  assert pool.miss_count == 0
+  assert pool.checkout_seconds.count >= 1
+
+
+def test_release_drops_agents_beyond_max_idle():
+  pool = AgentPool(FakeAgentFactory(), max_idle=1)
+  first = pool.checkout("sid-1", TicTacToe())
+  second = pool.checkout("sid-2", TicTacToe())
+
+  pool.release(first)
+  pool.release(second)
+
+  assert pool.idle == 1
+
+
+# ==================== Tool Rebinding Tests ====================
+
+
+def test_agent_board_tool_follows_rebinding():
+  registry = LLMClientRegistry()
+  client = registry.get("http://localhost:1234/v1", "model-a", "key")
+
+  async def agent_make_move(position: int) -> dict:
+    return {}
+
+  pool = AgentPool(lambda binding: create_tic_tac_toe_agent(binding, agent_make_move, client))
+  first_game = TicTacToe()
+  pooled = pool.checkout("sid-1", first_game)
+  board_tool = next(
+    tool for tool in pooled.agent.chat_options.tools if tool.name == "get_board_string"
+  )
+  pool.release(pooled)
+
+  second_game = TicTacToe()
+  second_game.make_move(Player.O, 4)
+  assert pool.checkout("sid-2", second_game) is pooled
+  assert board_tool.func() == second_game.get_board_compact() == "...\n.O.\n..."
+  assert board_tool.func() != first_game.get_board_compact()
+
+
+# ==================== Prompt Layout Tests ====================
+
+
+def _agent_prefix(agent) -> tuple[str, str]:
+  """The instructions and tool schemas every request of the agent starts with."""
+  tools = json.dumps([tool.to_json_schema_spec() for tool in agent.chat_options.tools])
+  return agent.chat_options.instructions, tools
+
+
+def test_agents_share_a_byte_identical_prompt_prefix():
+  client = LLMClientRegistry().get("http://localhost:1234/v1", "model-a", "key")
+
+  async def agent_make_move(position: int) -> dict:
+    return {}
+
+  agents = [
+    create_tic_tac_toe_agent(
+      AgentBinding(f"sid-{i}", TicTacToe()), agent_make_move, client, prompt_cache_key="ttt"
+    )
+    for i in range(2)
+  ]
+
+  assert _agent_prefix(agents[0]) == _agent_prefix(agents[1])
+  assert agents[0].chat_options.additional_properties["prompt_cache_key"] == "ttt"
+
+
+def test_render_board_formats():
+  game = TicTacToe()
+  game.make_move(Player.O, 0)
+  game.make_move(Player.X, 8)
+
+  assert render_board(game) == "O..\n...\n..X"
+  assert render_board(game, "box") == game.get_board_string()
+  with pytest.raises(ValueError):
+    render_board(game, "emoji")
@@ -0,0 +1,60 @@
+import inspect
+import random
+
+import pytest
+
+from src.tic_tac_toe.bitboard import BitboardTicTacToe, create_game
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import GameStatus, Player
+from tests.unit import test_game_logic
+
+GAME_LOGIC_TESTS = [
+  test
+  for name, test in inspect.getmembers(test_game_logic, inspect.isfunction)
+  if name.startswith("test_")
+]
+
+
+# ==================== Compatibility Tests ====================
+
+
+@pytest.mark.parametrize("test", GAME_LOGIC_TESTS, ids=lambda test: test.__name__)
+def test_game_logic_suite_passes_on_bitboard(test, monkeypatch):
+  """Run the list engine's game logic suite, unchanged, against the bitboard engine."""
+  monkeypatch.setattr(test_game_logic, "TicTacToe", BitboardTicTacToe)
+  test()
+
+
+def test_random_games_match_list_engine():
+  rng = random.Random(1234)
+  for _ in range(2_000):
+    reference, bitboard = TicTacToe(), BitboardTicTacToe()
+    for _ in range(12):
+      # Mostly legal moves, with some wrong-turn, occupied and out-of-range attempts
+      player = reference.current_player if rng.random() < 0.9 else rng.choice(list(Player))
+      position = rng.randint(-1, 9)
+      expected = reference.make_move(player, position)
+      actual = bitboard.make_move(player, position)
+      assert actual.to_json() == expected.to_json()
+      assert bitboard.get_game_status() == reference.get_game_status()
+    assert bitboard.game_log == reference.game_log
+    assert bitboard.get_board_string() == reference.get_board_string()
+
+
+def test_load_state_rebuilds_bitboards():
+  game = BitboardTicTacToe()
+  for position in (0, 3, 1, 4, 2):  # O completes the top row
+    game.make_move(game.current_player, position)
+
+  restored = BitboardTicTacToe()
+  restored.load_state(game.export_state())
+
+  assert restored.get_game_status() == (GameStatus.WIN, Player.O)
+  assert restored.get_board() == game.get_board()
+
+
+def test_create_game_by_engine_name():
+  assert type(create_game("bitboard")) is BitboardTicTacToe
+  assert type(create_game("list")) is TicTacToe
+  with pytest.raises(ValueError):
+    create_game("quantum")
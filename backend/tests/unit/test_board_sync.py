@@ -0,0 +1,152 @@
+import random
+
+import pytest
+
+from src.tic_tac_toe.manager import TicTacToeManager
+from tests.fixtures.board_client import BoardSyncClient
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.socket_stub import FakeAsyncServer
+
+BOARD_EVENTS = ("BOARD_SNAPSHOT", "BOARD_DELTA")
+
+
+async def _play(manager: TicTacToeManager, sio: FakeAsyncServer) -> list[tuple[str, dict]]:
+  """Connect and play three O moves (the agent answers each); returns the board events."""
+  await manager.handle_connect("sid-1", {})
+  for position in (4, 8, 2):
+    await manager.handle_user_move("sid-1", {"position": position})
+  return [(event, data) for event, data in sio.events_for("sid-1") if event in BOARD_EVENTS]
+
+
+async def _sync(manager: TicTacToeManager, sio: FakeAsyncServer, client: BoardSyncClient) -> None:
+  """Answer the client's BOARD_SYNC requests and deliver the replies."""
+  while client.sync_requests:
+    sio.emitted.clear()
+    await manager.handle_board_sync("sid-1", client.sync_requests.pop(0))
+    for event, data in sio.events_for("sid-1"):
+      client.receive(event, data)
+
+
+def _server_board(manager: TicTacToeManager) -> list[str | None]:
+  return [cell.value if cell else None for cell in manager.game_sessions["sid-1"].game.get_board()]
+
+
+# ==================== Server Protocol Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_one_snapshot_then_one_delta_per_move():
+  manager, sio = make_manager()
+
+  events = await _play(manager, sio)
+
+  assert [event for event, _ in events] == ["BOARD_SNAPSHOT"] + ["BOARD_DELTA"] * 6
+  assert [data["v"] for _, data in events] == list(range(1, 8))
+  assert events[1][1] == {"v": 2, "pos": 4, "mark": "O", "status": "ongoing"}
+  assert events[2][1] == {"v": 3, "pos": 0, "mark": "X", "status": "ongoing"}
+  assert "USER_MOVE_RESULT" not in [event for event, _ in sio.events_for("sid-1")]
+
+
+@pytest.mark.asyncio
+async def test_reset_sends_snapshot_with_higher_version():
+  manager, sio = make_manager()
+  await _play(manager, sio)
+  sio.emitted.clear()
+
+  await manager.handle_game_initialization("sid-1")
+
+  assert sio.events_for("sid-1") == [
+    ("BOARD_SNAPSHOT", {"v": 8, "board": [None] * 9, "status": "ongoing"})
+  ]
+
+
+@pytest.mark.asyncio
+async def test_sync_at_current_version_sends_nothing():
+  manager, sio = make_manager()
+  await _play(manager, sio)
+  sio.emitted.clear()
+
+  await manager.handle_board_sync("sid-1", {"v": 7})
+
+  assert sio.events_for("sid-1") == []
+
+
+# ==================== Client Reconciliation Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_client_recovers_lost_deltas():
+  manager, sio = make_manager()
+  events = await _play(manager, sio)
+  client = BoardSyncClient()
+
+  for event, data in events:
+    if data["v"] not in (3, 5):  # Drop two deltas in flight
+      client.receive(event, data)
+  assert client.sync_requests == [{"v": 2}]
+  await _sync(manager, sio, client)
+
+  assert client.version == 7
+  assert client.board == _server_board(manager)
+  assert client.pending == {}
+
+
+@pytest.mark.asyncio
+async def test_client_reorders_out_of_order_deltas():
+  manager, sio = make_manager()
+  events = await _play(manager, sio)
+  rng = random.Random(7)
+
+  for _ in range(50):
+    client = BoardSyncClient()
+    client.receive(*events[0])
+    deltas = events[1:] + events[1:3]  # Shuffled, with some duplicates
+    rng.shuffle(deltas)
+    for event, data in deltas:
+      client.receive(event, data)
+    await _sync(manager, sio, client)
+
+    assert client.version == 7
+    assert client.board == _server_board(manager)
+
+
+@pytest.mark.asyncio
+async def test_client_follows_session_recreated_after_eviction():
+  manager, sio = make_manager()
+  client = BoardSyncClient()
+  for event, data in await _play(manager, sio):
+    client.receive(event, data)
+  manager.game_sessions.idle_ttl = 0
+  manager.game_sessions.sweep()
+  sio.emitted.clear()
+
+  await manager.handle_user_move("sid-1", {"position": 0})
+  for event, data in sio.events_for("sid-1"):
+    client.receive(event, data)
+
+  assert manager.game_sessions["sid-1"].game.version < 7  # The new session starts over
+  assert client.version == manager.game_sessions["sid-1"].game.version
+  assert client.board == _server_board(manager)
+
+
+@pytest.mark.asyncio
+async def test_client_follows_new_session_after_reconnect():
+  manager, sio = make_manager()
+  client = BoardSyncClient()
+  for event, data in await _play(manager, sio):
+    client.receive(event, data)
+  client.receive("BOARD_DELTA", {"v": 9, "pos": 6, "mark": "O", "status": "ongoing"})
+  await manager.handle_disconnect("sid-1")
+
+  client.connect()
+  await manager.handle_connect("sid-2", {})
+  await manager.handle_user_move("sid-2", {"position": 4})
+  for event, data in sio.events_for("sid-2"):
+    if event in BOARD_EVENTS:
+      client.receive(event, data)
+
+  assert client.version == 3
+  assert client.board == [
+    cell.value if cell else None for cell in manager.game_sessions["sid-2"].game.get_board()
+  ]
+  assert client.pending == {}
@@ -0,0 +1,179 @@
+import asyncio
+from functools import partial
+
+import pytest
+from agent_framework import AgentRunResponseUpdate, TextContent
+
+from src.tic_tac_toe.manager import TicTacToeManager
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.socket_stub import FakeAsyncServer
+
+
+class SlowAgent:
+  """
+  Streams a chunk of commentary every 10ms and moves after `move_after` chunks; records whether
+  its stream was closed. A `stubborn` agent ignores cancellation long enough to try its move.
+  """
+
+  def __init__(self, binding, move_tool, move_after: int = 50, stubborn: bool = False):
+    self.binding = binding
+    self.move_tool = move_tool
+    self.move_after = move_after
+    self.stubborn = stubborn
+    self.started = asyncio.Event()
+    self.closed = False
+
+  async def run_stream(self, thread, messages):
+    try:
+      for chunk in range(self.move_after):
+        yield AgentRunResponseUpdate(contents=[TextContent(text=f"chunk {chunk} ")])
+        self.started.set()
+        await asyncio.sleep(0.01)
+      await self.move_tool(self.binding.game.get_board().index(None))
+    except asyncio.CancelledError:
+      if self.stubborn:
+        await self.move_tool(self.binding.game.get_board().index(None))
+      raise
+    finally:
+      self.closed = True
+
+
+def _manager(**agent_kwargs) -> tuple[TicTacToeManager, FakeAsyncServer]:
+  return make_manager(partial(SlowAgent, **agent_kwargs), timeout=5)
+
+
+def _events_after_snapshot(sio: FakeAsyncServer, sid: str) -> list[str]:
+  events = [event for event, _ in sio.events_for(sid)]
+  last_snapshot = len(events) - 1 - events[::-1].index("BOARD_SNAPSHOT")
+  return events[last_snapshot + 1 :]
+
+
+def _leaked_tasks() -> list[asyncio.Task]:
+  return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+
+# ==================== Reset and Disconnect Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_reset_cancels_the_agent_turn_without_stale_emits():
+  manager, sio = _manager()
+  await manager.handle_connect("sid-1", {})
+  game_session = manager.game_sessions["sid-1"]
+  move = asyncio.create_task(manager.handle_user_move("sid-1", {"position": 4}))
+  await game_session.agent.started.wait()
+
+  await manager.handle_game_initialization("sid-1")
+  await move  # The interrupted handler returns quietly
+  await asyncio.sleep(0.1)  # Past the batcher's flush delay and the agent's next chunks
+
+  assert game_session.agent.closed
+  assert _events_after_snapshot(sio, "sid-1") == []
+  assert game_session.game.get_board() == [None] * 9
+  assert game_session.turn_task is None
+  assert _leaked_tasks() == []
+
+
+@pytest.mark.asyncio
+async def test_stale_move_from_an_uncooperative_run_is_dropped():
+  manager, sio = _manager(stubborn=True)
+  await manager.handle_connect("sid-1", {})
+  game_session = manager.game_sessions["sid-1"]
+  move = asyncio.create_task(manager.handle_user_move("sid-1", {"position": 4}))
+  await game_session.agent.started.wait()
+
+  await manager.handle_game_initialization("sid-1")
+  await move
+
+  # The agent's move came after the reset began, so it was never played or sent
+  marks = [data["mark"] for event, data in sio.events_for("sid-1") if event == "BOARD_DELTA"]
+  assert marks == ["O"]
+  assert game_session.game.get_board() == [None] * 9
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_the_agent_turn():
+  manager, sio = _manager()
+  await manager.handle_connect("sid-1", {})
+  agent = manager.game_sessions["sid-1"].agent
+  move = asyncio.create_task(manager.handle_user_move("sid-1", {"position": 4}))
+  await agent.started.wait()
+  emitted = len(sio.emitted)
+
+  await manager.handle_disconnect("sid-1")
+  await move
+  await asyncio.sleep(0.1)
+
+  assert agent.closed
+  assert len(sio.emitted) == emitted
+  assert "sid-1" not in manager.game_sessions
+  assert _leaked_tasks() == []
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_disconnect_drops_the_session():
+  manager, sio = _manager()
+  await manager.handle_connect("sid-1", {})
+  idle = manager.agent_pool.idle
+  channel = manager.outbound["sid-1"]
+  channel._transport_depth = lambda: channel.max_transport_packets  # The transport is backed up
+  channel.max_bytes = 10
+
+  # Through the mailbox, so the send that finds the client too slow runs in the session's handler
+  await sio.handlers["USER_MOVE"]("sid-1", {"position": 4})
+  await asyncio.sleep(0.1)
+
+  assert sio.disconnected == ["sid-1"]
+  assert "sid-1" not in manager.game_sessions
+  assert "sid-1" not in manager.mailboxes
+  assert manager.agent_pool.idle == idle + 1
+  assert _leaked_tasks() == []
+
+
+@pytest.mark.asyncio
+async def test_evicted_session_releases_its_agent_once_the_turn_unwinds():
+  manager, sio = _manager()
+  await manager.handle_connect("sid-1", {})
+  agent = manager.game_sessions["sid-1"].agent
+  released_after_close = []
+  release = manager.agent_pool.release
+
+  def record_release(pooled) -> None:
+    released_after_close.append(agent.closed)
+    release(pooled)
+
+  manager.agent_pool.release = record_release
+  await sio.handlers["USER_MOVE"]("sid-1", {"position": 4})
+  await agent.started.wait()
+
+  manager.game_sessions.idle_ttl = 0
+  manager.game_sessions.sweep()
+  assert released_after_close == []  # The turn is still unwinding
+  await asyncio.sleep(0.05)
+
+  assert released_after_close == [True]
+  assert "sid-1" not in manager.mailboxes
+  assert _leaked_tasks() == []
+
+
+# ==================== Barge-in Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_new_query_interrupts_the_running_answer():
+  manager, sio = _manager(move_after=5)
+  await manager.handle_connect("sid-1", {})
+  agent = manager.game_sessions["sid-1"].agent
+  first = asyncio.create_task(manager.handle_post_game_query("sid-1", {"query": "Why?"}))
+  await agent.started.wait()
+  await asyncio.sleep(0.015)
+
+  await manager.handle_post_game_query("sid-1", {"query": "Really?"})
+  await first
+
+  answers = [data["text"] for event, data in sio.events_for("sid-1") if event == "ai_message"]
+  # The first answer stopped after its first couple of chunks; the second ran to the end
+  assert 0 < answers.index("chunk 0 ", 1) < 5
+  assert answers[-5:] == [f"chunk {i} " for i in range(5)]
+  assert manager.game_sessions["sid-1"].query_task is None
+  assert _leaked_tasks() == []
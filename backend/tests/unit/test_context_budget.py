@@ -0,0 +1,136 @@
+import pytest
+from agent_framework import AgentThread, ChatMessage
+
+from src.tic_tac_toe.context_budget import ContextBudget
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import Player
+from src.tic_tac_toe.store import decode_session, encode_session
+from tests.fixtures.manager_stub import make_manager
+
+
+def _game(*moves: int) -> TicTacToe:
+  game = TicTacToe()
+  for turn, position in enumerate(moves):
+    game.make_move(Player.O if turn % 2 == 0 else Player.X, position)
+  return game
+
+
+async def _exchange(thread: AgentThread, text: str) -> None:
+  await thread.on_new_messages(
+    [ChatMessage(role="user", text=text), ChatMessage(role="assistant", text=f"re: {text}")]
+  )
+
+
+def _texts(thread: AgentThread) -> list[str]:
+  return [message.text for message in thread.message_store.messages]
+
+
+# ==================== Summary Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_close_game_summarizes_the_move_list_and_outcome():
+  thread = AgentThread()
+  budget = ContextBudget()
+
+  await budget.close_game(thread, _game(0, 4, 1, 8, 2))  # O takes the top row
+  await budget.close_game(thread, _game(4, 0))
+  await budget.close_game(thread, TicTacToe())  # Nothing played, nothing to summarize
+
+  assert _texts(thread) == [
+    "Game 1 (O = human, X = you): O0 X4 O1 X8 O2 - the human won.",
+    "Game 2 (O = human, X = you): O4 X0 - reset before it finished.",
+  ]
+
+
+@pytest.mark.asyncio
+async def test_old_summaries_fold_into_a_tally():
+  thread = AgentThread()
+  budget = ContextBudget(max_game_summaries=2)
+
+  await budget.close_game(thread, _game(0, 4, 1, 8, 2))  # Human wins
+  await budget.close_game(thread, _game(0, 4, 1, 2, 6, 3, 5, 8, 7))  # Tie
+  await budget.close_game(thread, _game(0, 4, 8, 2, 1, 6))  # AI wins (X on 2-4-6)
+  await budget.close_game(thread, _game(4))
+
+  texts = _texts(thread)
+  assert (
+    texts[0] == "Before the games below you played 2 games: you won 0, the human won 1, 1 ties."
+  )
+  assert texts[1].startswith("Game 3 ") and texts[1].endswith("you won.")
+  assert texts[2].startswith("Game 4 ")
+  assert len(texts) == 3
+
+
+# ==================== Trim Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_trim_keeps_the_last_exchanges_and_all_summaries():
+  thread = AgentThread()
+  budget = ContextBudget(max_exchanges=2)
+  await _exchange(thread, "a")
+  await budget.close_game(thread, _game(4))
+  await _exchange(thread, "b")
+  await _exchange(thread, "c")
+
+  await budget.trim(thread)
+
+  assert _texts(thread) == [
+    "Game 1 (O = human, X = you): O4 - reset before it finished.",
+    "b",
+    "re: b",
+    "c",
+    "re: c",
+  ]
+
+
+@pytest.mark.asyncio
+async def test_trim_within_budget_leaves_thread_untouched():
+  thread = AgentThread()
+  await _exchange(thread, "a")
+  messages = list(thread.message_store.messages)
+
+  await ContextBudget(max_exchanges=1).trim(thread)
+  await ContextBudget(max_exchanges=0).trim(AgentThread())  # No store yet
+
+  assert thread.message_store.messages == messages
+
+
+@pytest.mark.asyncio
+async def test_summaries_survive_the_session_store_round_trip():
+  thread = AgentThread()
+  budget = ContextBudget(max_game_summaries=1)
+  await budget.close_game(thread, _game(0, 4, 1, 8, 2))
+  await budget.close_game(thread, _game(4))
+
+  _, restored = await decode_session(await encode_session(TicTacToe(), thread))
+  await budget.close_game(restored, _game(0))
+
+  assert _texts(restored)[0].startswith("Before the games below you played 2 games")
+  assert _texts(restored)[1].startswith("Game 3 ")
+
+
+# ==================== Manager Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_thread_stays_bounded_over_many_games():
+  manager, _ = make_manager()
+  await manager.handle_connect("sid-1", {})
+  manager.game_sessions["sid-1"].context = ContextBudget(max_exchanges=3, max_game_summaries=2)
+
+  sizes = []
+  for _ in range(10):
+    for position in (4, 8, 6):  # The scripted agent fills 0, 1, 2 and wins on the third
+      await manager.handle_user_move("sid-1", {"position": position})
+    await manager.handle_game_initialization("sid-1")
+    sizes.append(len(manager.game_sessions["sid-1"].thread.message_store.messages))
+
+  # Tally + 2 summaries + 3 exchanges of a user and an agent message, from the third game on
+  assert sizes[2:] == [9] * 8
+  texts = _texts(manager.game_sessions["sid-1"].thread)
+  assert (
+    texts[0] == "Before the games below you played 8 games: you won 8, the human won 0, 0 ties."
+  )
+  assert texts[-1] == "Game 10 (O = human, X = you): O4 X0 O8 X1 O6 X2 - you won."
@@ -0,0 +1,170 @@
+import asyncio
+from functools import partial
+
+import pytest
+from agent_framework import AgentRunResponseUpdate, TextContent
+
+from src.tic_tac_toe.manager import TicTacToeManager
+from src.tic_tac_toe.models import Player
+from src.utils.llm_scheduler import LLMScheduler
+from src.utils.mailbox import Mailbox
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.socket_stub import FakeAsyncServer
+
+
+class Concurrency:
+  def __init__(self):
+    self.running = 0
+    self.max_running = 0
+
+
+class PacedAgent:
+  """Comments, waits `delay` seconds, then plays X in the first empty cell; counts overlap."""
+
+  def __init__(self, binding, move_tool, concurrency: Concurrency, delay: float):
+    self.binding = binding
+    self.move_tool = move_tool
+    self.concurrency = concurrency
+    self.delay = delay
+
+  async def run_stream(self, thread, messages):
+    self.concurrency.running += 1
+    self.concurrency.max_running = max(self.concurrency.max_running, self.concurrency.running)
+    try:
+      yield AgentRunResponseUpdate(contents=[TextContent(text="Let me see...")])
+      await asyncio.sleep(self.delay)
+      await self.move_tool(self.binding.game.get_board().index(None))
+    finally:
+      self.concurrency.running -= 1
+
+
+def _manager(delay: float = 0.02) -> tuple[TicTacToeManager, FakeAsyncServer, Concurrency]:
+  concurrency = Concurrency()
+  manager, sio = make_manager(partial(PacedAgent, concurrency=concurrency, delay=delay), timeout=5)
+  return manager, sio, concurrency
+
+
+async def _drain(manager: TicTacToeManager, sid: str) -> None:
+  """Wait until the session's mailbox has handled everything queued."""
+  mailbox = manager.mailboxes[sid]
+  while mailbox.depth or mailbox.current:
+    await asyncio.sleep(0.005)
+
+
+def _moves(sio: FakeAsyncServer, sid: str) -> list[tuple[str, int]]:
+  return [
+    (data["mark"], data["pos"]) for event, data in sio.events_for(sid) if event == "BOARD_DELTA"
+  ]
+
+
+def _busy(sio: FakeAsyncServer, sid: str) -> list[str]:
+  return [data["reason"] for event, data in sio.events_for(sid) if event == "BUSY"]
+
+
+# ==================== Ordering Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_rapid_moves_are_handled_in_order_never_concurrently():
+  manager, sio, concurrency = _manager()
+  await manager.handle_connect("sid-1", {})
+  user_move = sio.handlers["USER_MOVE"]
+
+  await user_move("sid-1", {"position": 4})
+  await asyncio.sleep(0.005)  # The first move is in flight
+  await user_move("sid-1", {"position": 8})  # Queued behind it
+  await user_move("sid-1", {"position": 8})  # Double-click: coalesced
+  await user_move("sid-1", {"position": 6})  # A different move while one waits: rejected
+  await _drain(manager, "sid-1")
+
+  assert concurrency.max_running == 1
+  assert _moves(sio, "sid-1") == [("O", 4), ("X", 0), ("O", 8), ("X", 1)]
+  assert _busy(sio, "sid-1") == ["move_pending"]
+
+
+@pytest.mark.asyncio
+async def test_reset_cuts_short_the_turn_and_drops_queued_moves():
+  manager, sio, _ = _manager(delay=3600)
+  await manager.handle_connect("sid-1", {})
+  await sio.handlers["USER_MOVE"]("sid-1", {"position": 4})
+  await asyncio.sleep(0.005)
+  await sio.handlers["USER_MOVE"]("sid-1", {"position": 8})
+
+  await sio.handlers["GAME_RESET"]("sid-1", {})
+  await _drain(manager, "sid-1")
+
+  assert _moves(sio, "sid-1") == [("O", 4)]
+  assert [event for event, _ in sio.events_for("sid-1")][-1] == "BOARD_SNAPSHOT"
+  assert manager.game_sessions["sid-1"].game.get_board() == [None] * 9
+
+
+@pytest.mark.asyncio
+async def test_full_mailbox_signals_backpressure():
+  manager, sio, _ = _manager(delay=3600)
+  await manager.handle_connect("sid-1", {})
+  manager.mailboxes["sid-1"] = Mailbox("sid-1", maxsize=1)
+  await sio.handlers["USER_MOVE"]("sid-1", {"position": 4})
+  await asyncio.sleep(0.005)
+
+  await sio.handlers["post_game_query"]("sid-1", {"query": "Scared?"})
+  await sio.handlers["USER_MOVE"]("sid-1", {"position": 8})
+
+  assert _busy(sio, "sid-1") == ["queue_full"]
+  await manager.handle_disconnect("sid-1")
+
+
+# ==================== Isolation Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_handled_concurrently():
+  manager, sio, concurrency = _manager()
+  for sid in ("sid-1", "sid-2", "sid-3"):
+    await manager.handle_connect(sid, {})
+
+  for sid in ("sid-1", "sid-2", "sid-3"):
+    await sio.handlers["USER_MOVE"](sid, {"position": 4})
+  for sid in ("sid-1", "sid-2", "sid-3"):
+    await _drain(manager, sid)
+
+  assert concurrency.max_running == 3
+  for sid in ("sid-1", "sid-2", "sid-3"):
+    assert manager.game_sessions[sid].game.get_board()[0] == Player.X
+
+
+@pytest.mark.asyncio
+async def test_turns_beyond_llm_capacity_are_queued_and_told_their_place():
+  manager, sio, concurrency = _manager()
+  manager.llm_scheduler = LLMScheduler(max_concurrency=1)
+  sids = ("sid-1", "sid-2", "sid-3")
+  for sid in sids:
+    await manager.handle_connect(sid, {})
+
+  for sid in sids:
+    await sio.handlers["USER_MOVE"](sid, {"position": 4})
+  for sid in sids:
+    await _drain(manager, sid)
+
+  assert concurrency.max_running == 1
+  queued = [[data for event, data in sio.events_for(sid) if event == "QUEUED"] for sid in sids]
+  assert queued == [
+    [],
+    [{"event": "USER_MOVE", "position": 1}],
+    [{"event": "USER_MOVE", "position": 2}],
+  ]
+  for sid in sids:
+    assert manager.game_sessions[sid].game.get_board()[0] == Player.X
+
+
+@pytest.mark.asyncio
+async def test_disconnect_closes_the_mailbox():
+  manager, sio, _ = _manager(delay=3600)
+  await manager.handle_connect("sid-1", {})
+  await sio.handlers["USER_MOVE"]("sid-1", {"position": 4})
+  await asyncio.sleep(0.005)
+
+  await manager.handle_disconnect("sid-1")
+
+  assert "sid-1" not in manager.mailboxes
+  await asyncio.sleep(0)  # Let cancelled timers unwind
+  assert [task for task in asyncio.all_tasks() if task is not asyncio.current_task()] == []
@@ -0,0 +1,105 @@
+import pytest
+
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.game_log import SNAPSHOT_INTERVAL, GameLog
+from src.tic_tac_toe.models import MoveRecord, Player
+
+
+def _played() -> TicTacToe:
+  """O takes the left column on turn 5, with two rejected moves along the way."""
+  game = TicTacToe()
+  game.make_move(Player.O, 0)
+  game.make_move(Player.X, 4)
+  game.make_move(Player.X, 8)  # Rejected: not X's turn
+  game.make_move(Player.O, 4)  # Rejected: occupied
+  game.make_move(Player.O, 3)
+  game.make_move(Player.X, 1)
+  game.make_move(Player.O, 6)
+  return game
+
+
+# ==================== Recording Tests ====================
+
+
+def test_records_unpack_to_move_records():
+  game = _played()
+
+  assert game.game_log[2] == MoveRecord(3, Player.X, 8, False)
+  assert game.game_log[-1] == MoveRecord(5, Player.O, 6, True)
+  assert [record.success for record in game.game_log] == [
+    True,
+    True,
+    False,
+    False,
+    True,
+    True,
+    True,
+  ]
+
+
+def test_rejected_positions_are_kept():
+  log = GameLog()
+  log.record(1, Player.O, -1, False)
+  log.record(1, Player.O, 1_000, False)
+
+  assert [record.position for record in log] == [-1, 1_000]
+
+
+def test_rejected_moves_are_capped():
+  game = TicTacToe()
+  game.game_log = GameLog(max_failures=3)
+  for _ in range(10):
+    game.make_move(Player.X, 0)
+  game.make_move(Player.O, 0)
+
+  assert len(game.game_log) == 4
+  assert game.game_log.dropped_failures == 7
+  assert game.game_log[-1] == MoveRecord(1, Player.O, 0, True)
+
+
+# ==================== Replay Tests ====================
+
+
+@pytest.mark.parametrize("upto_turn", range(0, 7))
+def test_replay_matches_board_after_each_turn(upto_turn):
+  reference = TicTacToe()
+  for turn, (player, position) in enumerate(
+    [(Player.O, 0), (Player.X, 4), (Player.O, 3), (Player.X, 1), (Player.O, 6)], start=1
+  ):
+    if turn <= upto_turn:
+      reference.make_move(player, position)
+
+  assert _played().game_log.replay(upto_turn) == reference.get_board()
+
+
+def test_replay_uses_snapshots():
+  game = _played()
+
+  assert len(game.game_log._snapshots) == 5 // SNAPSHOT_INTERVAL
+  assert game.game_log.replay() == game.get_board()
+
+
+# ==================== Export Tests ====================
+
+
+def test_export_round_trip():
+  game = _played()
+  events = game.game_log.export()
+
+  restored = GameLog.from_export(events)
+
+  assert all(isinstance(event, int) for event in events)
+  assert restored == game.game_log
+  assert restored.replay() == game.get_board()
+
+
+def test_load_state_derives_board_from_log():
+  game = _played()
+  state = game.export_state()
+
+  restored = TicTacToe()
+  restored.load_state(state)
+
+  assert "board" not in state
+  assert restored.get_board() == game.get_board()
+  assert restored.get_game_status() == game.get_game_status()
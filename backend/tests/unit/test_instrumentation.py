@@ -0,0 +1,96 @@
+from functools import partial
+
+import pytest
+
+from src.tic_tac_toe.manager import USER_MOVE_PHASES, TicTacToeManager
+from src.utils.metrics import metrics
+from tests.fixtures.agent_stub import ScriptedAgent
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.message_stream_01 import streaming_response
+
+
+class FailingAgent:
+  def __init__(self, binding, move_tool):
+    self.binding = binding
+
+  async def run_stream(self, thread, messages):
+    raise ConnectionError("upstream reset")
+    yield
+
+
+def _manager(agent=ScriptedAgent) -> TicTacToeManager:
+  manager, _ = make_manager(agent, timeout=0.05)
+  return manager
+
+
+def _counts(manager: TicTacToeManager) -> dict[str, int]:
+  return {phase: histogram.count for phase, histogram in manager.user_move_seconds.items()}
+
+
+# ==================== Move Latency Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_user_move_phases_are_timed():
+  manager = _manager(partial(ScriptedAgent, stream=streaming_response))
+  before = _counts(manager)
+  rates = manager.output_tokens_per_second.count
+  emitted = metrics.counter("socket_events_emitted_total", labels={"event": "BOARD_DELTA"}).value
+  await manager.handle_connect("sid-1", {})
+
+  await manager.handle_user_move("sid-1", {"position": 0})
+
+  assert {phase: count - before[phase] for phase, count in _counts(manager).items()} == {
+    phase: 1 for phase in USER_MOVE_PHASES
+  }
+  total = manager.user_move_seconds["total"]
+  assert total.sum >= manager.user_move_seconds["agent_move"].sum
+  assert manager.output_tokens_per_second.count == rates + 1
+  # The human's move and the agent's
+  assert metrics.counter("socket_events_emitted_total", labels={"event": "BOARD_DELTA"}).value == (
+    emitted + 2
+  )
+
+
+@pytest.mark.asyncio
+async def test_rejected_move_is_only_timed_in_total():
+  manager = _manager()
+  await manager.handle_connect("sid-1", {})
+  await manager.handle_user_move("sid-1", {"position": 0})
+  before = _counts(manager)
+
+  await manager.handle_user_move("sid-1", {"position": 0})  # Taken
+
+  after = _counts(manager)
+  assert after["total"] == before["total"] + 1
+  assert after["validate"] == before["validate"]
+
+
+# ==================== Connection and Error Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_connections_gauge_tracks_connected_clients():
+  manager = _manager()
+  connected = manager.connections.value
+
+  await manager.handle_connect("sid-1", {})
+  await manager.handle_connect("sid-2", {})
+  await manager.handle_disconnect("sid-1")
+
+  assert manager.connections.value == connected + 1
+
+
+@pytest.mark.asyncio
+async def test_failed_agent_runs_are_counted_by_error():
+  manager = _manager(FailingAgent)
+  errors = metrics.counter("llm_errors_total", labels={"error": "ConnectionError"})
+  failed = errors.value
+  fallbacks = manager.fallback_moves["error"].value
+  await manager.handle_connect("sid-1", {})
+
+  await manager.handle_user_move("sid-1", {"position": 0})
+
+  assert errors.value == failed + 1
+  assert manager.fallback_moves["error"].value == fallbacks + 1
+  assert manager.user_move_seconds["total"].count >= 1
@@ -0,0 +1,122 @@
+import time
+
+import pytest
+from agent_framework.openai import OpenAIResponsesClient
+from openai import AsyncOpenAI, InternalServerError
+
+from src.tic_tac_toe.agent import render_board
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.manager import TicTacToeManager
+from src.tic_tac_toe.models import Player
+from tests.fixtures.llm_stub import StubLLMServer, chat_agent, load_fixture, parse_board
+from tests.fixtures.manager_stub import make_manager
+
+
+def _manager(base_url: str) -> TicTacToeManager:
+  """A manager whose agents are real ChatAgents talking to the stand-in at `base_url`."""
+  client = OpenAIResponsesClient(model_id="stand-in", api_key="unused", base_url=base_url)
+  manager, _ = make_manager(chat_agent(client), speculation_top_k=0)
+  return manager
+
+
+# ==================== Replay Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_agent_streams_replayed_turn_and_plays_synthesized_move():
+  async with StubLLMServer() as server:
+    manager = _manager(server.base_url)
+    await manager.handle_connect("sid-1", {})
+
+    await manager.handle_user_move("sid-1", {"position": 0})
+
+    board = manager.game_sessions["sid-1"].game.get_board()
+    events = [event for event, _ in manager.sio.events_for("sid-1")]
+  assert board[4] == Player.X  # The only move that doesn't lose to a corner opening
+  assert board.count(Player.X) == 1
+  assert server.requests == 2  # The move, then the reply to the tool's result
+  assert "AGENT_REASONING_CHUNK" in events
+  assert "AGENT_STREAM_TOKEN" in events
+
+
+@pytest.mark.asyncio
+async def test_request_without_move_tool_streams_text_only():
+  async with StubLLMServer() as server:
+    client = OpenAIResponsesClient(model_id="stand-in", api_key="unused", base_url=server.base_url)
+
+    response = await client.get_response("Who won?")
+
+  assert "Berlin" in response.text
+  assert not [
+    content
+    for message in response.messages
+    for content in message.contents
+    if content.type == "function_call"
+  ]
+
+
+def test_board_is_parsed_from_either_prompt_format():
+  game = TicTacToe()
+  game.take_O_move(4)
+  game.take_X_move(0)
+
+  for board_format in ("compact", "box"):
+    prompt = f"Board:\n{render_board(game, board_format)}\nYour turn!"
+    assert parse_board(prompt) == game.get_board()
+  assert parse_board("How did I do?") is None
+
+
+# ==================== Fault Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_error_rate_answers_server_errors():
+  async with StubLLMServer(error_rate=1.0) as server:
+    client = AsyncOpenAI(base_url=server.base_url, api_key="unused", max_retries=0)
+
+    with pytest.raises(InternalServerError):
+      await client.responses.create(model="stand-in", input="Hi", stream=True)
+    await client.close()
+
+  assert server.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_stalls_pause_the_stream():
+  async with StubLLMServer(stall_rate=1.0, stall_seconds=0.2) as server:
+    client = AsyncOpenAI(base_url=server.base_url, api_key="unused")
+    started = time.perf_counter()
+
+    stream = await client.responses.create(model="stand-in", input="Hi", stream=True)
+    events = [event.type async for event in stream]
+    await client.close()
+
+  assert time.perf_counter() - started >= 0.2
+  assert events[0] == "response.created"
+  assert events[-1] == "response.completed"
+
+
+# ==================== Recorder Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_recorder_writes_turns_that_replay(tmp_path):
+  path = tmp_path / "recorded.py"
+  async with StubLLMServer(token_delay=0.001) as upstream:
+    async with StubLLMServer(upstream=upstream.base_url, record=str(path)) as recorder:
+      manager = _manager(recorder.base_url)
+      await manager.handle_connect("sid-1", {})
+      await manager.handle_user_move("sid-1", {"position": 0})
+
+  fixture = load_fixture(str(path))
+  (turn,) = fixture["turns"]
+  assert ("call", "agent_make_move", '{"position": 4}') in turn
+  assert turn[0] == ("reasoning", "Okay")
+  assert fixture["token_delay"] > 0
+
+  async with StubLLMServer(turns=fixture["turns"]) as server:
+    manager = _manager(server.base_url)
+    await manager.handle_connect("sid-1", {})
+    await manager.handle_user_move("sid-1", {"position": 0})
+
+    assert manager.game_sessions["sid-1"].game.get_board().count(Player.X) == 1
@@ -0,0 +1,77 @@
+from functools import partial
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from src.tic_tac_toe.manager import TicTacToeManager
+from tests.fixtures.agent_stub import ScriptedAgent
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.message_stream_01 import streaming_response
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+  return InMemorySpanExporter()
+
+
+def _manager(exporter: InMemorySpanExporter) -> TicTacToeManager:
+  manager, _ = make_manager(partial(ScriptedAgent, stream=streaming_response), speculation_top_k=0)
+  provider = TracerProvider()
+  provider.add_span_processor(SimpleSpanProcessor(exporter))
+  manager.tracer = provider.get_tracer("test")
+  return manager
+
+
+def _tree(spans) -> dict[str, list[str]]:
+  """Span names under each span name (in start order)."""
+  names = {span.context.span_id: span.name for span in spans}
+  tree: dict[str, list[str]] = {}
+  for span in sorted(spans, key=lambda span: span.start_time):
+    parent = names.get(span.parent.span_id) if span.parent else None
+    tree.setdefault(parent, []).append(span.name)
+  return tree
+
+
+# ==================== Move Trace Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_move_is_traced_from_validation_to_the_agents_tool_call(exporter):
+  manager = _manager(exporter)
+  await manager.handle_connect("sid-1", {})
+
+  await manager.handle_user_move("sid-1", {"position": 0})
+  await manager.handle_user_move("sid-1", {"position": 4})
+
+  spans = exporter.get_finished_spans()
+  roots = [span for span in spans if span.parent is None]
+  assert [
+    (span.name, span.attributes["session.id"], span.attributes["turn"]) for span in roots
+  ] == [
+    ("user_move", "sid-1", 1),
+    ("user_move", "sid-1", 2),
+  ]
+  first_turn = [span for span in spans if span.context.trace_id == roots[0].context.trace_id]
+  tree = _tree(first_turn)
+  assert tree[None] == ["user_move"]
+  assert tree["user_move"] == ["validate", "emit", "agent_turn"]
+  assert tree["agent_turn"] == ["agent.run_stream"]
+  assert "tool.agent_make_move" in tree["agent.run_stream"]
+  assert {"llm.reasoning", "llm.text"} <= set(tree["agent.run_stream"])
+  assert tree["tool.agent_make_move"] == ["emit"]
+  run_stream = next(span for span in first_turn if span.name == "agent.run_stream")
+  assert [event.name for event in run_stream.events] == ["first_update"]
+
+
+@pytest.mark.asyncio
+async def test_rejected_move_is_traced_without_an_agent_turn(exporter):
+  manager = _manager(exporter)
+  await manager.handle_connect("sid-1", {})
+  await manager.handle_user_move("sid-1", {"position": 0})
+  exporter.clear()
+
+  await manager.handle_user_move("sid-1", {"position": 0})  # Taken
+
+  assert _tree(exporter.get_finished_spans()) == {None: ["user_move"], "user_move": ["validate"]}
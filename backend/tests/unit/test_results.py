@@ -0,0 +1,48 @@
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import (
+  BoardUpdateResult,
+  GameLogRecord,
+  GameStatus,
+  MoveRecord,
+  MoveResult,
+  Player,
+)
+
+
+def _result() -> MoveResult:
+  game = TicTacToe()
+  game.take_O_move(4)
+  return game.take_X_move(0)
+
+
+def test_to_json_matches_pydantic_dump():
+  result = _result()
+
+  assert result.to_json() == result.to_model().model_dump(mode="json")
+  assert result.to_json()["board_state"][:5] == ["X", None, None, None, "O"]
+  assert result.to_json()["status"] == "ongoing"
+
+
+def test_to_json_is_built_once():
+  result = _result()
+
+  assert result.to_json() is result.to_json()
+
+
+def test_result_equals_pydantic_model():
+  result = _result()
+
+  assert result == result.to_model()
+  assert result.to_model() == result
+  assert result != BoardUpdateResult(
+    success=False, message=result.message, board_state=result.board_state, status=result.status
+  )
+  assert result == MoveResult(result.success, result.message, result.board_state, result.status)
+
+
+def test_move_record_converts_to_log_model():
+  record = MoveRecord(3, Player.X, 8, True)
+
+  assert record.to_model() == GameLogRecord(turn=3, player=Player.X, position=8, success=True)
+  assert not hasattr(record, "__dict__")
+  assert not hasattr(MoveResult(True, "", [None] * 9, GameStatus.ONGOING), "__dict__")
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from agent_framework import AgentThread, ChatMessage
+from socketio import AsyncRedisManager, AsyncServer
+
+from src.tic_tac_toe.game import TicTacToe
+from src.tic_tac_toe.models import Player
+from src.tic_tac_toe.store import (
+  InMemorySessionStore,
+  RedisSessionStore,
+  create_session_store,
+  decode_session,
+  encode_session,
+)
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.redis_stub import StubRedisServer
+
+# ==================== Codec Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_session_codec_round_trip():
+  game = TicTacToe()
+  game.take_O_move(4)
+  game.take_O_move(0)  # Rejected (not O's turn) but still logged
+  game.take_X_move(0)
+  thread = AgentThread()
+  await thread.on_new_messages(
+    [ChatMessage(role="user", text="Your turn!"), ChatMessage(role="assistant", text="Done.")]
+  )
+
+  game_state, restored_thread = await decode_session(await encode_session(game, thread))
+  restored = TicTacToe()
+  restored.load_state(game_state)
+
+  assert restored.get_board() == game.get_board()
+  assert restored.game_log == game.game_log
+  assert (restored.turn, restored.current_player) == (3, Player.O)
+  messages = await restored_thread.message_store.list_messages()
+  assert [message.text for message in messages] == ["Your turn!", "Done."]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_skips_blob_for_known_version():
+  store = InMemorySessionStore()
+
+  assert await store.load("sid-1") is None
+  assert await store.save("sid-1", b"first") == 1
+  assert await store.save("sid-1", b"second") == 2
+  assert await store.load("sid-1") == (2, b"second")
+  assert await store.load("sid-1", known_version=2) == (2, None)
+
+  await store.delete("sid-1")
+  assert len(store) == 0
+
+
+def test_create_session_store_by_url():
+  assert create_session_store(None) is None
+  assert isinstance(create_session_store("memory://"), InMemorySessionStore)
+  assert isinstance(create_session_store("redis://localhost:6379/0"), RedisSessionStore)
+  with pytest.raises(ValueError):
+    create_session_store("postgres://localhost")
+
+
+# ==================== Redis Store Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_redis_store_versions_and_expiry():
+  async with StubRedisServer() as server:
+    store = RedisSessionStore(server.url, ttl=60)
+
+    assert await store.load("sid-1") is None
+    assert await store.save("sid-1", b"first") == 1
+    assert await store.save("sid-1", b"second") == 2
+    assert await store.load("sid-1") == (2, b"second")
+    assert server.expiries[b"tictactoe:session:sid-1"] == 60
+
+    server.commands.clear()
+    assert await store.load("sid-1", known_version=2) == (2, None)
+    assert server.commands == ["HGET"]  # Up-to-date check never transfers the blob
+
+    await store.delete("sid-1")
+    assert await store.load("sid-1", known_version=2) is None
+    await store.aclose()
+
+
+# ==================== Multi-Worker Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_workers_share_sessions_through_store():
+  async with StubRedisServer() as server:
+    store = RedisSessionStore(server.url)
+    worker_a, _ = make_manager(session_store=store)
+    worker_b, sio_b = make_manager(session_store=store)
+
+    await worker_a.handle_connect("sid-1", {})
+    await worker_a.handle_user_move("sid-1", {"position": 4})  # O at 4, agent X at 0
+    await worker_b.handle_user_move("sid-1", {"position": 8})  # O at 8, agent X at 1
+    await worker_a.handle_user_move("sid-1", {"position": 2})  # Worker A must see B's moves
+
+    board = worker_a.game_sessions["sid-1"].game.get_board()
+    assert board == [Player.X, Player.X, Player.O, Player.X, Player.O, None, None, None, Player.O]
+    assert {"v": 5, "pos": 1, "mark": "X", "status": "ongoing"} in [
+      data for event, data in sio_b.events_for("sid-1") if event == "BOARD_DELTA"
+    ]
+    thread = worker_a.game_sessions["sid-1"].thread
+    assert len(await thread.message_store.list_messages()) == 6
+
+    await worker_a.handle_disconnect("sid-1")
+    assert await store.load("sid-1") is None
+    await store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_emit_reaches_client_connected_to_other_worker():
+  async with StubRedisServer() as server:
+    sender = AsyncServer(async_mode="asgi", client_manager=AsyncRedisManager(server.url))
+    receiver = AsyncServer(async_mode="asgi", client_manager=AsyncRedisManager(server.url))
+    delivered = []
+
+    async def send_eio_packet(eio_sid, packet):
+      delivered.append((eio_sid, packet.data))
+
+    receiver._send_eio_packet = send_eio_packet
+    receiver.manager.initialize()  # Starts the pub/sub listener
+    sid = await receiver.manager.connect("eio-1", "/")
+    while "SUBSCRIBE" not in server.commands:
+      await asyncio.sleep(0.01)
+
+    await sender.emit("GAME_OVER_RESULT", "Tie", to=sid)
+    for _ in range(100):
+      if delivered:
+        break
+      await asyncio.sleep(0.01)
+
+    assert delivered == [("eio-1", '2["GAME_OVER_RESULT","Tie"]')]
+    receiver.manager.thread.cancel()
+    await asyncio.gather(receiver.manager.thread, return_exceptions=True)
+    await sender.manager.redis.aclose()
+    await receiver.manager.redis.aclose()
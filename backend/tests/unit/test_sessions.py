@@ -0,0 +1,137 @@
+import asyncio
+import gc
+
+import pytest
+
+from src.tic_tac_toe.manager import TicTacToeManager
+from src.tic_tac_toe.sessions import SessionRegistry
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.socket_stub import FakeAsyncServer
+
+
+class FakeClock:
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+def _registry(**kwargs) -> tuple[SessionRegistry, list, FakeClock]:
+  evicted = []
+  clock = FakeClock()
+  registry = SessionRegistry(
+    on_evict=lambda sid, session, reason: evicted.append((sid, reason)), clock=clock, **kwargs
+  )
+  return registry, evicted, clock
+
+
+# ==================== Registry Tests ====================
+
+
+def test_pop_reports_disconnect_eviction():
+  registry, evicted, _ = _registry()
+  registry["a"] = "session-a"
+
+  assert registry.pop("a") == "session-a"
+  assert registry.pop("a") is None
+  assert evicted == [("a", "disconnect")]
+  assert len(registry) == 0
+
+
+def test_lru_eviction_when_over_capacity():
+  registry, evicted, _ = _registry(max_sessions=2)
+  registry["a"] = "session-a"
+  registry["b"] = "session-b"
+  registry.get("a")  # "b" is now the least recently used
+  registry["c"] = "session-c"
+
+  assert evicted == [("b", "lru")]
+  assert list(registry) == ["a", "c"]
+  assert registry.live_gauge.value == 2
+
+
+def test_sweep_evicts_only_idle_sessions():
+  registry, evicted, clock = _registry(idle_ttl=10)
+  registry["a"] = "session-a"
+  clock.now = 5
+  registry["b"] = "session-b"
+  clock.now = 12
+  registry.get("a")  # Touching "a" resets its idle timer
+  clock.now = 16
+
+  assert registry.sweep() == 1
+  assert evicted == [("b", "ttl")]
+  assert "a" in registry
+
+
+@pytest.mark.asyncio
+async def test_background_sweeper_evicts_idle_sessions():
+  registry, evicted, clock = _registry(idle_ttl=10)
+  registry["a"] = "session-a"
+  clock.now = 11
+
+  registry.start_sweeper(interval=0.01)
+  await asyncio.sleep(0.05)
+  await registry.stop_sweeper()
+
+  assert evicted == [("a", "ttl")]
+
+
+# ==================== Manager Lifecycle Tests ====================
+
+
+def _manager() -> tuple[TicTacToeManager, FakeAsyncServer]:
+  return make_manager(lambda binding, move_tool: object(), max_idle=4)
+
+
+@pytest.mark.asyncio
+async def test_disconnect_returns_agent_to_pool():
+  manager, _ = _manager()
+  await manager.handle_connect("sid-1", {})
+  pooled = manager.game_sessions["sid-1"].pooled_agent
+
+  await manager.handle_disconnect("sid-1")
+
+  assert "sid-1" not in manager.game_sessions
+  assert manager.agent_pool.idle == 1
+  assert pooled.binding.game is None
+
+
+@pytest.mark.asyncio
+async def test_evicted_session_is_recreated_on_next_event():
+  manager, sio = _manager()
+  manager.game_sessions.max_sessions = 1
+  await manager.handle_connect("sid-1", {})
+  await manager.handle_connect("sid-2", {})
+  assert "sid-1" not in manager.game_sessions
+
+  await manager.handle_game_initialization("sid-1")
+
+  assert "sid-1" in manager.game_sessions
+  assert sio.events_for("sid-1")[-1] == (
+    "BOARD_SNAPSHOT",
+    {"v": 1, "board": [None] * 9, "status": "ongoing"},
+  )
+
+
+@pytest.mark.asyncio
+async def test_soak_connect_disconnect_keeps_memory_flat():
+  manager, sio = _manager()
+
+  async def cycles(count: int) -> None:
+    for i in range(count):
+      await manager.handle_connect(f"sid-{i}", {})
+      await manager.handle_disconnect(f"sid-{i}")
+    sio.emitted.clear()
+
+  await cycles(1_000)  # Warm up pools and caches
+  gc.collect()
+  baseline = len(gc.get_objects())
+
+  await cycles(100_000)
+  gc.collect()
+
+  assert len(manager.game_sessions) == 0
+  assert manager.agent_pool.idle == 1
+  assert len(gc.get_objects()) - baseline < 1_000
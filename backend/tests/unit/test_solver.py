@@ -0,0 +1,99 @@
+from functools import lru_cache
+
+import pytest
+
+from src.tic_tac_toe.models import Player
+from src.tic_tac_toe.solver import SolverTable, board_key
+
+LINES = ((0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6))
+
+
+def _winner(board: tuple) -> Player | None:
+  for a, b, c in LINES:
+    if board[a] is not None and board[a] == board[b] == board[c]:
+      return board[a]
+  return None
+
+
+@lru_cache(maxsize=None)
+def _minimax(board: tuple) -> tuple[int, frozenset]:
+  """Brute-force (value for the player to move, optimal moves) straight off the cell tuple."""
+  mover = Player.O if board.count(Player.O) == board.count(Player.X) else Player.X
+  if _winner(board) is not None:
+    return -1, frozenset()
+  if None not in board:
+    return 0, frozenset()
+  scores = {}
+  for position, cell in enumerate(board):
+    if cell is None:
+      child = board[:position] + (mover,) + board[position + 1 :]
+      scores[position] = -_minimax(child)[0]
+  best = max(scores.values())
+  return best, frozenset(position for position, score in scores.items() if score == best)
+
+
+def _reachable() -> list[tuple]:
+  seen, stack = set(), [(None,) * 9]
+  while stack:
+    board = stack.pop()
+    if board in seen:
+      continue
+    seen.add(board)
+    if _winner(board) is None and None in board:
+      mover = Player.O if board.count(Player.O) == board.count(Player.X) else Player.X
+      stack.extend(
+        board[:position] + (mover,) + board[position + 1 :]
+        for position, cell in enumerate(board)
+        if cell is None
+      )
+  return list(seen)
+
+
+@pytest.fixture(scope="module")
+def table() -> SolverTable:
+  return SolverTable.build()
+
+
+# ==================== Table Tests ====================
+
+
+def test_table_matches_brute_force_minimax(table):
+  positions = _reachable()
+  assert len(positions) == len(table) == 5478
+
+  for board in positions:
+    value, moves = _minimax(board)
+    assert table.value(board) == value
+    assert set(table.best_moves(board)) == moves
+
+
+def test_opening_and_forced_block(table):
+  assert table.value([None] * 9) == 0  # Perfect play is a draw
+  # O threatens the top row; X must block at 2
+  board = [Player.O, Player.O, None, None, Player.X, None, None, None, None]
+  assert table.best_moves(board) == [2]
+
+
+def test_unreachable_board_is_rejected(table):
+  with pytest.raises(ValueError):
+    table.value([Player.X] * 3 + [None] * 6)
+
+
+def test_saved_table_is_memory_mapped(table, tmp_path):
+  path = tmp_path / "solver_table.bin"
+  table.save(path)
+  assert path.stat().st_size < 40_000
+
+  loaded = SolverTable.load(path)
+  board = [Player.O, None, None, None, Player.X, None, None, None, Player.O]
+  assert board_key(board) == 1 + 2 * 81 + 6561
+  assert loaded.best_moves(board) == table.best_moves(board)
+  assert len(loaded) == len(table)
+  loaded.close()
+
+
+def test_load_rejects_other_files(tmp_path):
+  path = tmp_path / "not_a_table.bin"
+  path.write_bytes(b"\0" * 64)
+  with pytest.raises(ValueError):
+    SolverTable.load(path)
@@ -0,0 +1,154 @@
+import asyncio
+from functools import partial
+
+import pytest
+from agent_framework import AgentRunResponseUpdate, TextContent, UsageContent, UsageDetails
+
+from src.tic_tac_toe.manager import TicTacToeManager
+from src.tic_tac_toe.models import Player
+from src.tic_tac_toe.solver import get_solver
+from src.tic_tac_toe.speculation import predict_human_moves
+from tests.fixtures.agent_stub import ScriptedAgent
+from tests.fixtures.manager_stub import make_manager
+from tests.fixtures.socket_stub import FakeAsyncServer
+
+USAGE_UPDATE = AgentRunResponseUpdate(
+  contents=[UsageContent(details=UsageDetails(input_token_count=100, output_token_count=20))]
+).to_dict()
+
+
+class HangingAgent:
+  """Streams one chunk of commentary and then never finishes."""
+
+  def __init__(self, binding, move_tool):
+    self.binding = binding
+
+  async def run_stream(self, thread, messages):
+    yield AgentRunResponseUpdate(contents=[TextContent(text="Thinking...")])
+    await asyncio.sleep(3600)
+
+
+def _manager(agent=None, top_k: int = 3) -> tuple[TicTacToeManager, FakeAsyncServer]:
+  agent = agent or partial(ScriptedAgent, stream=[USAGE_UPDATE])
+  return make_manager(agent, timeout=5, speculation_top_k=top_k)
+
+
+async def _settle() -> None:
+  """Let background speculative runs make progress."""
+  for _ in range(10):
+    await asyncio.sleep(0)
+
+
+async def _thread_texts(manager: TicTacToeManager, sid: str) -> list[str]:
+  store = manager.game_sessions[sid].thread.message_store
+  return [message.text for message in await store.list_messages()] if store else []
+
+
+def _deltas(sio: FakeAsyncServer, sid: str) -> list[tuple[str, int]]:
+  return [
+    (data["mark"], data["pos"]) for event, data in sio.events_for(sid) if event == "BOARD_DELTA"
+  ]
+
+
+# ==================== Prediction Tests ====================
+
+
+def test_predictions_put_optimal_moves_first():
+  solver = get_solver()
+  board = [None] * 9
+  assert predict_human_moves(board, 3, solver) == [4, 0, 2]
+
+  # X on 4 and 2 threatens the 2-4-6 diagonal, so the human should block at 6
+  board[0], board[4], board[8], board[2] = Player.O, Player.X, Player.O, Player.X
+  assert predict_human_moves(board, 2, solver)[0] == 6
+
+
+# ==================== Adoption Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_speculation_runs_on_forks_without_touching_the_session():
+  manager, sio = _manager()
+  await manager.handle_connect("sid-1", {})
+  await _settle()
+
+  game_session = manager.game_sessions["sid-1"]
+  assert sorted(game_session.speculations) == [0, 2, 4]
+  assert all(run.task.done() for run in game_session.speculations.values())
+  assert game_session.game.get_board() == [None] * 9
+  assert await _thread_texts(manager, "sid-1") == []
+  assert _deltas(sio, "sid-1") == []
+
+
+@pytest.mark.asyncio
+async def test_predicted_move_adopts_its_run():
+  manager, sio = _manager()
+  hits = manager.speculation_results["hit"].value
+  wasted = manager.speculation_wasted_tokens.value
+  await manager.handle_connect("sid-1", {})
+  await _settle()
+
+  await manager.handle_user_move("sid-1", {"position": 4})
+
+  game_session = manager.game_sessions["sid-1"]
+  assert manager.speculation_results["hit"].value == hits + 1
+  # The two runs for moves not played each reported 120 tokens
+  assert manager.speculation_wasted_tokens.value == wasted + 240
+  assert _deltas(sio, "sid-1") == [("O", 4), ("X", 0)]
+  assert game_session.game.get_board()[0] == Player.X
+  texts = await _thread_texts(manager, "sid-1")
+  assert texts[0].startswith("The user has placed their marker at position 4.")
+  assert texts[1:] == ["I placed X at position 0."]
+  assert game_session.usage.input_tokens == 100
+  # The next human move is already being speculated on
+  assert game_session.speculations and 4 not in game_session.speculations
+
+
+@pytest.mark.asyncio
+async def test_mispredicted_move_runs_live():
+  manager, sio = _manager(top_k=1)
+  misses = manager.speculation_results["miss"].value
+  await manager.handle_connect("sid-1", {})
+  await _settle()
+
+  await manager.handle_user_move("sid-1", {"position": 8})
+
+  assert manager.speculation_results["miss"].value == misses + 1
+  assert _deltas(sio, "sid-1") == [("O", 8), ("X", 0)]
+  texts = await _thread_texts(manager, "sid-1")
+  assert len(texts) == 2 and "position 8" in texts[0]
+
+
+# ==================== Cancellation Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_reset_cancels_runs_and_returns_their_agents():
+  manager, sio = _manager(HangingAgent)
+  await manager.handle_connect("sid-1", {})
+  await _settle()
+  assert manager.speculative_runs == 3
+  runs = list(manager.game_sessions["sid-1"].speculations.values())
+
+  manager.speculation_top_k = 0
+  await manager.handle_game_initialization("sid-1")
+  await _settle()
+
+  assert all(run.task.cancelled() for run in runs)
+  assert manager.speculative_runs == 0
+  assert manager.agent_pool.idle == 3
+
+
+@pytest.mark.asyncio
+async def test_runs_are_capped_across_sessions():
+  manager, _ = _manager(HangingAgent)
+  manager.speculation_max_runs = 4
+  await manager.handle_connect("sid-1", {})
+  await manager.handle_connect("sid-2", {})
+
+  assert manager.speculative_runs == 4
+  assert len(manager.game_sessions["sid-2"].speculations) == 1
+  await manager.handle_disconnect("sid-1")
+  await manager.handle_disconnect("sid-2")
+  await _settle()
+  assert manager.speculative_runs == 0
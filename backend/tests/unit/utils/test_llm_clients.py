@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from src.utils.llm_clients import LLMClientRegistry
+from tests.fixtures.http_stub import StubHTTPServer
+
+# ==================== Registry Tests ====================
+
+
+def test_same_key_returns_shared_client():
+  registry = LLMClientRegistry()
+  first = registry.get("http://localhost:1234/v1", "model-a", "key")
+  second = registry.get("http://localhost:1234/v1", "model-a", "key")
+
+  assert first is second
+  assert len(registry) == 1
+
+
+def test_models_share_connection_pool_per_endpoint():
+  registry = LLMClientRegistry()
+  model_a = registry.get("http://localhost:1234/v1", "model-a", "key")
+  model_b = registry.get("http://localhost:1234/v1", "model-b", "key")
+  other_key = registry.get("http://localhost:1234/v1", "model-a", "other-key")
+
+  assert model_a is not model_b
+  assert model_a.client is model_b.client
+  assert other_key.client is not model_a.client
+
+
+@pytest.mark.asyncio
+async def test_aclose_forgets_clients():
+  registry = LLMClientRegistry()
+  client = registry.get("http://localhost:1234/v1", "model-a", "key")
+
+  await registry.aclose()
+
+  assert len(registry) == 0
+  assert client.client.is_closed()
+  assert registry.get("http://localhost:1234/v1", "model-a", "key") is not client
+
+
+# ==================== Pooling Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_pooled_connections():
+  # Slow answers keep both requests in flight, so neither can reuse the other's connection
+  async with StubHTTPServer(delay=0.05) as server:
+    registry = LLMClientRegistry(max_keepalive_connections=4)
+    client = registry.get(server.base_url, "model-a", "key")
+
+    assert await registry.warm_up(client, connections=2) == 2
+    await registry.aclose()
+
+  assert server.requests == 2
+  assert server.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_sessions_reuse_keep_alive_connections():
+  async with StubHTTPServer() as server:
+    registry = LLMClientRegistry(max_connections=4, max_keepalive_connections=4)
+
+    async def session() -> None:
+      await registry.get(server.base_url, "model-a", "key").client.models.list()
+
+    for _ in range(5):
+      await asyncio.gather(*(session() for _ in range(10)))
+    await registry.aclose()
+
+  assert server.requests == 50
+  assert server.connections <= 4
+
+
+@pytest.mark.asyncio
+async def test_warm_up_failure_is_ignored():
+  async with StubHTTPServer() as server:
+    base_url = server.base_url
+  registry = LLMClientRegistry()
+  client = registry.get(base_url, "model-a", "key")
+
+  assert await registry.warm_up(client, connections=1) == 0
+  await registry.aclose()
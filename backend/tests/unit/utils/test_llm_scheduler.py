@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from src.utils.llm_scheduler import QUERY, SPECULATIVE, TURN, LLMScheduler
+
+
+async def _queue(scheduler: LLMScheduler, order: list[str], name: str, session: str, **kwargs):
+  """Start a run that records when it is admitted and then holds its slot until cancelled."""
+  positions = []
+
+  async def on_queued(position: int) -> None:
+    positions.append(position)
+
+  async def run() -> None:
+    async with scheduler.slot(session, on_queued=on_queued, **kwargs):
+      order.append(name)
+      await asyncio.sleep(3600)
+
+  task = asyncio.create_task(run())
+  await asyncio.sleep(0)
+  return task, positions
+
+
+async def _finish(tasks) -> None:
+  """Release slots one at a time, so each admission happens in its own step."""
+  for task in tasks:
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+  await asyncio.sleep(0)
+
+
+# ==================== Admission Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_runs_beyond_the_cap_wait_for_a_free_slot():
+  scheduler, order = LLMScheduler(max_concurrency=2), []
+  a, _ = await _queue(scheduler, order, "a", "sid-1")
+  b, _ = await _queue(scheduler, order, "b", "sid-2")
+  c, positions = await _queue(scheduler, order, "c", "sid-3")
+
+  assert order == ["a", "b"]
+  assert positions == [1]
+  assert (scheduler.in_flight, scheduler.waiting) == (2, 1)
+
+  await _finish([a])
+  assert order == ["a", "b", "c"]
+  await _finish([b, c])
+  assert (scheduler.in_flight, scheduler.waiting) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_zero_cap_admits_everything():
+  scheduler, order = LLMScheduler(max_concurrency=0), []
+  tasks = [(await _queue(scheduler, order, str(i), f"sid-{i}"))[0] for i in range(50)]
+
+  assert len(order) == 50
+  await _finish(tasks)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_line():
+  scheduler, order = LLMScheduler(max_concurrency=1), []
+  a, _ = await _queue(scheduler, order, "a", "sid-1")
+  b, _ = await _queue(scheduler, order, "b", "sid-2")
+  c, _ = await _queue(scheduler, order, "c", "sid-3")
+
+  await _finish([b])
+  assert scheduler.waiting == 1
+  await _finish([a])
+
+  assert order == ["a", "c"]
+  await _finish([c])
+  assert scheduler.in_flight == 0
+
+
+# ==================== Fairness Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_live_turns_go_ahead_of_queries_and_speculation():
+  scheduler, order = LLMScheduler(max_concurrency=1), []
+  first, _ = await _queue(scheduler, order, "first", "sid-0")
+  spec, _ = await _queue(scheduler, order, "spec", "sid-1", priority=SPECULATIVE)
+  query, _ = await _queue(scheduler, order, "query", "sid-2", priority=QUERY)
+  turn, positions = await _queue(scheduler, order, "turn", "sid-3", priority=TURN)
+
+  assert positions == [1]
+  await _finish([first, turn, query, spec])
+  assert order == ["first", "turn", "query", "spec"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_take_turns_within_a_class():
+  scheduler, order = LLMScheduler(max_concurrency=1), []
+  first, _ = await _queue(scheduler, order, "first", "sid-0")
+  # A chatty session queues three questions before anyone else asks one
+  tasks = [(await _queue(scheduler, order, f"a{i}", "sid-a", priority=QUERY))[0] for i in range(3)]
+  b, b_positions = await _queue(scheduler, order, "b0", "sid-b", priority=QUERY)
+  c, c_positions = await _queue(scheduler, order, "c0", "sid-c", priority=QUERY)
+
+  assert (b_positions, c_positions) == ([2], [3])
+  await _finish([first, tasks[0], b, c, tasks[1], tasks[2]])
+  assert order == ["first", "a0", "b0", "c0", "a1", "a2"]
+
+
+# ==================== Token Budget Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_token_budget_holds_runs_until_it_refills():
+  scheduler, order = LLMScheduler(max_concurrency=0, tokens_per_minute=6000), []
+  a, _ = await _queue(scheduler, order, "a", "sid-1", estimate=6000)
+  b, _ = await _queue(scheduler, order, "b", "sid-2", estimate=60)
+
+  assert order == ["a"]
+  await asyncio.sleep(0.7)  # 100 tokens/s: 60 tokens take 0.6s
+  assert order == ["a", "b"]
+  await _finish([a, b])
+
+
+@pytest.mark.asyncio
+async def test_actual_usage_refunds_the_estimate():
+  scheduler, order = LLMScheduler(max_concurrency=0, tokens_per_minute=6000), []
+  grant = await scheduler.acquire("sid-1", estimate=6000)
+  b, _ = await _queue(scheduler, order, "b", "sid-2", estimate=3000)
+  assert order == []
+
+  grant.tokens = 1000
+  scheduler.release(grant)
+  await asyncio.sleep(0)
+
+  assert order == ["b"]
+  await _finish([b])
@@ -0,0 +1,140 @@
+import io
+import json
+import logging
+
+import pytest
+
+from src.utils.log import (
+  JsonFormatter,
+  KeyValueFormatter,
+  SessionSampler,
+  configure_logging,
+  parse_levels,
+  shutdown_logging,
+  stream_log,
+  stream_log_enabled,
+)
+
+
+class CountingStr:
+  """Counts how often it is rendered into a message."""
+
+  def __init__(self):
+    self.renders = 0
+
+  def __str__(self) -> str:
+    self.renders += 1
+    return "rendered"
+
+
+@pytest.fixture
+def configured():
+  """Configure logging into a buffer; restore the previous root setup afterwards."""
+  root = logging.getLogger()
+  saved = root.handlers[:], root.level
+  output = io.StringIO()
+
+  def configure(**kwargs) -> io.StringIO:
+    configure_logging(stream=output, **kwargs)
+    return output
+
+  yield configure
+  shutdown_logging()
+  root.handlers, root.level = saved
+  for name in ("src.test", "src.test.quiet", "src.stream"):
+    logging.getLogger(name).setLevel(logging.NOTSET)
+  stream_log.filters = []
+
+
+def _record(**fields) -> logging.LogRecord:
+  record = logging.LogRecord("src.test", logging.INFO, __file__, 1, "Moved to %d", (4,), None)
+  record.__dict__.update(fields)
+  return record
+
+
+# ==================== Formatter Tests ====================
+
+
+def test_key_value_formatter_appends_extra_fields():
+  line = KeyValueFormatter().format(_record(sid="sid-1", reason="idle"))
+
+  assert line.endswith("INFO src.test Moved to 4 sid=sid-1 reason=idle")
+
+
+def test_json_formatter_emits_one_object_with_fields():
+  entry = json.loads(JsonFormatter().format(_record(sid="sid-1")))
+
+  assert entry["message"] == "Moved to 4"
+  assert (entry["level"], entry["logger"], entry["sid"]) == ("INFO", "src.test", "sid-1")
+
+
+def test_parse_levels():
+  assert parse_levels("src.stream=debug, src.tic_tac_toe=WARNING,,bad") == {
+    "src.stream": "DEBUG",
+    "src.tic_tac_toe": "WARNING",
+  }
+
+
+# ==================== Sampling Tests ====================
+
+
+def test_session_sampler_keeps_a_stable_fraction_of_sessions():
+  sampler = SessionSampler(0.25)
+  sids = [f"sid-{i}" for i in range(4000)]
+  kept = {sid for sid in sids if sampler.filter(_record(sid=sid))}
+
+  assert 800 < len(kept) < 1200
+  assert kept == {sid for sid in sids if sampler.sampled(sid)}
+  assert SessionSampler(0).filter(_record()) is True  # Records without a session are kept
+
+
+# ==================== Pipeline Tests ====================
+
+
+def test_records_are_written_by_a_background_thread(configured):
+  output = configured(level="INFO")
+  value = CountingStr()
+
+  logging.getLogger("src.test").info("Value: %s", value, extra={"sid": "sid-1"})
+  shutdown_logging()
+
+  assert output.getvalue().strip().endswith("INFO src.test Value: rendered sid=sid-1")
+  assert value.renders == 1
+
+
+def test_disabled_levels_never_render_their_arguments(configured):
+  output = configured(level="INFO", levels="src.test.quiet=WARNING")
+  value = CountingStr()
+
+  logging.getLogger("src.test").debug("Value: %s", value)
+  logging.getLogger("src.test.quiet").info("Value: %s", value)
+  shutdown_logging()
+
+  assert value.renders == 0
+  assert output.getvalue() == ""
+
+
+def test_stream_logs_are_kept_only_for_sampled_sessions(configured):
+  output = configured(levels="src.stream=DEBUG", stream_sample_rate=0.5)
+  sampler = SessionSampler(0.5)
+  sids = [f"sid-{i}" for i in range(20)]
+
+  for sid in sids:
+    stream_log.debug("Agent stream token", extra={"sid": sid})
+  shutdown_logging()
+
+  logged = [line.rsplit("sid=", 1)[1] for line in output.getvalue().splitlines()]
+  assert 0 < len(logged) < len(sids)
+  assert logged == [sid for sid in sids if sampler.sampled(sid)]
+  assert logged == [sid for sid in sids if stream_log_enabled(sid)]
+
+
+def test_stream_logs_are_off_by_default(configured):
+  configured(level="INFO", stream_sample_rate=1.0)
+
+  assert not stream_log_enabled("sid-1")
+
+
+def test_unknown_format_is_rejected():
+  with pytest.raises(ValueError, match="Unknown log format"):
+    configure_logging(fmt="xml")
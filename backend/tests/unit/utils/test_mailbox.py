@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+
+from src.utils.mailbox import Mailbox
+
+
+class Recorder:
+  """Handler calls that log when they start and finish, taking `delay` seconds each."""
+
+  def __init__(self, delay: float = 0.01):
+    self.delay = delay
+    self.log: list[str] = []
+    self.running = 0
+    self.max_running = 0
+
+  def call(self, name: str):
+    async def handler():
+      self.running += 1
+      self.max_running = max(self.max_running, self.running)
+      self.log.append(f"start {name}")
+      try:
+        await asyncio.sleep(self.delay)
+      finally:
+        self.running -= 1
+      self.log.append(f"end {name}")
+
+    return handler
+
+
+# ==================== Ordering Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_calls_run_one_at_a_time_in_order():
+  mailbox, recorder = Mailbox("sid-1"), Recorder()
+
+  envelopes = [mailbox.post("E", recorder.call(name)) for name in "abc"]
+  await asyncio.gather(*(envelope.done for envelope in envelopes))
+
+  assert recorder.log == ["start a", "end a", "start b", "end b", "start c", "end c"]
+  assert recorder.max_running == 1
+  await mailbox.aclose()
+
+
+@pytest.mark.asyncio
+async def test_mailboxes_run_concurrently_with_each_other():
+  recorder = Recorder()
+  mailboxes = [Mailbox(f"sid-{i}") for i in range(3)]
+
+  envelopes = [mailbox.post("E", recorder.call(mailbox.name)) for mailbox in mailboxes]
+  await asyncio.gather(*(envelope.done for envelope in envelopes))
+
+  assert recorder.max_running == 3
+  for mailbox in mailboxes:
+    await mailbox.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failing_call_does_not_stop_the_worker():
+  mailbox, recorder = Mailbox("sid-1"), Recorder()
+
+  async def fail():
+    raise RuntimeError("boom")
+
+  mailbox.post("E", fail)
+  await mailbox.post("E", recorder.call("after")).done
+
+  assert recorder.log == ["start after", "end after"]
+  await mailbox.aclose()
+
+
+# ==================== Backpressure Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_post_refuses_calls_when_full():
+  mailbox, recorder = Mailbox("sid-1", maxsize=2), Recorder()
+  depth = mailbox.depth_gauge.value
+
+  first = mailbox.post("E", recorder.call("a"))
+  await asyncio.sleep(0)  # "a" is now in flight, not queued
+  assert mailbox.post("E", recorder.call("b")) is not None
+  assert mailbox.post("E", recorder.call("c")) is not None
+  assert mailbox.post("E", recorder.call("d")) is None
+  assert mailbox.depth == 2
+  assert mailbox.depth_gauge.value == depth + 2
+
+  await first.done
+  await mailbox.aclose()
+  assert mailbox.depth_gauge.value == depth
+
+
+@pytest.mark.asyncio
+async def test_drop_and_interrupt():
+  mailbox, recorder = Mailbox("sid-1"), Recorder(delay=3600)
+  mailbox.post("MOVE", recorder.call("move"))
+  await asyncio.sleep(0.001)
+  queued = mailbox.post("MOVE", recorder.call("queued move"))
+  recorder.delay = 0
+
+  assert mailbox.drop(["MOVE"]) == 1
+  assert queued.done.done()
+  assert mailbox.interrupt(["RESET"]) is False
+  assert mailbox.interrupt(["MOVE"]) is True
+  await mailbox.post("RESET", recorder.call("reset")).done
+
+  assert recorder.log == ["start move", "start reset", "end reset"]
+  await mailbox.aclose()
+
+
+@pytest.mark.asyncio
+async def test_replaced_call_waits_from_when_it_was_replaced():
+  mailbox, recorder = Mailbox("sid-1"), Recorder(delay=3600)
+  mailbox.post("QUERY", recorder.call("answer"))
+  await asyncio.sleep(0.001)
+  queued = mailbox.post("QUERY", recorder.call("first"))
+  posted_at = queued.enqueued_at
+
+  mailbox.replace(queued, recorder.call("second"))
+
+  assert mailbox.queued("QUERY") == [queued]
+  assert queued.enqueued_at > posted_at
+  await mailbox.aclose()
+
+
+@pytest.mark.asyncio
+async def test_close_returns_the_cancelled_tasks():
+  mailbox, recorder = Mailbox("sid-1"), Recorder(delay=3600)
+  mailbox.post("MOVE", recorder.call("move"))
+  await asyncio.sleep(0.001)
+
+  tasks = mailbox.close()
+  await asyncio.gather(*tasks, return_exceptions=True)
+
+  assert len(tasks) == 2
+  assert all(task.cancelled() for task in tasks)
+  assert recorder.running == 0
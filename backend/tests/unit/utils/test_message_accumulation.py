@@ -0,0 +1,130 @@
+import json
+
+import pytest
+from agent_framework import AgentRunResponseUpdate
+
+from src.utils.message_accumulator import MessageAccumulator, handle_update_message
+from tests.fixtures.message_stream_01 import non_streaming_response, streaming_response
+
+
+async def _stream(updates):
+  for update in updates:
+    yield update
+
+
+async def _collect(updates) -> list[dict]:
+  return [message async for message in handle_update_message(_stream(updates))]
+
+
+def _expected_assistant_contents() -> list[dict]:
+  """Reasoning, text and function-call contents of the recorded non-streaming response."""
+  expected = []
+  for message in non_streaming_response["messages"]:
+    for content in message["contents"]:
+      if content["type"] == "function_call":
+        expected.append({**content, "arguments": json.loads(content["arguments"])})
+      elif content["type"] in ("text", "text_reasoning"):
+        expected.append(content)
+  return expected
+
+
+# ==================== Fixture Stream Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_fixture_stream_matches_non_streaming_response():
+  messages = await _collect(streaming_response)
+  assistant = [m for m in messages if m["type"] != "function_result"]
+
+  assert assistant == _expected_assistant_contents()
+
+
+@pytest.mark.asyncio
+async def test_fixture_summary_chunks_are_not_duplicated():
+  messages = await _collect(streaming_response)
+  reasoning = [m["text"] for m in messages if m["type"] == "text_reasoning"]
+
+  assert reasoning == [
+    "Okay, the user wants to know the weather in two cities: Berlin and Paris.",
+    "Now, I need to get the weather for Paris as well.",
+    "Okay, I have the weather information for both cities now.",
+  ]
+
+
+@pytest.mark.asyncio
+async def test_fixture_stream_order_and_function_results():
+  messages = await _collect(streaming_response)
+
+  assert [m["type"] for m in messages] == [
+    "text_reasoning",
+    "function_call",
+    "text_reasoning",
+    "function_call",
+    "function_result",
+    "function_result",
+    "text_reasoning",
+    "text",
+  ]
+
+
+@pytest.mark.asyncio
+async def test_accepts_update_objects():
+  updates = [AgentRunResponseUpdate.from_dict(data) for data in streaming_response]
+  assert await _collect(updates) == await _collect(streaming_response)
+
+
+# ==================== Function Call Tests ====================
+
+
+def test_interleaved_function_calls_grouped_by_id():
+  accumulator = MessageAccumulator()
+  chunks = [
+    {"type": "function_call", "call_id": "a", "name": "agent_make_move", "arguments": '{"pos'},
+    {"type": "function_call", "call_id": "b", "name": "get_board_string", "arguments": "{"},
+    {"type": "function_call", "call_id": "a", "arguments": 'ition": 4}'},
+    {"type": "function_call", "call_id": "b", "arguments": "}"},
+  ]
+  for chunk in chunks:
+    assert accumulator.feed(chunk) == []
+
+  calls = accumulator.finish()
+  assert [(c["call_id"], c["name"], c["arguments"]) for c in calls] == [
+    ("a", "agent_make_move", {"position": 4}),
+    ("b", "get_board_string", {}),
+  ]
+
+
+def test_function_call_chunks_matched_by_fc_id():
+  accumulator = MessageAccumulator()
+  accumulator.feed({"type": "function_call", "fc_id": "fc_1", "name": "agent_make_move"})
+  accumulator.feed({"type": "function_call", "call_id": "c1", "fc_id": "fc_1", "arguments": "{}"})
+
+  (call,) = accumulator.finish()
+  assert call["call_id"] == "c1"
+  assert call["arguments"] == {}
+
+
+def test_malformed_arguments_are_left_raw():
+  accumulator = MessageAccumulator()
+  accumulator.feed({"type": "function_call", "call_id": "c1", "arguments": '{"position": '})
+
+  (call,) = accumulator.finish()
+  assert call["arguments"] == '{"position": '
+
+
+# ==================== Text Tests ====================
+
+
+def test_type_change_closes_text_block():
+  accumulator = MessageAccumulator()
+  accumulator.feed({"type": "text_reasoning", "text": "Hmm"})
+  completed = accumulator.feed({"type": "text", "text": "Ha!"})
+
+  assert completed == [{"type": "text_reasoning", "text": "Hmm"}]
+  assert accumulator.finish() == [{"type": "text", "text": "Ha!"}]
+
+
+def test_empty_text_block_is_not_emitted():
+  accumulator = MessageAccumulator()
+  accumulator.feed({"type": "text", "text": ""})
+  assert accumulator.finish() == []
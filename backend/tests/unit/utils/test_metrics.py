@@ -0,0 +1,35 @@
+from src.utils.metrics import MetricsRegistry, render_prometheus
+
+# ==================== Exposition Tests ====================
+
+
+def test_render_prometheus_counters_and_gauges():
+  registry = MetricsRegistry()
+  registry.counter("events_total", "Events", {"event": "USER_MOVE"}).inc(3)
+  registry.counter("events_total", "Events", {"event": 'say "hi"'}).inc()
+  registry.gauge("connections", "Connected clients").set(2)
+
+  assert render_prometheus(registry).splitlines() == [
+    "# HELP connections Connected clients",
+    "# TYPE connections gauge",
+    "connections 2",
+    "# HELP events_total Events",
+    "# TYPE events_total counter",
+    'events_total{event="USER_MOVE"} 3',
+    'events_total{event="say \\"hi\\""} 1',
+  ]
+
+
+def test_render_prometheus_histograms_have_cumulative_buckets():
+  registry = MetricsRegistry()
+  histogram = registry.histogram("move_seconds", "Move time", {"phase": "total"}, (0.1, 1))
+  for value in (0.05, 0.5, 0.7, 5):
+    histogram.observe(value)
+
+  assert render_prometheus(registry).splitlines()[2:] == [
+    'move_seconds_bucket{phase="total",le="0.1"} 1',
+    'move_seconds_bucket{phase="total",le="1"} 3',
+    'move_seconds_bucket{phase="total",le="+Inf"} 4',
+    'move_seconds_sum{phase="total"} 6.25',
+    'move_seconds_count{phase="total"} 4',
+  ]
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from src.utils.outbound import OutboundChannel
+
+
+class Client:
+  """A client whose transport holds `depth` unsent packets until `drain()` is called."""
+
+  def __init__(self, depth: int = 0):
+    self.depth = depth
+    self.received: list[tuple[str, object]] = []
+    self.disconnected = False
+
+  async def emit(self, event: str, payload) -> None:
+    self.received.append((event, payload))
+
+  async def disconnect(self) -> None:
+    self.disconnected = True
+
+  def channel(self, **kwargs) -> OutboundChannel:
+    kwargs.setdefault("max_transport_packets", 4)
+    kwargs.setdefault("poll_interval", 0.001)
+    return OutboundChannel("sid-1", self.emit, lambda: self.depth, self.disconnect, **kwargs)
+
+
+def _token(text: str) -> dict:
+  return {"contents": [{"type": "text", "text": text}], "role": "assistant"}
+
+
+def _reasoning(text: str) -> dict:
+  return {"contents": [{"type": "text_reasoning", "text": text}]}
+
+
+# ==================== Pass-through Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_events_go_straight_out_while_the_client_keeps_up():
+  client = Client()
+  channel = client.channel()
+
+  await channel.send("AGENT_STREAM_TOKEN", _token("Hi"))
+  await channel.send("BOARD_DELTA", {"pos": 0})
+
+  assert client.received == [("AGENT_STREAM_TOKEN", _token("Hi")), ("BOARD_DELTA", {"pos": 0})]
+  assert channel.buffered == 0
+
+
+# ==================== Buffering Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_backed_up_client_gets_merged_chunks_in_order_once_it_drains():
+  client = Client(depth=4)
+  channel = client.channel()
+
+  for text in ("Let ", "me ", "see"):
+    await channel.send("AGENT_STREAM_TOKEN", _token(text))
+  await channel.send("BOARD_DELTA", {"pos": 0})
+  await channel.send("AGENT_STREAM_TOKEN", _token("!"))
+  assert client.received == []
+  assert channel.buffered == 3
+
+  client.depth = 0
+  await asyncio.sleep(0.01)
+
+  assert client.received == [
+    ("AGENT_STREAM_TOKEN", _token("Let me see")),
+    ("BOARD_DELTA", {"pos": 0}),
+    ("AGENT_STREAM_TOKEN", _token("!")),
+  ]
+  assert (channel.buffered, channel.buffered_bytes) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_over_budget_sheds_reasoning_then_tokens_but_never_board_events():
+  client = Client(depth=4)
+  channel = client.channel(max_messages=3)
+
+  await channel.send("AGENT_REASONING_CHUNK", _reasoning("hmm"))
+  await channel.send("BOARD_DELTA", {"pos": 4})
+  await channel.send("AGENT_STREAM_TOKEN", _token("Nice"))
+  await channel.send("GAME_OVER_RESULT", "AI wins")  # Sheds the reasoning chunk
+  await channel.send("BOARD_SNAPSHOT", {"board": []})  # Sheds the token
+
+  client.depth = 0
+  await asyncio.sleep(0.01)
+
+  assert [event for event, _ in client.received] == [
+    "BOARD_DELTA",
+    "GAME_OVER_RESULT",
+    "BOARD_SNAPSHOT",
+  ]
+  assert not client.disconnected
+
+
+# ==================== Slow Consumer Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_client_that_cannot_take_its_board_events_is_disconnected():
+  client = Client(depth=4)
+  channel = client.channel(max_messages=2)
+
+  for position in range(3):
+    await channel.send("BOARD_DELTA", {"pos": position})
+  await asyncio.sleep(0)  # The disconnect runs in its own task
+
+  assert client.disconnected
+  assert channel.closed and channel.buffered == 0
+  await channel.send("BOARD_DELTA", {"pos": 3})
+  assert client.received == []
+
+
+@pytest.mark.asyncio
+async def test_stalled_client_is_disconnected():
+  client = Client(depth=4)
+  channel = client.channel(stall_seconds=0.02)
+
+  await channel.send("BOARD_DELTA", {"pos": 0})
+  await asyncio.sleep(0.05)
+
+  assert client.disconnected
+  assert client.received == []
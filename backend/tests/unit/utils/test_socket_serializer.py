@@ -0,0 +1,125 @@
+import pytest
+from socketio import AsyncServer
+
+from src.utils.socket_serializer import (
+  NegotiatedPacket,
+  NegotiatingAsyncServer,
+  create_socket_server,
+)
+
+msgpack = pytest.importorskip("msgpack")  # The optional 'msgpack' dependency group
+
+
+class FakeEngineIO:
+  """Records what the Socket.IO server hands to Engine.IO, per Engine.IO sid."""
+
+  def __init__(self):
+    self.sent: dict[str, list] = {}
+    self._ids = 0
+
+  def generate_id(self) -> str:
+    self._ids += 1
+    return f"sid-{self._ids}"
+
+  async def send(self, eio_sid: str, data) -> None:
+    self.sent.setdefault(eio_sid, []).append(data)
+
+  async def send_packet(self, eio_sid: str, pkt) -> None:
+    self.sent.setdefault(eio_sid, []).append(pkt.data)
+
+
+async def _server() -> tuple[NegotiatingAsyncServer, FakeEngineIO, list]:
+  """Server with a msgpack client (eio sid "bin") and a JSON client ("txt"), both connected."""
+  sio = NegotiatingAsyncServer(async_handlers=False)
+  sio.eio = FakeEngineIO()
+  received = []
+
+  async def on_connect(sid, environ):
+    return True
+
+  async def on_move(sid, data):
+    received.append(data)
+
+  sio.on("connect", on_connect)
+  sio.on("USER_MOVE", on_move)
+  await sio._handle_eio_connect(
+    "bin", {"QUERY_STRING": "EIO=4&transport=websocket&serializer=msgpack"}
+  )
+  await sio._handle_eio_connect("txt", {"QUERY_STRING": "EIO=4&transport=websocket"})
+  # Both clients open the namespace in JSON: neither knows yet what the server speaks
+  await sio._handle_eio_message("bin", "0")
+  await sio._handle_eio_message("txt", "0")
+  return sio, sio.eio, received
+
+
+# ==================== Negotiation Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_connect_ack_uses_negotiated_encoding():
+  _, eio, _ = await _server()
+
+  (ack_bin,) = eio.sent["bin"]
+  (ack_txt,) = eio.sent["txt"]
+  assert isinstance(ack_bin, bytes) and msgpack.loads(ack_bin)["type"] == 0
+  assert isinstance(ack_txt, str) and ack_txt.startswith("0{")
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_each_client_in_its_encoding():
+  sio, eio, _ = await _server()
+
+  await sio.emit("BOARD_DELTA", {"v": 2, "pos": 4, "mark": "O", "status": "ongoing"})
+
+  payload = ["BOARD_DELTA", {"v": 2, "pos": 4, "mark": "O", "status": "ongoing"}]
+  assert msgpack.loads(eio.sent["bin"][-1]) == {"type": 2, "data": payload, "nsp": "/"}
+  assert eio.sent["txt"][-1] == '2["BOARD_DELTA",{"v":2,"pos":4,"mark":"O","status":"ongoing"}]'
+
+
+@pytest.mark.asyncio
+async def test_json_encoding_is_built_once_per_broadcast(monkeypatch):
+  sio, eio, _ = await _server()
+  for i in range(3):
+    await sio._handle_eio_connect(f"txt-{i}", {"QUERY_STRING": ""})
+    await sio._handle_eio_message(f"txt-{i}", "0")
+  calls = []
+  encode_json = NegotiatedPacket.encode_json
+  monkeypatch.setattr(
+    NegotiatedPacket, "encode_json", lambda self: calls.append(self) or encode_json(self)
+  )
+
+  await sio.emit("AGENT_STREAM_TOKEN", {"contents": [{"type": "text", "text": "hi"}]})
+
+  assert len(calls) == 1
+  assert eio.sent["txt-2"][-1] == eio.sent["txt"][-1]
+
+
+@pytest.mark.asyncio
+async def test_incoming_events_decode_from_either_encoding():
+  sio, _, received = await _server()
+
+  await sio._handle_eio_message(
+    "bin", msgpack.dumps({"type": 2, "nsp": "/", "data": ["USER_MOVE", {"position": 4}]})
+  )
+  await sio._handle_eio_message("txt", '2["USER_MOVE",{"position":8}]')
+
+  assert received == [{"position": 4}, {"position": 8}]
+
+
+@pytest.mark.asyncio
+async def test_disconnect_forgets_negotiated_client():
+  sio, _, _ = await _server()
+
+  await sio._handle_eio_disconnect("bin", sio.reason.CLIENT_DISCONNECT)
+
+  assert "bin" not in sio.msgpack_clients
+
+
+# ==================== Factory Tests ====================
+
+
+def test_create_socket_server_by_serializer_name():
+  assert type(create_socket_server("json")) is AsyncServer
+  assert type(create_socket_server("msgpack")) is NegotiatingAsyncServer
+  with pytest.raises(ValueError):
+    create_socket_server("protobuf")
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from src.utils.stream_batcher import StreamBatcher
+from tests.fixtures.message_stream_01 import streaming_response
+
+EVENT_BY_TYPE = {
+  "text": "AGENT_STREAM_TOKEN",
+  "text_reasoning": "AGENT_REASONING_CHUNK",
+  "function_call": "AGENT_FUNCTION_CALL",
+  "function_result": "AGENT_FUNCTION_RESULT",
+}
+
+
+class RecordingEmitter:
+  def __init__(self):
+    self.emitted: list[tuple[str, dict]] = []
+
+  async def __call__(self, event: str, payload: dict) -> None:
+    self.emitted.append((event, payload))
+
+
+def _routed_fixture_stream() -> list[tuple[str, dict]]:
+  """Route the recorded updates the same way the manager does (by first content type)."""
+  routed = []
+  for update in streaming_response:
+    contents = update["contents"]
+    event = EVENT_BY_TYPE.get(contents[0]["type"]) if contents else None
+    if event:
+      routed.append((event, update))
+  return routed
+
+
+def _collapse(stream: list[tuple[str, dict]]) -> list[tuple[str, str]]:
+  """Join consecutive same-event texts so batched and unbatched streams can be compared."""
+  collapsed: list[tuple[str, str]] = []
+  for event, payload in stream:
+    texts = "".join(str(content.get("text", content)) for content in payload["contents"])
+    if (
+      collapsed
+      and collapsed[-1][0] == event
+      and event in ("AGENT_STREAM_TOKEN", "AGENT_REASONING_CHUNK")
+    ):
+      collapsed[-1] = (event, collapsed[-1][1] + texts)
+    else:
+      collapsed.append((event, texts))
+  return collapsed
+
+
+# ==================== Ordering / Loss Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_fixture_stream_text_is_not_reordered_or_dropped():
+  emitter = RecordingEmitter()
+  batcher = StreamBatcher(emitter, max_delay_ms=10_000, max_bytes=10_000, max_tokens=10_000)
+  routed = _routed_fixture_stream()
+
+  for event, payload in routed:
+    await batcher.add(event, payload)
+  await batcher.flush()
+
+  assert _collapse(emitter.emitted) == _collapse(routed)
+  assert len(emitter.emitted) < len(routed)
+
+
+@pytest.mark.asyncio
+async def test_type_change_flushes_pending_batch_first():
+  emitter = RecordingEmitter()
+  batcher = StreamBatcher(emitter, max_delay_ms=10_000)
+  await batcher.add("AGENT_STREAM_TOKEN", {"contents": [{"type": "text", "text": "Hello"}]})
+  await batcher.add("AGENT_STREAM_TOKEN", {"contents": [{"type": "text", "text": " there"}]})
+  await batcher.add(
+    "AGENT_FUNCTION_CALL", {"contents": [{"type": "function_call", "arguments": "{}"}]}
+  )
+
+  assert [event for event, _ in emitter.emitted] == ["AGENT_STREAM_TOKEN", "AGENT_FUNCTION_CALL"]
+  assert emitter.emitted[0][1]["contents"] == [{"type": "text", "text": "Hello there"}]
+
+
+@pytest.mark.asyncio
+async def test_batched_payload_keeps_update_shape():
+  emitter = RecordingEmitter()
+  batcher = StreamBatcher(emitter, max_delay_ms=10_000)
+  text_updates = [u for e, u in _routed_fixture_stream() if e == "AGENT_STREAM_TOKEN"]
+  for update in text_updates[:3]:
+    await batcher.add("AGENT_STREAM_TOKEN", update)
+  await batcher.flush()
+
+  payload = emitter.emitted[0][1]
+  assert set(payload) == set(text_updates[0])
+  assert payload["contents"][0]["text"] == "".join(
+    u["contents"][0]["text"] for u in text_updates[:3]
+  )
+  # The original update dicts must not be mutated by merging
+  assert text_updates[0]["contents"][0]["text"] == ""
+
+
+# ==================== Threshold Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_flushes_on_token_threshold():
+  emitter = RecordingEmitter()
+  batcher = StreamBatcher(emitter, max_delay_ms=10_000, max_tokens=3)
+  for word in ["a", "b", "c", "d"]:
+    await batcher.add("AGENT_STREAM_TOKEN", {"contents": [{"type": "text", "text": word}]})
+
+  assert [p["contents"][0]["text"] for _, p in emitter.emitted] == ["abc"]
+  await batcher.flush()
+  assert [p["contents"][0]["text"] for _, p in emitter.emitted] == ["abc", "d"]
+
+
+@pytest.mark.asyncio
+async def test_flushes_on_byte_threshold():
+  emitter = RecordingEmitter()
+  batcher = StreamBatcher(emitter, max_delay_ms=10_000, max_bytes=4)
+  await batcher.add("AGENT_STREAM_TOKEN", {"contents": [{"type": "text", "text": "°F"}]})
+  assert emitter.emitted == []
+  await batcher.add("AGENT_STREAM_TOKEN", {"contents": [{"type": "text", "text": "!"}]})
+  assert [p["contents"][0]["text"] for _, p in emitter.emitted] == ["°F!"]
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_delay_without_more_chunks():
+  emitter = RecordingEmitter()
+  batcher = StreamBatcher(emitter, max_delay_ms=10)
+  await batcher.add(
+    "AGENT_REASONING_CHUNK", {"contents": [{"type": "text_reasoning", "text": "hmm"}]}
+  )
+  assert emitter.emitted == []
+
+  await asyncio.sleep(0.05)
+  assert [p["contents"][0]["text"] for _, p in emitter.emitted] == ["hmm"]
+
+
+@pytest.mark.asyncio
+async def test_zero_delay_disables_batching():
+  emitter = RecordingEmitter()
+  batcher = StreamBatcher(emitter, max_delay_ms=0)
+  for word in ["a", "b"]:
+    await batcher.add("AGENT_STREAM_TOKEN", {"contents": [{"type": "text", "text": word}]})
+
+  assert [p["contents"][0]["text"] for _, p in emitter.emitted] == ["a", "b"]
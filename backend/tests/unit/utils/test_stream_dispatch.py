@@ -0,0 +1,110 @@
+import pytest
+from agent_framework import AgentRunResponseUpdate
+
+from src.utils.stream_dispatch import StreamDispatcher, emit_as_update
+from tests.fixtures.message_stream_01 import streaming_response
+
+
+class RecordingEmitter:
+  def __init__(self):
+    self.emitted: list[tuple[str, dict]] = []
+
+  async def __call__(self, event: str, payload: dict) -> None:
+    self.emitted.append((event, payload))
+
+
+class CountingUpdate:
+  """Stand-in update that counts how often it is serialized."""
+
+  def __init__(self, data: dict):
+    self._data = data
+    self.to_dict_calls = 0
+
+  def to_dict(self) -> dict:
+    self.to_dict_calls += 1
+    return self._data
+
+
+def _dispatcher(emitter: RecordingEmitter) -> StreamDispatcher:
+  return StreamDispatcher(
+    {
+      "text_reasoning": emit_as_update(emitter, "AGENT_REASONING_CHUNK"),
+      "text": emit_as_update(emitter, "AGENT_STREAM_TOKEN"),
+      "function_call": emit_as_update(emitter, "AGENT_FUNCTION_CALL"),
+      "function_result": emit_as_update(emitter, "AGENT_FUNCTION_RESULT"),
+    }
+  )
+
+
+# ==================== Routing Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_each_update_is_serialized_once():
+  emitter = RecordingEmitter()
+  dispatcher = _dispatcher(emitter)
+  updates = [CountingUpdate(data) for data in streaming_response]
+
+  for update in updates:
+    await dispatcher.dispatch(update)
+
+  assert all(update.to_dict_calls == 1 for update in updates)
+
+
+@pytest.mark.asyncio
+async def test_single_content_update_is_passed_through():
+  emitter = RecordingEmitter()
+  dispatcher = _dispatcher(emitter)
+  update = {"contents": [{"type": "text", "text": "Hi"}], "author_name": "agent"}
+
+  returned = await dispatcher.dispatch(update)
+
+  assert returned is update
+  assert emitter.emitted == [("AGENT_STREAM_TOKEN", update)]
+
+
+@pytest.mark.asyncio
+async def test_mixed_content_update_routes_every_item():
+  emitter = RecordingEmitter()
+  dispatcher = _dispatcher(emitter)
+  update = {
+    "contents": [
+      {"type": "text", "text": "Watch this, meat bag."},
+      {"type": "function_call", "call_id": "call_1", "name": "agent_make_move"},
+      {"type": "usage", "details": {}},
+    ],
+    "author_name": "agent",
+  }
+
+  await dispatcher.dispatch(update)
+
+  assert [event for event, _ in emitter.emitted] == ["AGENT_STREAM_TOKEN", "AGENT_FUNCTION_CALL"]
+  assert emitter.emitted[0][1]["contents"] == [update["contents"][0]]
+  assert emitter.emitted[1][1]["contents"] == [update["contents"][1]]
+  assert emitter.emitted[1][1]["author_name"] == "agent"
+
+
+@pytest.mark.asyncio
+async def test_fixture_function_results_are_all_routed():
+  emitter = RecordingEmitter()
+  dispatcher = _dispatcher(emitter)
+
+  for data in streaming_response:
+    await dispatcher.dispatch(AgentRunResponseUpdate.from_dict(data))
+
+  results = [p["contents"][0] for event, p in emitter.emitted if event == "AGENT_FUNCTION_RESULT"]
+  assert [result["call_id"] for result in results] == [
+    "call_918281941300008",
+    "call_918281941300009",
+  ]
+
+
+@pytest.mark.asyncio
+async def test_updates_without_contents_are_ignored():
+  emitter = RecordingEmitter()
+  dispatcher = _dispatcher(emitter)
+
+  await dispatcher.dispatch({"contents": []})
+  await dispatcher.dispatch({"contents": [{"type": "usage", "details": {}}]})
+
+  assert emitter.emitted == []
@@ -0,0 +1,36 @@
+import pytest
+from agent_framework import AgentRunResponseUpdate, UsageContent, UsageDetails
+
+from src.utils.stream_dispatch import StreamDispatcher
+from src.utils.token_usage import CACHED_INPUT_KEY, TokenUsage
+
+
+def _usage_update(input_tokens: int, cached: int, output_tokens: int) -> AgentRunResponseUpdate:
+  details = UsageDetails(input_token_count=input_tokens, output_token_count=output_tokens)
+  if cached:
+    details[CACHED_INPUT_KEY] = cached
+  return AgentRunResponseUpdate(contents=[UsageContent(details=details)])
+
+
+@pytest.mark.asyncio
+async def test_usage_is_summed_over_a_turns_requests():
+  usage = TokenUsage()
+  dispatcher = StreamDispatcher({"usage": usage.handle})
+
+  # The tool call's follow-up request re-sends the context, mostly from the prompt cache
+  await dispatcher.dispatch(_usage_update(900, 0, 40))
+  await dispatcher.dispatch(_usage_update(1000, 896, 25))
+
+  assert (usage.requests, usage.input_tokens, usage.cached_input_tokens) == (2, 1900, 896)
+  assert usage.output_tokens == 65
+  assert usage.report() == "2 requests, 1900 input tokens (896 cached, 47%), 65 output tokens"
+
+
+def test_reset_clears_counts():
+  usage = TokenUsage()
+  usage.add({"input_token_count": 10, "output_token_count": 2})
+
+  usage.reset()
+
+  assert (usage.requests, usage.input_tokens, usage.output_tokens) == (0, 0, 0)
+  assert usage.cached_ratio == 0.0
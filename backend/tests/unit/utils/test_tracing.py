@@ -0,0 +1,118 @@
+import io
+import json
+
+from agent_framework import TextContent, TextReasoningContent, UsageContent, UsageDetails
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased
+
+from src.utils.log import SessionSampler
+from src.utils.tracing import (
+  JsonLinesSpanExporter,
+  SessionTraceSampler,
+  StreamPhases,
+  encode_otlp_json,
+  main,
+  read_spans,
+  render_timeline,
+)
+
+
+def _provider(exporter, sample_rate: float = 1.0) -> TracerProvider:
+  provider = TracerProvider(sampler=ParentBased(SessionTraceSampler(sample_rate)))
+  provider.add_span_processor(SimpleSpanProcessor(exporter))
+  return provider
+
+
+# ==================== Sampling Tests ====================
+
+
+def test_sampler_traces_whole_sessions_like_the_stream_logs():
+  exporter = InMemorySpanExporter()
+  tracer = _provider(exporter, sample_rate=0.5).get_tracer("test")
+  sids = [f"sid-{i}" for i in range(40)]
+
+  for sid in sids:
+    with tracer.start_as_current_span("user_move", attributes={"session.id": sid}):
+      with tracer.start_as_current_span("validate"):
+        pass
+
+  traced = [
+    span.attributes["session.id"] for span in exporter.get_finished_spans() if span.parent is None
+  ]
+  assert 0 < len(traced) < len(sids)
+  assert traced == [sid for sid in sids if SessionSampler(0.5).sampled(sid)]
+  assert len(exporter.get_finished_spans()) == 2 * len(traced)  # Children follow their root
+
+
+# ==================== Stream Phase Tests ====================
+
+
+def test_stream_phases_group_runs_of_same_kind_updates():
+  exporter = InMemorySpanExporter()
+  tracer = _provider(exporter).get_tracer("test")
+  usage = UsageContent(details=UsageDetails(input_token_count=1, output_token_count=1))
+
+  with tracer.start_as_current_span("agent.run_stream") as span:
+    phases = StreamPhases(tracer, span)
+    for contents in (
+      [TextReasoningContent(text="Hmm")],
+      [TextReasoningContent(text="...")],
+      [TextContent(text="Corner!")],
+      [usage],  # Doesn't end the text phase
+      [TextContent(text=" Your move.")],
+    ):
+      phases.update(contents)
+    phases.end()
+
+  spans = {span.name: span for span in exporter.get_finished_spans()}
+  assert spans["llm.reasoning"].attributes["updates"] == 2
+  assert spans["llm.text"].attributes["updates"] == 2
+  assert spans["llm.reasoning"].end_time <= spans["llm.text"].start_time
+  assert spans["llm.text"].parent.span_id == spans["agent.run_stream"].context.span_id
+
+
+# ==================== Export and Timeline Tests ====================
+
+
+def test_otlp_json_uses_hex_ids():
+  exporter = InMemorySpanExporter()
+  tracer = _provider(exporter).get_tracer("test")
+  with tracer.start_as_current_span("user_move") as root:
+    with tracer.start_as_current_span("emit"):
+      pass
+
+  request = encode_otlp_json(exporter.get_finished_spans())
+  spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+  emit = next(span for span in spans if span["name"] == "emit")
+  assert emit["traceId"] == format(root.get_span_context().trace_id, "032x")
+  assert emit["parentSpanId"] == format(root.get_span_context().span_id, "016x")
+
+
+def test_timeline_is_rendered_per_turn_from_an_exported_file(tmp_path):
+  path = tmp_path / "traces.jsonl"
+  tracer = _provider(JsonLinesSpanExporter(str(path))).get_tracer("test")
+  for sid, turn in (("sid-1", 1), ("sid-1", 2), ("sid-2", 1)):
+    with tracer.start_as_current_span("user_move", attributes={"session.id": sid, "turn": turn}):
+      with tracer.start_as_current_span("validate"):
+        pass
+      with tracer.start_as_current_span("agent_turn"):
+        with tracer.start_as_current_span("tool.agent_make_move"):
+          pass
+
+  with open(path) as lines:
+    assert all(json.loads(line)["resourceSpans"] for line in lines)
+  with open(path) as lines:
+    assert render_timeline(read_spans(lines)).count(" turn ") == 3
+
+  output = io.StringIO()
+  main([str(path), "--sid", "sid-1", "--turn", "2"], output=output)
+  timeline = output.getvalue().splitlines()
+  assert timeline[0].startswith("sid-1 turn 2: ")
+  assert [line.split("ms  ")[1].split("|")[0].rstrip() for line in timeline[1:]] == [
+    "user_move",
+    "  validate",
+    "  agent_turn",
+    "    tool.agent_make_move",
+  ]
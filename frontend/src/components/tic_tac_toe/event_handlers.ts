@@ -3,6 +3,34 @@
 import type { Socket } from 'socket.io-client'
 import type { CellValue } from './board'
 
+// Full board, sent on connect, on reset, and in reply to BOARD_SYNC
+export interface BoardSnapshot {
+  v: number
+  board: CellValue[]
+  status: string
+}
+
+// One changed cell; `v` goes up by one for every board change in the session
+export interface BoardDelta {
+  v: number
+  pos: number
+  mark: 'X' | 'O'
+  status: string
+}
+
+// An event the server did not queue: a different move is already waiting, or the queue is full
+export interface Busy {
+  event: string
+  reason: 'move_pending' | 'queue_full'
+  depth: number
+}
+
+// The server is at its LLM capacity: our event's agent run waits at this place in line
+export interface Queued {
+  event: string
+  position: number
+}
+
 export interface TicTacToeEventHandlers {
   setBoard: (board: CellValue[]) => void
   setStatus: (status: string) => void
@@ -12,6 +40,9 @@ export interface TicTacToeEventHandlers {
 
 /**
  * Sets up all socket.io event listeners for the tic-tac-toe game
+ * Board updates are versioned deltas: stale ones are dropped, early ones are held, and a gap
+ * asks the server for a snapshot with BOARD_SYNC. Snapshots are authoritative, since the server's
+ * version starts over whenever it creates the session again (reconnect, eviction, restart).
  * Returns a cleanup function to remove all listeners
  */
 export function setupTicTacToeEventHandlers(
@@ -20,22 +51,76 @@ export function setupTicTacToeEventHandlers(
 ): () => void {
   const { setBoard, setStatus, setGameOver, onError } = handlers
 
-  // Handle board state reset
-  const handleBoardStateReset = (boardState: CellValue[]) => {
-    console.log('📋 Received BOARD_STATE_RESET:', boardState)
-    setBoard(boardState)
+  // Board confirmed by the server, and deltas that arrived ahead of a missing one
+  let version = -1
+  let board: CellValue[] = Array(9).fill(null)
+  const pending = new Map<number, BoardDelta>()
+
+  const requestSync = () => {
+    console.log('🔄 Emitting BOARD_SYNC:', { v: version })
+    socket.emit('BOARD_SYNC', { v: version })
   }
 
-  // Handle board state updates from backend
-  const handleBoardStateUpdated = (boardState: CellValue[]) => {
-    console.log('📋 Received BOARD_STATE_UPDATED:', boardState)
-    setBoard(boardState)
+  const applyDelta = (delta: BoardDelta) => {
+    version = delta.v
+    board = board.map((cell, i) => i === delta.pos ? delta.mark : cell)
+    if (delta.status === 'ongoing') {
+      setStatus(delta.mark === 'O' ? 'AI is thinking...' : 'Your turn!')
+    }
+  }
+
+  // Apply held deltas that are now next in line, dropping any that are stale
+  const drainPending = () => {
+    for (const v of [...pending.keys()].sort((a, b) => a - b)) {
+      if (v <= version) {
+        pending.delete(v)
+      } else if (v === version + 1) {
+        applyDelta(pending.get(v)!)
+        pending.delete(v)
+      }
+    }
+    setBoard(board)
   }
 
-  // Handle user move result confirmation
-  const handleUserMoveResult = (data: { position: number }) => {
-    console.log('✅ Received USER_MOVE_RESULT:', data)
-    // Board state is already updated optimistically, this is just confirmation
+  // A new connection is a new server session whose versions start over
+  const handleConnect = () => {
+    console.log('🔌 Connected, board versions start over')
+    version = -1
+    pending.clear()
+  }
+
+  // Handle full board snapshots (connect, reset, or a BOARD_SYNC reply)
+  const handleBoardSnapshot = (snapshot: BoardSnapshot) => {
+    console.log('📋 Received BOARD_SNAPSHOT:', snapshot)
+    // Always take the server's board, even at a lower version: the session was created again.
+    // Deltas held so far were sent before this snapshot, so it already covers them.
+    pending.clear()
+    version = snapshot.v
+    board = snapshot.board
+    if (snapshot.status === 'ongoing') {
+      setGameOver(false)
+      const marks = board.filter(cell => cell !== null).length
+      setStatus(marks % 2 === 0 ? 'Your turn!' : 'AI is thinking...')
+    }
+    setBoard(board)
+  }
+
+  // Handle single-cell board updates (either player's move)
+  const handleBoardDelta = (delta: BoardDelta) => {
+    console.log('📋 Received BOARD_DELTA:', delta)
+    if (delta.v <= version) {
+      return
+    }
+    if (delta.v > version + 1) {
+      // A delta went missing (or this one overtook it): hold it and ask for a snapshot once
+      if (pending.size === 0) {
+        requestSync()
+      }
+      pending.set(delta.v, delta)
+      return
+    }
+    applyDelta(delta)
+    drainPending()
   }
 
   // Handle game over result
@@ -54,25 +139,6 @@ export function setupTicTacToeEventHandlers(
     }
   }
 
-  // Handle AI tool execution (agent making a move)
-  const handleAiToolExecuted = (data: {
-    message: string
-    board_state: CellValue[]
-    status: string
-  }) => {
-    console.log('🔧 Received AI_TOOL_EXECUTED:', data)
-
-    // Update board with AI's move
-    if (data.board_state) {
-      setBoard(data.board_state)
-    }
-
-    // Update status message
-    if (data.message) {
-      setStatus(data.message)
-    }
-  }
-
   // Handle agent message updates
   const handleAgentMessageUpdate = (data: { type: string, message: string }) => {
     if (data.type === 'text_reasoning') {
@@ -114,6 +180,8 @@ export function setupTicTacToeEventHandlers(
   // Handle errors from backend
   const handleError = (data: { message: string }) => {
     console.error('❌ Received ERROR:', data.message)
+    // Roll back an optimistic move the server rejected
+    setBoard(board)
     if (onError) {
       onError(data.message)
     } else {
@@ -121,12 +189,32 @@ export function setupTicTacToeEventHandlers(
     }
   }
 
+  // Handle backpressure: the server dropped our event, so undo an optimistic move
+  const handleBusy = (data: Busy) => {
+    console.warn('⏳ Received BUSY:', data)
+    if (data.event === 'USER_MOVE') {
+      setBoard(board)
+      setStatus(
+        data.reason === 'move_pending'
+          ? 'Hold on, still playing your last move...'
+          : 'Server busy, try again'
+      )
+    }
+  }
+
+  // Handle admission control: the agent's reply is waiting for LLM capacity
+  const handleQueued = (data: Queued) => {
+    console.log('⏳ Received QUEUED:', data)
+    if (data.event === 'USER_MOVE') {
+      setStatus(`AI is waiting its turn (#${data.position} in line)...`)
+    }
+  }
+
   // Register all event listeners
-  socket.on('BOARD_STATE_RESET', handleBoardStateReset)
-  socket.on('BOARD_STATE_UPDATED', handleBoardStateUpdated)
-  socket.on('USER_MOVE_RESULT', handleUserMoveResult)
+  socket.on('connect', handleConnect)
+  socket.on('BOARD_SNAPSHOT', handleBoardSnapshot)
+  socket.on('BOARD_DELTA', handleBoardDelta)
   socket.on('GAME_OVER_RESULT', handleGameOverResult)
-  socket.on('AI_TOOL_EXECUTED', handleAiToolExecuted)
   socket.on('AGENT_MESSAGE_UPDATE', handleAgentMessageUpdate)
   socket.on('AGENT_REASONING_CHUNK', handleAgentReasoningChunk)
   socket.on('AGENT_STREAM_TOKEN', handleAgentStreamToken)
@@ -134,14 +222,18 @@ export function setupTicTacToeEventHandlers(
   socket.on('AGENT_FUNCTION_RESULT', handleAgentFunctionResult)
   socket.on('AGENT_GAME_OVER', handleAgentGameOver)
   socket.on('ERROR', handleError)
+  socket.on('BUSY', handleBusy)
+  socket.on('QUEUED', handleQueued)
+
+  // The connect-time snapshot may have arrived before these listeners; ask for the current board
+  requestSync()
 
   // Return cleanup function to remove all listeners
   return () => {
-    socket.off('BOARD_STATE_RESET', handleBoardStateReset)
-    socket.off('BOARD_STATE_UPDATED', handleBoardStateUpdated)
-    socket.off('USER_MOVE_RESULT', handleUserMoveResult)
+    socket.off('connect', handleConnect)
+    socket.off('BOARD_SNAPSHOT', handleBoardSnapshot)
+    socket.off('BOARD_DELTA', handleBoardDelta)
     socket.off('GAME_OVER_RESULT', handleGameOverResult)
-    socket.off('AI_TOOL_EXECUTED', handleAiToolExecuted)
     socket.off('AGENT_MESSAGE_UPDATE', handleAgentMessageUpdate)
     socket.off('AGENT_REASONING_CHUNK', handleAgentReasoningChunk)
     socket.off('AGENT_STREAM_TOKEN', handleAgentStreamToken)
@@ -149,5 +241,7 @@ export function setupTicTacToeEventHandlers(
     socket.off('AGENT_FUNCTION_RESULT', handleAgentFunctionResult)
     socket.off('AGENT_GAME_OVER', handleAgentGameOver)
     socket.off('ERROR', handleError)
+    socket.off('BUSY', handleBusy)
+    socket.off('QUEUED', handleQueued)
   }
 }
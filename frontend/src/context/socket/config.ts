@@ -1,3 +1,5 @@
+import { createNegotiatingParser } from './parser'
+
 /**
  * Socket.IO configuration
  */
@@ -6,6 +8,9 @@ export const SOCKET_CONFIG = {
   options: {
     transports: ['websocket', 'polling'] as ('websocket' | 'polling')[],
     autoConnect: false, // We'll connect manually in onMount
+    // Offer binary MessagePack packets; servers that don't enable it keep answering in JSON
+    query: { serializer: 'msgpack' },
+    parser: createNegotiatingParser(),
   },
 } as const
 
@@ -0,0 +1,47 @@
+// frontend/src/context/socket/parser.ts
+
+import { decode, encode } from '@msgpack/msgpack'
+import {
+  Decoder as JSONDecoder,
+  Encoder as JSONEncoder,
+  type Packet,
+  PacketType,
+} from 'socket.io-parser'
+
+/**
+ * Socket.IO parser that negotiates MessagePack with the server.
+ *
+ * The client asks for it in the handshake (`?serializer=msgpack`, see config.ts). It decodes
+ * binary frames as MessagePack and text frames as JSON, and only starts sending MessagePack once
+ * the server acknowledged the connection in MessagePack, so it keeps speaking JSON to servers
+ * that didn't enable it.
+ */
+export function createNegotiatingParser() {
+  // Shared by the manager's encoder and decoder; re-negotiated on every (re)connect
+  const state = { msgpack: false }
+
+  class Encoder extends JSONEncoder {
+    encode(packet: Packet) {
+      return state.msgpack ? [encode(packet)] : super.encode(packet)
+    }
+  }
+
+  class Decoder extends JSONDecoder {
+    add(chunk: unknown) {
+      if (typeof chunk === 'string') {
+        if (chunk[0] === String(PacketType.CONNECT)) {
+          state.msgpack = false
+        }
+        super.add(chunk)
+        return
+      }
+      const packet = decode(chunk as ArrayBuffer | Uint8Array) as Packet
+      if (packet.type === PacketType.CONNECT) {
+        state.msgpack = true
+      }
+      this.emitReserved('decoded', packet)
+    }
+  }
+
+  return { Encoder, Decoder }
+}